@@ -0,0 +1,34 @@
+from django.contrib import admin
+
+from .models import PdfDocument, StoredFile
+
+
+@admin.register(StoredFile)
+class StoredFileAdmin(admin.ModelAdmin):
+    list_display = ("name", "resource_type", "content_type", "size", "created_at")
+    list_filter = ("resource_type", "content_type")
+    search_fields = ("name", "public_id")
+    readonly_fields = [field.name for field in StoredFile._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(PdfDocument)
+class PdfDocumentAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "model",
+        "status",
+        "page_count",
+        "size",
+        "optimized_size",
+        "linearized",
+        "processed_at",
+    )
+    list_filter = ("status", "model", "linearized")
+    search_fields = ("name", "title")
+    readonly_fields = [field.name for field in PdfDocument._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class AcBackConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "ac_back"
+    verbose_name = "Общие настройки"
+
+    def ready(self):
+        # Register the metrics declared in <app>/statistics.py
+        autodiscover_modules("statistics")
+
+        from . import data_version, excerpts, pdf_metadata, rich_text
+
+        data_version.connect_signals()
+        excerpts.connect_signals()
+        pdf_metadata.connect_signals()
+        rich_text.connect_signals()
@@ -0,0 +1,261 @@
+"""
+Offline content bundles.
+
+Most of the public site (faculties, leadership, admission, science, sports,
+students, the main page) changes a few times a week, yet every page view goes
+through Django. ``manage.py export_bundles`` replays the GET list endpoints
+of each section in every language (all pages of paginated ones) and saves the
+responses in the default storage as one chunk per section and language::
+
+    bundles/ru/science.3f9c0a1b2d4e.json        (+ .msgpack)
+    bundles/ru/science.8d2e4f6a0b1c-3f9c0a1b2d4e.delta.json
+
+Chunk names carry the hash of their content, so the storage/CDN can cache
+them as immutable files. The manifest (``/bundles/<lang>/manifest.json``)
+lists the URL of the current chunk of each section; a client that holds an
+older version of a section downloads the delta chunk listed there: the
+endpoints whose responses changed and the ones that disappeared.
+
+The manifest and the endpoint hashes of previous versions are kept in
+``ContentBundle`` and the chunk names in ``BundleChunk`` (so media garbage
+collection keeps them): nothing lives on the dyno's disk, and any process can
+export. Run the export from a scheduler job so content edited after a deploy
+is published too; unchanged sections are not saved again.
+
+The chunks are plain API responses (``{url: data}``), so the frontend can use
+a bundle exactly like the live API.
+"""
+
+import hashlib
+import logging
+import re
+
+import orjson
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from .renderers import msgpack
+from .routes import get_routes
+
+# section -> URL prefixes of its endpoints
+SECTIONS = {
+    "academy": ["/api/academy/", "/api/banner/", "/api/quotes/", "/api/facts/"],
+    "faculties": [
+        "/api/faculties/",
+        "/api/general-departments/",
+        "/api/education/",
+    ],
+    "leadership": ["/api/leadership-structure/", "/api/administrative-structure/"],
+    "admission": ["/api/admission/"],
+    "science": ["/api/science/", "/api/journal/"],
+    "sports": ["/api/sports/", "/api/sport-achievements/"],
+    "students": ["/api/students/", "/api/graduates/"],
+}
+
+# Endpoints that serve files or build exports
+EXCLUDE_RE = re.compile(r"download|export")
+
+logger = logging.getLogger(__name__)
+
+FOLDER = "bundles"
+HASH_LENGTH = 12
+# Versions of a section kept (chunks and deltas to the current one)
+HISTORY = 5
+MAX_PAGES = 100
+MANIFEST_MAX_AGE = 60
+
+
+def _dumps(data):
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+def _digest(content):
+    return hashlib.blake2b(content, digest_size=16).hexdigest()[:HASH_LENGTH]
+
+
+def _local_url(url):
+    """Path and query of a ``next`` link of a paginated response"""
+    match = re.match(r"^https?://[^/]+(/.*)$", url)
+    return match.group(1) if match else url
+
+
+def collect_section(client, section, language):
+    """``{url: response data}`` of every list endpoint of ``section``"""
+    payloads = {}
+    for prefix in SECTIONS[section]:
+        for route in get_routes(prefix):
+            if EXCLUDE_RE.search(route):
+                continue
+            url = f"{route}?lang={language}"
+            for _page in range(MAX_PAGES):
+                response = client.get(url, HTTP_ACCEPT="application/json")
+                if response.status_code != 200:
+                    break
+                data = orjson.loads(response.content)
+                payloads[url] = data
+                following = data.get("next") if isinstance(data, dict) else None
+                if not isinstance(following, str):
+                    break
+                url = _local_url(following)
+    return payloads
+
+
+def _save(language, name, content):
+    """Save one chunk file unless it exists; returns its storage name"""
+    from .models import BundleChunk
+
+    path = f"{FOLDER}/{language}/{name}"
+    if not default_storage.exists(path):
+        path = default_storage.save(path, ContentFile(content))
+    BundleChunk.objects.get_or_create(name=path, defaults={"language": language})
+    return path
+
+
+def _save_chunk(language, name, document):
+    """
+    Save ``name``.json (and .msgpack); returns ``{format: URL}``, the storage
+    names and the JSON size
+    """
+    content = _dumps(document)
+    names = {"json": _save(language, f"{name}.json", content)}
+    if msgpack is not None:
+        names["msgpack"] = _save(
+            language, f"{name}.msgpack", msgpack.packb(document)
+        )
+    urls = {kind: default_storage.url(path) for kind, path in names.items()}
+    return urls, list(names.values()), len(content)
+
+
+def export_language(language, sections=None, client=None, history=HISTORY):
+    """
+    Export the sections of one language, add deltas from the previous
+    versions and update the manifest. Returns the manifest.
+    """
+    from .models import ContentBundle
+
+    if client is None:
+        from django.test import Client
+
+        client = Client(HTTP_HOST="localhost")
+    bundle, _created = ContentBundle.objects.get_or_create(language=language)
+    manifest = bundle.manifest or {"language": language, "sections": {}}
+    # Endpoint hashes of the previous versions, needed to build deltas
+    versions = bundle.history or {}
+    changed = False
+
+    for section in sections or SECTIONS:
+        payloads = collect_section(client, section, language)
+        endpoints = {url: _digest(_dumps(data)) for url, data in payloads.items()}
+        section_hash = _digest(_dumps(endpoints))
+        known = versions.get(section, [])
+        if known and known[0]["hash"] == section_hash:
+            continue
+        changed = True
+
+        document = {
+            "section": section,
+            "language": language,
+            "hash": section_hash,
+            "endpoints": payloads,
+        }
+        files, names, size = _save_chunk(
+            language, f"{section}.{section_hash}", document
+        )
+
+        deltas = {}
+        delta_names = []
+        for version in known[:history]:
+            delta = {
+                "section": section,
+                "language": language,
+                "from": version["hash"],
+                "to": section_hash,
+                "changed": {
+                    url: payloads[url]
+                    for url, digest in endpoints.items()
+                    if version["endpoints"].get(url) != digest
+                },
+                "removed": sorted(set(version["endpoints"]) - set(endpoints)),
+            }
+            name = f"{section}.{version['hash']}-{section_hash}.delta"
+            deltas[version["hash"]], paths, _size = _save_chunk(language, name, delta)
+            delta_names += paths
+
+        current = {
+            "hash": section_hash,
+            "endpoints": endpoints,
+            "files": names,
+            "deltas": delta_names,
+        }
+        versions[section] = [current] + known[:history]
+        manifest["sections"][section] = {
+            "hash": section_hash,
+            "files": files,
+            "size": size,
+            "deltas": deltas,
+        }
+
+    if changed or not bundle.version:
+        bundle.version += 1
+        manifest["version"] = bundle.version
+        bundle.manifest = manifest
+        bundle.history = versions
+        bundle.save()
+        prune(language, versions)
+    return manifest
+
+
+def prune(language, versions):
+    """Delete chunks that are neither current nor one of the kept versions"""
+    from .models import BundleChunk
+
+    keep = set()
+    for entries in versions.values():
+        # Older chunks stay available to clients holding an older manifest
+        for entry in entries:
+            keep.update(entry.get("files", ()))
+        if entries:
+            keep.update(entries[0].get("deltas", ()))
+    stale = list(
+        BundleChunk.objects.filter(language=language)
+        .exclude(name__in=keep)
+        .values_list("name", flat=True)
+    )
+    BundleChunk.objects.filter(name__in=stale).delete()
+    for name in stale:
+        try:
+            default_storage.delete(name)
+        except Exception as e:
+            logger.warning("Failed to delete bundle chunk %s: %s", name, e)
+    return len(stale)
+
+
+def stored_references():
+    """Column of ``BundleChunk`` holding names in the default storage"""
+    from .models import BundleChunk
+
+    yield BundleChunk, "name"
+
+
+def manifest_view(request, language):
+    """Current manifest of ``language``, revalidated by its version"""
+    from .models import ContentBundle
+
+    row = (
+        ContentBundle.objects.filter(language=language, version__gt=0)
+        .values_list("version", "manifest")
+        .first()
+    )
+    if row is None:
+        raise Http404("No bundle for this language")
+    version, manifest = row
+    etag = f'"{language}-{version}"'
+    if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(_dumps(manifest), content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={MANIFEST_MAX_AGE}"
+    return response
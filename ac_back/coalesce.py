@@ -0,0 +1,124 @@
+"""
+Request coalescing for heavy aggregate pages.
+
+Pages like Scopus, Web of Science or the bachelor quotas build one large
+payload from a dozen queries. When their cached copy expires, every request
+arriving at that moment would rebuild it at once (a cache stampede).
+``get_or_compute`` lets exactly one worker rebuild a given key:
+
+* fresh entry (same data versions, younger than ``max_age``) — returned as is;
+* stale entry (data changed or older than ``max_age``, but within
+  ``stale_for``) — the previous payload is returned immediately and one
+  worker refreshes it in a background thread;
+* no entry — one worker computes while the others wait for its result, up to
+  ``wait`` seconds, and then compute themselves.
+
+"One worker" is decided with ``cache.add`` on a lock key, which is atomic in
+Redis and in the per-process memory cache alike. See
+``manage.py load_test_coalescing`` for queries versus concurrency.
+"""
+
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connections
+
+from .data_version import get_data_version
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE = 10 * 60
+STALE_FOR = 24 * 60 * 60
+WAIT = 5.0
+POLL_INTERVAL = 0.05
+# A crashed worker must not block the key for long
+LOCK_TIMEOUT = 30
+
+ENTRY_KEY = "coalesce:{}"
+LOCK_KEY = "coalesce-lock:{}"
+NAMES_KEY = "coalesce-names"
+
+_known_names = set()
+
+
+def _store(name, version, data, max_age, stale_for):
+    entry = {"version": version, "at": time.time(), "data": data}
+    cache.set(ENTRY_KEY.format(name), entry, max_age + stale_for)
+    if name not in _known_names:
+        names = cache.get(NAMES_KEY) or set()
+        if name not in names:
+            cache.set(NAMES_KEY, names | {name}, None)
+        _known_names.add(name)
+    return data
+
+
+def _refresh(name, version, compute, max_age, stale_for):
+    try:
+        _store(name, version, compute(), max_age, stale_for)
+    except Exception:
+        logger.exception("Background refresh of %s failed", name)
+    finally:
+        cache.delete(LOCK_KEY.format(name))
+        # The thread opened its own database connections
+        connections.close_all()
+
+
+def _wait_for(name, version, wait):
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        entry = cache.get(ENTRY_KEY.format(name))
+        if entry is not None and entry["version"] == version:
+            return entry
+        if cache.get(LOCK_KEY.format(name)) is None and entry is not None:
+            # The holder finished while the data changed again: take what is there
+            return entry
+    return None
+
+
+def get_or_compute(
+    name, models, compute, max_age=MAX_AGE, stale_for=STALE_FOR, wait=WAIT
+):
+    """
+    ``compute()`` shared by all workers under ``name``.
+
+    ``name`` must identify everything the payload depends on (endpoint,
+    language, parameters); ``models`` are the models it is built from, so a
+    save marks the entry stale. The payload must be picklable (serializer
+    ``.data``, dicts, lists).
+    """
+    version = get_data_version(*models)
+    lock = LOCK_KEY.format(name)
+
+    entry = cache.get(ENTRY_KEY.format(name))
+    if entry is not None:
+        if entry["version"] == version and time.time() - entry["at"] < max_age:
+            return entry["data"]
+        if cache.add(lock, version, LOCK_TIMEOUT):
+            threading.Thread(
+                target=_refresh,
+                args=(name, version, compute, max_age, stale_for),
+                daemon=True,
+            ).start()
+        return entry["data"]
+
+    if cache.add(lock, version, LOCK_TIMEOUT):
+        try:
+            return _store(name, version, compute(), max_age, stale_for)
+        finally:
+            cache.delete(lock)
+
+    entry = _wait_for(name, version, wait)
+    if entry is not None:
+        return entry["data"]
+    logger.warning("Gave up waiting for %s, computing it again", name)
+    return compute()
+
+
+def clear_coalesced():
+    """Drop every stored payload (the next request computes it again)"""
+    names = cache.get(NAMES_KEY) or set()
+    cache.delete_many([ENTRY_KEY.format(name) for name in names])
+    return len(names)
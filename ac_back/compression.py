@@ -0,0 +1,209 @@
+"""
+Brotli/gzip compression of API responses.
+
+``CompressionMiddleware`` negotiates ``br`` (when the ``brotli`` package is
+installed) or ``gzip`` from ``Accept-Encoding`` and compresses API payloads
+(JSON, msgpack, the OpenAPI document under ``API_PREFIX``) above ``MIN_SIZE``.
+Already encoded and streaming responses (files, WhiteNoise static files) are
+left alone.
+
+HTML pages (admin, CKEditor) are never compressed: they carry CSRF tokens
+next to reflected input, which is what BREACH needs; for the same reason any
+response that used the CSRF cookie is skipped.
+
+Compressed variants of larger bodies are kept in the cache under a digest of
+the body, so identical payloads (the same list page requested again and
+again) are compressed once; response caches can also attach ready variants
+built with ``precompress()`` as ``response.compressed_variants``.
+
+Bytes saved are accumulated per URL pattern in the shared cache, see
+``manage.py compression_report``.
+"""
+
+import gzip
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # optional dependency, gzip only
+    brotli = None
+
+# Below this size the compressed body plus headers is not worth it
+MIN_SIZE = 1024
+# Bodies above this size keep their compressed variants in the cache
+VARIANT_CACHE_MIN_SIZE = 8 * 1024
+VARIANT_TIMEOUT = 60 * 60
+
+API_PREFIX = "/api/"
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/vnd.oai.openapi",
+)
+
+# Dynamic responses: fast levels, most of the ratio for a fraction of the CPU
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+STATS_KEY = "compression-stats:{}:{}"
+STATS_ROUTES_KEY = "compression-stats:routes"
+STATS_FLUSH_INTERVAL = 60
+
+_accept_re = _lazy_re_compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?")
+
+_pending = {}
+_last_flush = time.monotonic()
+
+
+def accepted_encoding(request):
+    """Best supported encoding of ``Accept-Encoding``, ``None`` if there is none"""
+    header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    accepted = {}
+    for part in header.split(","):
+        match = _accept_re.match(part)
+        if not match:
+            continue
+        try:
+            quality = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+        accepted[match.group(1).lower()] = quality
+    for encoding in ENCODINGS:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def precompress(body):
+    """``{encoding: compressed body}`` for every supported encoding"""
+    return {encoding: compress(body, encoding) for encoding in ENCODINGS}
+
+
+def compressed_body(body, encoding):
+    """``body`` compressed with ``encoding``, reusing a cached variant if any"""
+    if len(body) < VARIANT_CACHE_MIN_SIZE:
+        return compress(body, encoding)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    key = f"compressed:{encoding}:{digest}"
+    compressed = cache.get(key)
+    if compressed is None:
+        compressed = compress(body, encoding)
+        cache.set(key, compressed, VARIANT_TIMEOUT)
+    return compressed
+
+
+def _is_compressible(request, response):
+    if not request.path.startswith(API_PREFIX):
+        return False
+    # Secrets and reflected input in one body (BREACH)
+    if request.META.get("CSRF_COOKIE_USED"):
+        return False
+    content_type = response.get("Content-Type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _route(request):
+    """URL pattern of the request, so detail pages share one counter"""
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.route:
+        return request.path
+    return "/" + match.route.replace("^", "").replace("$", "")
+
+
+def record_saving(route, original, sent):
+    """Accumulate bytes per route; flushed to the shared cache periodically"""
+    global _last_flush
+    totals = _pending.setdefault(route, [0, 0, 0])
+    totals[0] += 1
+    totals[1] += original
+    totals[2] += sent
+
+    now = time.monotonic()
+    if now - _last_flush < STATS_FLUSH_INTERVAL:
+        return
+    _last_flush = now
+    flush_stats()
+
+
+def flush_stats():
+    pending = dict(_pending)
+    _pending.clear()
+    if not pending:
+        return
+    routes = cache.get(STATS_ROUTES_KEY) or set()
+    if not set(pending) <= routes:
+        cache.set(STATS_ROUTES_KEY, routes | set(pending), None)
+    for route, values in pending.items():
+        for name, value in zip(("responses", "original", "sent"), values):
+            key = STATS_KEY.format(route, name)
+            if not cache.add(key, value, None):
+                cache.incr(key, value)
+
+
+def get_stats():
+    """``{route: {"responses", "original", "sent"}}`` over all processes"""
+    routes = sorted(cache.get(STATS_ROUTES_KEY) or ())
+    keys = [
+        STATS_KEY.format(route, name)
+        for route in routes
+        for name in ("responses", "original", "sent")
+    ]
+    values = cache.get_many(keys)
+    return {
+        route: {
+            name: values.get(STATS_KEY.format(route, name), 0)
+            for name in ("responses", "original", "sent")
+        }
+        for route in routes
+    }
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or not _is_compressible(request, response)
+            or len(response.content) < MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = accepted_encoding(request)
+        if encoding is None:
+            return response
+
+        content = response.content
+        variants = getattr(response, "compressed_variants", None) or {}
+        compressed = variants.get(encoding) or compressed_body(content, encoding)
+        if len(compressed) >= len(content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        # The representation changed: a strong ETag no longer matches it
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        record_saving(_route(request), len(content), len(compressed))
+        return response
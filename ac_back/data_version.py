@@ -0,0 +1,97 @@
+"""
+Per-model data versions stored in the shared cache.
+
+Every save/delete of a model bumps its version, so cache keys that embed the
+versions of the models they were computed from never serve stale data and
+never need explicit invalidation. The receivers are connected for all senders
+at startup (``AcBackConfig.ready``), so a save in any process — another
+worker, the admin, a shell or a management command — bumps the version.
+``QuerySet.update``/``bulk_create`` send no signals; code using them calls
+``bump_data_version`` itself.
+
+That holds only when the cache is shared by all workers (Redis). With a
+per-process cache (``LocMemCache``, no ``REDIS_URL``) a bump in one worker is
+invisible to the others, so ``cached_by_version`` then keeps values at most
+``LOCAL_TIMEOUT`` seconds.
+"""
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import post_delete, post_save
+
+VERSION_KEY = "data-version:{}"
+# Serializer context key of the values resolved by ``context_cached``
+CONTEXT_MEMO = "_data_version_memo"
+# Staleness bound when every worker has its own cache
+LOCAL_TIMEOUT = 300
+
+# Models saved on every request or never cached
+UNTRACKED_APPS = {"sessions", "admin", "contenttypes", "migrations"}
+
+
+def _version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def bump_data_version(sender, **kwargs):
+    if sender._meta.app_label in UNTRACKED_APPS:
+        return
+    key = _version_key(sender)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing or evicted: any value different from the default works
+        cache.set(key, 2, None)
+
+
+def connect_signals():
+    """Bump the version of the sender on every save/delete of any model"""
+    post_save.connect(bump_data_version, dispatch_uid="data-version-save")
+    post_delete.connect(bump_data_version, dispatch_uid="data-version-delete")
+
+
+def is_shared_cache():
+    """Whether the default cache is seen by every worker process"""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def get_data_version(*models):
+    """Combined version string of ``models``, e.g. ``"3.1.7"``"""
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    return ".".join(str(versions.get(key, 1)) for key in keys)
+
+
+def cached_by_version(name, models, compute, timeout=None):
+    """
+    Return ``compute()`` cached under ``name`` and the data versions of ``models``.
+
+    ``timeout=None`` keeps the value until
+    the data changes (or the cache evicts it); with a per-process cache the
+    timeout is capped at ``LOCAL_TIMEOUT``.
+    """
+    if not is_shared_cache():
+        timeout = min(timeout or LOCAL_TIMEOUT, LOCAL_TIMEOUT)
+    key = f"{name}:{get_data_version(*models)}"
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
+
+
+def context_cached(context, name, models, compute):
+    """
+    ``cached_by_version`` resolved once per serializer ``context``.
+
+    Serializer fields that look up one entry of a big cached map per row pass
+    ``self.context`` (shared by the list and nested serializers of a response),
+    so a page costs one cache read instead of one per row.
+    """
+    if context is None:
+        return cached_by_version(name, models, compute)
+    memo = context.setdefault(CONTEXT_MEMO, {})
+    if name not in memo:
+        memo[name] = cached_by_version(name, models, compute)
+    return memo[name]
@@ -0,0 +1,461 @@
+"""
+Direct browser uploads to Cloudinary for admin file fields.
+
+Without it a file chosen in the admin is posted to Django and uploaded again
+by the storage, in 6 MB chunks for large PDFs: twice the traffic, and a
+worker busy for the whole transfer. With ``DirectUploadAdminMixin`` the
+admin widget
+
+1. asks ``/admin-upload/sign/`` for a short-lived signature of a new
+   ``public_id`` (the field's validators check the size first);
+2. uploads the file straight to Cloudinary in chunks (``Content-Range`` and
+   ``X-Unique-Upload-Id``), remembering the last chunk in ``localStorage`` so
+   an interrupted upload resumes;
+3. sends Cloudinary's response to ``/admin-upload/confirm/``, which checks
+   the response signature, reads the stored size, format and resource type
+   from the Admin API (the browser's numbers aren't signed), runs the field's
+   validators again on them (deleting the asset when they fail), records the
+   file in ``StoredFile`` and returns a signed value; the form sets the model
+   field from it without uploading.
+
+Browsers without JavaScript still post the file the usual way.
+
+``DIRECT_UPLOAD_URL`` replaces the Cloudinary API URL, e.g. with the local
+fake endpoint ``/admin-upload/fake`` (enabled by ``DIRECT_UPLOAD_FAKE``), which
+checks signatures, assembles chunks in a temporary directory and answers like
+Cloudinary (the Admin API lookup then reads what it recorded).
+"""
+
+import json
+import mimetypes
+import os
+import secrets
+import tempfile
+import time
+
+import cloudinary
+import cloudinary.api
+import cloudinary.exceptions
+import cloudinary.uploader
+import cloudinary.utils
+from cloudinary import CloudinaryResource
+from cloudinary.models import CloudinaryField
+from django import forms
+from django.apps import apps
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.admin.widgets import AdminFileWidget
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from .storage import RAW, MediaRouterStorage, forget_stored_file
+
+# Cloudinary rejects signed uploads with an older timestamp
+SIGNATURE_TTL = 3600
+CHUNK_SIZE = MediaRouterStorage.LARGE_UPLOAD_CHUNK_SIZE
+SALT = "ac_back.direct_upload"
+FAKE_ROOT = os.path.join(tempfile.gettempdir(), "direct-upload-fake")
+
+
+def is_direct_field(field):
+    """Document fields: plain file fields and Cloudinary fields (no images)"""
+    if isinstance(field, models.ImageField):
+        return False
+    return isinstance(field, (models.FileField, CloudinaryField))
+
+
+def field_label(field):
+    return f"{field.model._meta.label_lower}.{field.name}"
+
+
+def resolve_field(label):
+    """Model field from ``app.model.field``; ``LookupError`` for anything else"""
+    model_label, _dot, name = label.rpartition(".")
+    try:
+        field = apps.get_model(model_label)._meta.get_field(name)
+    except FieldDoesNotExist:
+        raise LookupError(label)
+    if not is_direct_field(field):
+        raise LookupError(label)
+    return field
+
+
+def guess_resource_type(filename):
+    content_type = mimetypes.guess_type(filename)[0] or ""
+    if content_type.startswith("image/"):
+        return "image"
+    if content_type.startswith(("video/", "audio/")):
+        return "video"
+    return RAW
+
+
+def upload_target(field, filename):
+    """``(resource_type, public_id)`` of a new upload of ``filename``"""
+    stem, extension = os.path.splitext(get_valid_filename(os.path.basename(filename)))
+    if isinstance(field, CloudinaryField):
+        resource_type = field.resource_type or "image"
+        folder = field.options.get("folder", "")
+    else:
+        storage = field.storage
+        resource_type = getattr(storage, "forced_resource_type", None)
+        resource_type = resource_type or guess_resource_type(filename)
+        folder = ""
+        if not callable(field.upload_to):
+            folder = os.path.dirname(field.generate_filename(None, "x"))
+        folder = storage._prepend_prefix(storage._normalise_name(folder))
+    folder = folder.strip("/")
+    suffix = f"_{secrets.token_hex(3)}"
+    if resource_type == RAW:
+        # Raw public ids keep the extension
+        suffix += extension.lower()
+    # Room for the folder, the suffix and an image/video ".format"
+    room = (field.max_length or 255) - len(folder) - len(suffix) - 6
+    public_id = f"{(stem or 'file')[:max(room, 1)]}{suffix}"
+    return resource_type, f"{folder}/{public_id}".lstrip("/")
+
+
+def upload_url(resource_type):
+    base = getattr(settings, "DIRECT_UPLOAD_URL", "")
+    if base:
+        return f"{base.rstrip('/')}/{resource_type}/upload"
+    return cloudinary.utils.cloudinary_api_url("upload", resource_type=resource_type)
+
+
+class _Stub:
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+def sign_upload(field, filename, size):
+    """Upload parameters for the browser; ``ValidationError`` if the file is refused"""
+    # The field's validators only look at the name and size
+    field.run_validators(_Stub(filename, size))
+    resource_type, public_id = upload_target(field, filename)
+    params = {"public_id": public_id, "timestamp": int(time.time())}
+    config = cloudinary.config()
+    params["signature"] = cloudinary.utils.api_sign_request(params, config.api_secret)
+    params["api_key"] = config.api_key
+    token = {
+        "field": field_label(field),
+        "public_id": public_id,
+        "resource_type": resource_type,
+    }
+    return {
+        "url": upload_url(resource_type),
+        "params": params,
+        "resource_type": resource_type,
+        "chunk_size": CHUNK_SIZE,
+        "upload_id": secrets.token_hex(16),
+        "token": signing.dumps(token, salt=SALT),
+    }
+
+
+def _fake_info_path(public_id):
+    return os.path.join(FAKE_ROOT, get_valid_filename(public_id) + ".json")
+
+
+def uploaded_resource(public_id, resource_type):
+    """``bytes``, ``format``, ``resource_type``... of an upload, from Cloudinary"""
+    if getattr(settings, "DIRECT_UPLOAD_FAKE", False):
+        try:
+            with open(_fake_info_path(public_id)) as file:
+                return json.load(file)
+        except OSError:
+            raise ValidationError("The upload was not found")
+    try:
+        return cloudinary.api.resource(
+            public_id, resource_type=resource_type, type="upload"
+        )
+    except cloudinary.exceptions.NotFound:
+        raise ValidationError("The upload was not found")
+    except cloudinary.exceptions.Error as e:
+        raise ValidationError(f"The upload could not be checked: {e}")
+
+
+def discard_upload(public_id, resource_type):
+    if getattr(settings, "DIRECT_UPLOAD_FAKE", False):
+        try:
+            os.remove(_fake_info_path(public_id))
+        except OSError:
+            pass
+        return
+    try:
+        cloudinary.uploader.destroy(
+            public_id, resource_type=resource_type, invalidate=True
+        )
+    except cloudinary.exceptions.Error:
+        pass
+
+
+def confirm_upload(token, result):
+    """
+    Check Cloudinary's response to a signed upload and return the value of
+    the model field, signed for the admin form.
+    """
+    from .models import StoredFile
+
+    try:
+        expected = signing.loads(token, salt=SALT, max_age=2 * SIGNATURE_TTL)
+    except signing.BadSignature:
+        raise ValidationError("Upload token is invalid or expired")
+    public_id = result.get("public_id")
+    version = result.get("version")
+    if public_id != expected["public_id"] or not version:
+        raise ValidationError("The upload does not match the signature")
+    if not cloudinary.utils.verify_api_response_signature(
+        public_id, version, result.get("signature")
+    ):
+        raise ValidationError("Cloudinary response signature mismatch")
+
+    field = resolve_field(expected["field"])
+    # Only public_id and version are covered by the response signature:
+    # take the size and type from the Admin API, not from the browser
+    expected_type = expected.get("resource_type") or RAW
+    resource = uploaded_resource(public_id, expected_type)
+    resource_type = resource.get("resource_type") or expected_type
+    file_format = resource.get("format") or ""
+    size = int(resource.get("bytes") or 0)
+    name = public_id
+    if resource_type != RAW and file_format:
+        name = f"{public_id}.{file_format}"
+    try:
+        field.run_validators(_Stub(name, size))
+    except ValidationError:
+        discard_upload(public_id, resource_type)
+        raise
+    if isinstance(field, CloudinaryField):
+        value = CloudinaryResource(
+            public_id,
+            format=file_format if resource_type != RAW else None,
+            version=version,
+            type="upload",
+            resource_type=resource_type,
+        ).get_prep_value()
+    else:
+        value = name
+        StoredFile.objects.update_or_create(
+            name=value,
+            defaults=dict(
+                public_id=public_id,
+                resource_type=resource_type,
+                format=file_format,
+                content_type=mimetypes.guess_type(value)[0] or "",
+                size=size,
+                width=resource.get("width"),
+                height=resource.get("height"),
+                last_used_at=timezone.now(),
+            ),
+        )
+        forget_stored_file(value)
+    signed = {"field": expected["field"], "value": value, "size": size}
+    return {
+        "value": signing.dumps(signed, salt=SALT),
+        "name": value,
+        "url": result.get("secure_url") or result.get("url"),
+    }
+
+
+# ------------------------------------------------------------------- admin
+
+
+class ConfirmedUpload(str):
+    """Name of a file already in Cloudinary; the model field keeps it as is"""
+
+    def __new__(cls, value, size):
+        upload = super().__new__(cls, value)
+        upload.size = size
+        return upload
+
+    @property
+    def name(self):
+        return str(self)
+
+
+class DirectUploadWidget(AdminFileWidget):
+    def __init__(self, label, attrs=None):
+        self.label = label
+        super().__init__(attrs)
+
+    class Media:
+        js = ["ac_back/direct_upload.js"]
+
+    def get_context(self, name, value, attrs):
+        attrs = dict(attrs or {})
+        attrs.update(
+            {
+                "data-direct-upload": self.label,
+                "data-sign-url": reverse("direct-upload-sign"),
+                "data-confirm-url": reverse("direct-upload-confirm"),
+            }
+        )
+        return super().get_context(name, value, attrs)
+
+    def render(self, name, value, attrs=None, renderer=None):
+        html = super().render(name, value, attrs, renderer)
+        hidden = forms.HiddenInput().render(f"{name}__direct", "", renderer=renderer)
+        return html + hidden
+
+    def value_from_datadict(self, data, files, name):
+        upload = super().value_from_datadict(data, files, name)
+        if upload is None and data.get(f"{name}__direct"):
+            return DirectUploadToken(data[f"{name}__direct"])
+        return upload
+
+    def value_omitted_from_data(self, data, files, name):
+        return super().value_omitted_from_data(data, files, name) and (
+            f"{name}__direct" not in data
+        )
+
+
+class DirectUploadToken(str):
+    pass
+
+
+class DirectUploadField(forms.FileField):
+    """File field of the admin that also accepts a confirmed direct upload"""
+
+    def __init__(self, model_field, *args, **kwargs):
+        # Arguments of CloudinaryFileField
+        kwargs.pop("options", None)
+        kwargs.pop("autosave", None)
+        self.model_field = model_field
+        kwargs["widget"] = DirectUploadWidget(field_label(model_field))
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, data):
+        if not isinstance(data, DirectUploadToken):
+            return super().to_python(data)
+        try:
+            signed = signing.loads(data, salt=SALT, max_age=2 * SIGNATURE_TTL)
+        except signing.BadSignature:
+            raise ValidationError("Upload token is invalid or expired")
+        if signed["field"] != field_label(self.model_field):
+            raise ValidationError("The upload belongs to another field")
+        if isinstance(self.model_field, CloudinaryField):
+            return self.model_field.to_python(signed["value"])
+        return ConfirmedUpload(signed["value"], signed["size"])
+
+
+class DirectUploadAdminMixin:
+    """Direct browser uploads for the document fields of a ModelAdmin or inline"""
+
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        if is_direct_field(db_field):
+            kwargs.pop("widget", None)
+            return db_field.formfield(
+                form_class=DirectUploadField, model_field=db_field, **kwargs
+            )
+        return super().formfield_for_dbfield(db_field, request, **kwargs)
+
+
+# ------------------------------------------------------------------- views
+
+
+def _json_body(request):
+    try:
+        return json.loads(request.body or b"{}")
+    except ValueError:
+        return None
+
+
+@staff_member_required
+@require_POST
+def sign_view(request):
+    data = _json_body(request)
+    if not isinstance(data, dict):
+        return JsonResponse({"error": "JSON body expected"}, status=400)
+    try:
+        field = resolve_field(str(data.get("field", "")))
+        size = int(data.get("size", 0))
+    except (LookupError, ValueError):
+        return JsonResponse({"error": "Unknown field or size"}, status=400)
+    try:
+        return JsonResponse(sign_upload(field, str(data.get("filename", "")), size))
+    except ValidationError as e:
+        return JsonResponse({"error": " ".join(e.messages)}, status=400)
+
+
+@staff_member_required
+@require_POST
+def confirm_view(request):
+    data = _json_body(request)
+    if not isinstance(data, dict) or not isinstance(data.get("result"), dict):
+        return JsonResponse({"error": "JSON body expected"}, status=400)
+    try:
+        return JsonResponse(confirm_upload(str(data.get("token", "")), data["result"]))
+    except (LookupError, ValidationError) as e:
+        messages = getattr(e, "messages", [str(e)])
+        return JsonResponse({"error": " ".join(messages)}, status=400)
+
+
+@csrf_exempt
+@require_POST
+def fake_upload_view(request, resource_type):
+    """Local stand-in for Cloudinary's upload API (chunked, signed)"""
+    params = {
+        key: value
+        for key, value in request.POST.items()
+        if key not in ("api_key", "signature", "resource_type", "cloud_name")
+    }
+    config = cloudinary.config()
+    signature = cloudinary.utils.api_sign_request(params, config.api_secret)
+    if request.POST.get("signature") != signature:
+        return JsonResponse({"error": {"message": "Invalid Signature"}}, status=401)
+    if int(params.get("timestamp", 0)) < time.time() - SIGNATURE_TTL:
+        return JsonResponse({"error": {"message": "Stale request"}}, status=400)
+    upload = request.FILES.get("file")
+    if upload is None:
+        return JsonResponse({"error": {"message": "Missing file"}}, status=400)
+
+    public_id = params["public_id"]
+    start, end, total = 0, upload.size - 1, upload.size
+    content_range = request.headers.get("Content-Range")
+    if content_range:
+        span, _slash, total = content_range.removeprefix("bytes ").partition("/")
+        start, end = (int(part) for part in span.split("-"))
+        total = int(total)
+    upload_id = request.headers.get("X-Unique-Upload-Id") or secrets.token_hex(16)
+    os.makedirs(FAKE_ROOT, exist_ok=True)
+    path = os.path.join(FAKE_ROOT, get_valid_filename(upload_id))
+    with open(path, "r+b" if os.path.exists(path) else "wb") as target:
+        target.seek(start)
+        for chunk in upload.chunks():
+            target.write(chunk)
+    if end + 1 < total:
+        return JsonResponse({"done": False, "upload_id": upload_id})
+
+    version = int(time.time())
+    file_format = os.path.splitext(upload.name)[1].lstrip(".").lower()
+    response_signature = cloudinary.utils.api_sign_request(
+        {"public_id": public_id, "version": version},
+        config.api_secret,
+        signature_version=1,
+    )
+    resource = CloudinaryResource(
+        public_id,
+        format=file_format if resource_type != RAW else None,
+        version=version,
+        resource_type=resource_type,
+    )
+    info = {
+        "public_id": public_id,
+        "version": version,
+        "resource_type": resource_type,
+        "type": "upload",
+        "format": file_format,
+        "bytes": os.path.getsize(path),
+        "url": resource.build_url(),
+        "secure_url": resource.build_url(secure=True),
+    }
+    # What the Admin API would answer, see uploaded_resource()
+    with open(_fake_info_path(public_id), "w") as file:
+        json.dump(info, file)
+    return JsonResponse({**info, "signature": response_signature})
@@ -0,0 +1,205 @@
+"""
+Plain-text excerpts, word counts and reading time of long texts.
+
+List and card endpoints only need a short summary, so the models in
+``EXCERPT_SOURCES`` keep one in their own columns, filled on save:
+
+* ``excerpt`` — the text without HTML, cut at a word boundary to
+  ``EXCERPT_LENGTH`` characters (``…`` appended when cut);
+* ``word_count`` and ``reading_time`` (minutes at ``READING_WPM``).
+
+Models with ``*_ru``/``*_en``/``*_kg`` triplets get ``excerpt_<lang>`` etc.;
+translation rows (one row per language) get plain ``excerpt`` etc. The list
+views then ``defer()`` the bodies. ``manage.py rebuild_excerpts`` fills the
+columns of rows written without ``save()`` or before they existed.
+"""
+
+import math
+import re
+from html.parser import HTMLParser
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import pre_save
+
+from .data_version import bump_data_version
+from .localization import LANGUAGES
+
+# model -> source fields (base names), the first non-empty one is used
+EXCERPT_SOURCES = {
+    "news.newstranslation": ["content", "description"],
+    "announcements.announcementtranslation": ["content", "description"],
+    "events.event": ["full_description", "description"],
+    "graduates.graduate": ["description"],
+    "students.studentexchange": ["desc"],
+}
+
+# Length of the excerpt columns
+EXCERPT_MAX_LENGTH = 500
+
+BLOCK_TAGS = set(
+    "address article aside blockquote br dd div dl dt figcaption figure footer "
+    "h1 h2 h3 h4 h5 h6 header hr li main nav ol p pre section table td th tr "
+    "ul".split()
+)
+SKIPPED_TAGS = {"script", "style", "template"}
+WORD_RE = re.compile(r"\w+(?:[-'’]\w+)*")
+TRAILING = " \t\n,;:-–—.(«\"'"
+
+
+def excerpt_length():
+    length = getattr(settings, "EXCERPT_LENGTH", 200)
+    return max(1, min(length, EXCERPT_MAX_LENGTH - 1))
+
+
+def reading_speed():
+    return max(1, getattr(settings, "READING_WPM", 200))
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self.skipping += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self.skipping = max(self.skipping - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self.skipping:
+            self.parts.append(data)
+
+
+def plain_text(html):
+    """Text of ``html`` with tags removed, entities decoded, spaces collapsed"""
+    if not html:
+        return ""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return " ".join("".join(extractor.parts).split())
+
+
+def make_excerpt(text, length=None):
+    """``text`` cut at a word boundary to ``length`` characters"""
+    length = length or excerpt_length()
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    boundary = cut.rfind(" ")
+    # A single very long word: cut inside it
+    if boundary > length // 2:
+        cut = cut[:boundary]
+    return cut.rstrip(TRAILING) + "…"
+
+
+def word_count(text):
+    return len(WORD_RE.findall(text))
+
+
+def reading_time(words):
+    """Minutes, rounded up; 0 for an empty text"""
+    return math.ceil(words / reading_speed()) if words else 0
+
+
+def summarize(html, length=None):
+    """``(excerpt, word count, reading time)`` of ``html``"""
+    text = plain_text(html)
+    words = word_count(text)
+    return make_excerpt(text, length), words, reading_time(words)
+
+
+def is_localized(model):
+    return hasattr(model, f"excerpt_{LANGUAGES[0]}")
+
+
+def _source_value(instance, bases, suffix=""):
+    for base in bases:
+        value = getattr(instance, f"{base}{suffix}", None)
+        if value:
+            return value
+    return ""
+
+
+def target_fields(model):
+    """Names of the excerpt columns of ``model``"""
+    names = ["excerpt", "word_count", "reading_time"]
+    if is_localized(model):
+        return [f"{name}_{code}" for code in LANGUAGES for name in names]
+    return names
+
+
+def update_excerpts(instance):
+    """Fill the excerpt columns of ``instance`` (not saved)"""
+    bases = EXCERPT_SOURCES[instance._meta.label_lower]
+    suffixes = [""]
+    if is_localized(type(instance)):
+        suffixes = [f"_{code}" for code in LANGUAGES]
+    for suffix in suffixes:
+        excerpt, words, minutes = summarize(_source_value(instance, bases, suffix))
+        setattr(instance, f"excerpt{suffix}", excerpt)
+        setattr(instance, f"word_count{suffix}", words)
+        setattr(instance, f"reading_time{suffix}", minutes)
+
+
+def rebuild(model, batch_size=200):
+    """Recompute the excerpts of every row of ``model``; returns the row count"""
+    bases = EXCERPT_SOURCES[model._meta.label_lower]
+    names = set(bases) | {f"{base}_{code}" for base in bases for code in LANGUAGES}
+    sources = [
+        field.name for field in model._meta.concrete_fields if field.name in names
+    ]
+    fields = target_fields(model)
+    rows = model._default_manager.only("pk", *sources)
+    batch = []
+    count = 0
+    for instance in rows.iterator(chunk_size=batch_size):
+        update_excerpts(instance)
+        batch.append(instance)
+        if len(batch) >= batch_size:
+            model._default_manager.bulk_update(batch, fields)
+            count += len(batch)
+            batch = []
+    if batch:
+        model._default_manager.bulk_update(batch, fields)
+        count += len(batch)
+    # bulk_update() sends no signals
+    bump_data_version(model)
+    return count
+
+
+def excerpt_models():
+    models = []
+    for label in EXCERPT_SOURCES:
+        try:
+            models.append(apps.get_model(label))
+        except LookupError:
+            continue
+    return models
+
+
+def _on_pre_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        update_excerpts(instance)
+
+
+def connect_signals():
+    for model in excerpt_models():
+        pre_save.connect(
+            _on_pre_save,
+            sender=model,
+            dispatch_uid=f"excerpts-{model._meta.label_lower}",
+        )
@@ -0,0 +1,389 @@
+"""
+Streaming CSV/XLSX export of admin data.
+
+Exports never hold a whole table in memory: the queryset is read with
+``values_list`` (no model instances) and ``iterator(chunk_size=...)``, and the
+file is produced by a generator behind a ``StreamingHttpResponse``:
+
+* CSV — UTF-8 with a BOM (so Excel detects the encoding), flushed every
+  ``FLUSH_SIZE`` bytes;
+* XLSX — a minimal workbook (one sheet, inline strings, no shared string
+  table) written row by row into a ``zipfile`` on an unseekable sink that is
+  drained as it fills; no spreadsheet library is needed.
+
+``EXPORT_MODELS`` lists what can be exported. Staff get "Export CSV/XLSX"
+admin actions (``ExportAdminMixin``); authenticated users with the model's
+view permission can download ``/api/export/<app>.<model>.<csv|xlsx>``, with
+an optional ``?fields=`` subset of columns.
+"""
+
+import csv
+import datetime
+import decimal
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import admin
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from .file_serving import _disposition
+
+# Models (``app.model``) or whole apps (``app``) that can be exported
+EXPORT_MODELS = [
+    "science.publication",
+    "science.scopuspublication",
+    "graduates.graduate",
+    "sport_achievements.sportachievement",
+    "admission",
+]
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# Bytes buffered before a chunk is sent
+FLUSH_SIZE = 64 * 1024
+# Excel's limit for the text of one cell
+MAX_CELL_LENGTH = 32767
+# Characters not allowed in XML 1.0
+ILLEGAL_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def chunk_size():
+    return max(1, getattr(settings, "EXPORT_CHUNK_SIZE", 2000))
+
+
+def export_models():
+    """``{"app.model": model}`` of everything in ``EXPORT_MODELS``"""
+    models = {}
+    for label in EXPORT_MODELS:
+        try:
+            if "." in label:
+                found = [apps.get_model(label)]
+            else:
+                found = apps.get_app_config(label).get_models()
+        except LookupError:
+            continue
+        for model in found:
+            models[model._meta.label_lower] = model
+    return models
+
+
+def export_fields(model):
+    """Concrete fields of ``model`` in column order (foreign keys as ids)"""
+    return list(model._meta.concrete_fields)
+
+
+def _header(field):
+    name = str(field.verbose_name)
+    if field.is_relation:
+        name += " (id)"
+    return name[:1].upper() + name[1:]
+
+
+# --------------------------------------------------------------------- csv
+
+
+class _Echo:
+    """File-like object for ``csv.writer`` that collects what is written"""
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def write(self, value):
+        self.parts.append(value)
+        self.size += len(value)
+
+    def drain(self):
+        data = "".join(self.parts).encode("utf-8")
+        self.parts = []
+        self.size = 0
+        return data
+
+
+def _csv_value(value):
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(header, rows):
+    """CSV bytes of ``header`` and ``rows``, in chunks"""
+    buffer = _Echo()
+    writer = csv.writer(buffer)
+    yield "\ufeff".encode("utf-8")
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.size >= FLUSH_SIZE:
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+# -------------------------------------------------------------------- xlsx
+
+
+class _Sink(io.RawIOBase):
+    """Unseekable output for ``zipfile``; ``drain()`` takes what was written"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        return len(data)
+
+    def drain(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats'
+    '.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+
+WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships"><sheets><sheet name="{name}" sheetId="1" r:id="rId1"/>'
+    "</sheets></workbook>"
+)
+
+WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats'
+    '.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/><Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'styles" Target="styles.xml"/></Relationships>'
+)
+
+# Cell styles: 0 default, 1 bold (header), 2 date, 3 date and time
+STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/>'
+    "</numFmts>"
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+    "</border></borders>"
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" '
+    'applyNumberFormat="1"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" '
+    'applyNumberFormat="1"/>'
+    "</cellXfs></styleSheet>"
+)
+
+SHEET_START_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0"><pane ySplit="1" topLeftCell="A2" '
+    'activePane="bottomLeft" state="frozen"/></sheetView></sheetViews>'
+    "<sheetData>"
+)
+SHEET_END_XML = "</sheetData></worksheet>"
+
+
+def column_letter(index):
+    """``0`` -> ``A``, ``26`` -> ``AA``"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _excel_serial(value):
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.make_naive(value)
+        return (value - EXCEL_EPOCH).total_seconds() / 86400
+    return (value - EXCEL_EPOCH.date()).days
+
+
+def _cell(ref, value, style=0):
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, decimal.Decimal)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, datetime.datetime):
+        return f'<c r="{ref}" s="3"><v>{_excel_serial(value)}</v></c>'
+    if isinstance(value, datetime.date):
+        return f'<c r="{ref}" s="2"><v>{_excel_serial(value)}</v></c>'
+    if isinstance(value, datetime.time):
+        value = value.isoformat()
+    text = ILLEGAL_XML_RE.sub("", str(value))[:MAX_CELL_LENGTH]
+    style = f' s="{style}"' if style else ""
+    return (
+        f'<c r="{ref}" t="inlineStr"{style}>'
+        f'<is><t xml:space="preserve">{escape(text)}</t></is></c>'
+    )
+
+
+def _row(number, columns, values, style=0):
+    cells = "".join(
+        _cell(f"{column}{number}", value, style)
+        for column, value in zip(columns, values)
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+def sheet_name(title):
+    name = re.sub(r"[\[\]:*?/\\]", " ", str(title)).strip()[:31]
+    return escape(name or "Sheet1", {'"': "&quot;"})
+
+
+def stream_xlsx(header, rows, title="Sheet1"):
+    """XLSX bytes of ``header`` and ``rows``, in chunks"""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES_XML)
+        archive.writestr("_rels/.rels", ROOT_RELS_XML)
+        archive.writestr("xl/workbook.xml", WORKBOOK_XML.format(name=sheet_name(title)))
+        archive.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS_XML)
+        archive.writestr("xl/styles.xml", STYLES_XML)
+        yield sink.drain()
+
+        columns = [column_letter(index) for index in range(len(header))]
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            pending = [SHEET_START_XML, _row(1, columns, header, style=1)]
+            size = 0
+            for number, row in enumerate(rows, start=2):
+                xml = _row(number, columns, row)
+                pending.append(xml)
+                size += len(xml)
+                if size >= FLUSH_SIZE:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending = []
+                    size = 0
+                    if sink.buffer:
+                        yield sink.drain()
+            pending.append(SHEET_END_XML)
+            sheet.write("".join(pending).encode("utf-8"))
+    yield sink.drain()
+
+
+# ---------------------------------------------------------------- response
+
+
+def export_response(queryset, file_format, fields=None, filename=None):
+    """``StreamingHttpResponse`` with ``queryset`` as CSV or XLSX"""
+    model = queryset.model
+    fields = fields or export_fields(model)
+    header = [_header(field) for field in fields]
+    if not queryset.ordered:
+        queryset = queryset.order_by("pk")
+    rows = queryset.values_list(*[field.attname for field in fields]).iterator(
+        chunk_size=chunk_size()
+    )
+    if file_format == "xlsx":
+        content = stream_xlsx(header, rows, title=model._meta.verbose_name_plural)
+    else:
+        content = stream_csv(header, rows)
+
+    filename = filename or "{}-{}.{}".format(
+        model._meta.label_lower.replace(".", "-"),
+        timezone.localdate().isoformat(),
+        file_format,
+    )
+    response = StreamingHttpResponse(content, content_type=FORMATS[file_format])
+    response["Content-Disposition"] = _disposition(filename, "attachment")
+    response["Cache-Control"] = "private, no-store"
+    return response
+
+
+# ------------------------------------------------------------------- admin
+
+
+@admin.action(description="Экспорт в CSV", permissions=["view"])
+def export_csv(modeladmin, request, queryset):
+    return export_response(queryset, "csv")
+
+
+@admin.action(description="Экспорт в XLSX", permissions=["view"])
+def export_xlsx(modeladmin, request, queryset):
+    return export_response(queryset, "xlsx")
+
+
+class ExportAdminMixin:
+    """CSV/XLSX export actions for the selected rows of a ModelAdmin"""
+
+    actions = [export_csv, export_xlsx]
+
+
+class ExportAdmin(ExportAdminMixin, admin.ModelAdmin):
+    pass
+
+
+# -------------------------------------------------------------------- view
+
+
+@require_GET
+def export_view(request, label, file_format):
+    if not request.user.is_authenticated:
+        return JsonResponse({"error": "Authentication required"}, status=401)
+    model = export_models().get(label.lower())
+    if model is None:
+        return JsonResponse({"error": "Unknown model"}, status=404)
+    opts = model._meta
+    if not request.user.has_perm(f"{opts.app_label}.view_{opts.model_name}"):
+        return JsonResponse({"error": "Permission denied"}, status=403)
+
+    fields = export_fields(model)
+    if request.GET.get("fields"):
+        by_name = {field.name: field for field in fields}
+        names = [name.strip() for name in request.GET["fields"].split(",")]
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            return JsonResponse(
+                {"error": "Unknown fields: " + ", ".join(unknown)}, status=400
+            )
+        fields = [by_name[name] for name in names]
+    return export_response(model._default_manager.all(), file_format, fields)
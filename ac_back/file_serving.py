@@ -0,0 +1,162 @@
+"""
+Serving files kept on the local disk (``FileSystemStorage``).
+
+``serve_file`` never reads the file into memory:
+
+* ``FILE_SERVING = "x-accel-redirect"`` (nginx) or ``"x-sendfile"`` (Apache,
+  lighttpd): Django only sends headers and the front proxy sends the file,
+  including ``Range`` requests. With nginx, ``FILE_SERVING_INTERNAL_PREFIX``
+  must be an ``internal`` location aliased to ``MEDIA_ROOT``.
+* otherwise a ``FileResponse``: WSGI servers with ``wsgi.file_wrapper``
+  (gunicorn) send it with ``os.sendfile``. A single ``Range: bytes=`` is
+  answered with ``206``; the file is positioned at the start of the range and
+  ``Content-Length`` limits what is sent, so sendfile still applies.
+"""
+
+import io
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.http import http_date, parse_http_date_safe
+
+X_ACCEL_REDIRECT = "x-accel-redirect"
+X_SENDFILE = "x-sendfile"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def local_path(fieldfile):
+    """Path of a stored file on the local disk, ``None`` for remote storages"""
+    try:
+        return fieldfile.path
+    except (NotImplementedError, AttributeError, ValueError):
+        return None
+
+
+def pdf_filename(fieldfile):
+    """Download name of a stored PDF: its base name, ``.pdf`` ensured"""
+    filename = fieldfile.name.split("/")[-1]
+    if not filename.endswith(".pdf"):
+        filename += ".pdf"
+    return filename
+
+
+def _parse_range(header, size):
+    """``(start, end)`` of a single byte range, ``None`` when absent/unsupported"""
+    match = RANGE_RE.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+    return start, end
+
+
+class _RangeFile(io.RawIOBase):
+    """A window of an open file; ``fileno()`` keeps sendfile possible"""
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+def _disposition(filename, disposition):
+    try:
+        filename.encode("ascii")
+        return f'{disposition}; filename="{filename}"'
+    except UnicodeEncodeError:
+        return f"{disposition}; filename*=utf-8''{quote(filename)}"
+
+
+def serve_file(
+    request,
+    fieldfile,
+    filename=None,
+    content_type=None,
+    disposition="inline",
+    max_age=3600,
+):
+    """Response for a local ``FieldFile``; ``Http404`` if it is not on disk"""
+    path = local_path(fieldfile)
+    if path is None or not os.path.isfile(path):
+        raise Http404("File not found")
+    filename = filename or os.path.basename(path)
+    content_type = content_type or (
+        mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    )
+    stat = os.stat(path)
+    backend = getattr(settings, "FILE_SERVING", "")
+    if backend == X_SENDFILE and not path.isascii():
+        # Header values can't carry the raw path
+        backend = ""
+
+    if backend in (X_ACCEL_REDIRECT, X_SENDFILE):
+        response = HttpResponse(content_type=content_type)
+        if backend == X_ACCEL_REDIRECT:
+            prefix = settings.FILE_SERVING_INTERNAL_PREFIX.rstrip("/")
+            response["X-Accel-Redirect"] = quote(f"{prefix}/{fieldfile.name}")
+        else:
+            response["X-Sendfile"] = path
+        # The proxy fills in the length
+        del response["Content-Length"]
+    else:
+        size = stat.st_size
+        byte_range = None
+        if_range = request.headers.get("If-Range")
+        if "Range" in request.headers and (
+            if_range is None or parse_http_date_safe(if_range) == int(stat.st_mtime)
+        ):
+            byte_range = _parse_range(request.headers["Range"], size)
+            if byte_range and byte_range[0] >= size:
+                response = HttpResponse(status=416)
+                response["Content-Range"] = f"bytes */{size}"
+                return response
+
+        file = open(path, "rb")
+        if byte_range:
+            start, end = byte_range
+            response = FileResponse(
+                _RangeFile(file, start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = end - start + 1
+        else:
+            response = FileResponse(file, content_type=content_type)
+            response["Content-Length"] = size
+        response["Accept-Ranges"] = "bytes"
+
+    response["Content-Disposition"] = _disposition(filename, disposition)
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Cache-Control"] = f"public, max-age={max_age}"
+    return response
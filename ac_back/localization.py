@@ -0,0 +1,140 @@
+"""
+Language negotiation and database-side resolution of the ``*_ru`` / ``*_en`` /
+``*_kg`` column triplets.
+
+``request_language(request)`` is the language of the current request, resolved
+once by ``ac_back.middleware.LanguageMiddleware`` from ``?lang=`` (or the
+``?language=`` spelling of the sports API), then ``Accept-Language``.
+
+Instead of loading every language column and picking one in Python,
+``LocalizedQuerySet.localized()`` annotates a ``Coalesce(NullIf(field_<lang>, ''), field_ru, ...)``
+alias per field and defers the raw columns, so the database returns exactly
+the strings the serializer renders. Because the alias is a real SQL expression,
+it can also be used in ``order_by()`` / ``filter()``.
+"""
+
+from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, NullIf
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+LANGUAGES = ("ru", "en", "kg")
+DEFAULT_LANGUAGE = "ru"
+
+# Legacy codes that clients still send
+LANGUAGE_ALIASES = {"ky": "kg"}
+
+# Annotation that records which language the aliases were resolved for
+LANGUAGE_MARKER = "localized_language"
+
+# Query parameters carrying the language, in order of precedence
+LANGUAGE_PARAMS = ("lang", "language")
+
+# Content-Language values (BCP 47 code of Kyrgyz is "ky")
+CONTENT_LANGUAGES = {"ru": "ru", "en": "en", "kg": "ky"}
+
+
+def normalize_language(language):
+    """Привести код языка к одному из LANGUAGES (по умолчанию ru)"""
+    language = LANGUAGE_ALIASES.get(language, language)
+    return language if language in LANGUAGES else DEFAULT_LANGUAGE
+
+
+def is_supported_language(language):
+    return LANGUAGE_ALIASES.get(language, language) in LANGUAGES
+
+
+def negotiate_language(request):
+    """
+    ``(language, source)`` for ``request``; ``source`` is ``"param"``,
+    ``"header"`` or ``"default"``. Unsupported parameter values fall back to
+    the default language, like the per-view ``getattr`` lookups always did.
+    """
+    for param in LANGUAGE_PARAMS:
+        value = request.GET.get(param)
+        if value:
+            return normalize_language(value.strip().lower()), "param"
+
+    header = request.META.get("HTTP_ACCEPT_LANGUAGE", "")
+    for code, _quality in parse_accept_lang_header(header):
+        primary = code.split("-")[0]
+        if is_supported_language(primary):
+            return normalize_language(primary), "header"
+    return DEFAULT_LANGUAGE, "default"
+
+
+def request_language(request):
+    """Language of ``request`` (a Django or DRF request), negotiated once"""
+    request = getattr(request, "_request", request)
+    language = getattr(request, "language", None)
+    if language is None:
+        language, request.language_source = negotiate_language(request)
+        request.language = language
+    return language
+
+
+def invalid_language_param(request):
+    """Explicit ``?lang=`` value that is not a supported language code, if any"""
+    for param in LANGUAGE_PARAMS:
+        value = request.GET.get(param)
+        if value:
+            return None if is_supported_language(value.strip().lower()) else value
+    return None
+
+
+def fallback_chain(language):
+    """Requested language first, then Russian, then the remaining languages"""
+    language = normalize_language(language)
+    chain = [language, DEFAULT_LANGUAGE]
+    chain.extend(code for code in LANGUAGES if code not in chain)
+    return chain
+
+
+def localized_expression(field_name, language):
+    """SQL expression returning the first non-empty translation of ``field_name``"""
+    columns = [
+        NullIf(F(f"{field_name}_{code}"), Value(""))
+        for code in fallback_chain(language)
+    ]
+    return Coalesce(*columns, Value(""), output_field=models.TextField())
+
+
+def get_localized(obj, field_name, language="ru"):
+    """
+    Return the translated value of ``field_name`` for ``obj``.
+
+    Uses the alias annotated by ``LocalizedQuerySet.localized()`` when it was
+    resolved for the same language, otherwise applies the same fallback
+    chain in Python.
+    """
+    language = normalize_language(language)
+    values = obj.__dict__
+    if values.get(LANGUAGE_MARKER) == language and field_name in values:
+        return values[field_name]
+
+    for code in fallback_chain(language):
+        value = getattr(obj, f"{field_name}_{code}", None)
+        if value:
+            return value
+    return ""
+
+
+class LocalizedQuerySet(models.QuerySet):
+    """QuerySet с выбором перевода на стороне БД"""
+
+    def localized(self, language, *field_names):
+        """
+        Annotate ``<field>`` aliases with the translation for ``language``.
+
+        ``Publication.objects.localized("kg", "title").order_by("title")``
+        """
+        language = normalize_language(language)
+        annotations = {
+            field_name: localized_expression(field_name, language)
+            for field_name in field_names
+        }
+        annotations[LANGUAGE_MARKER] = Value(language, output_field=models.CharField())
+        deferred = [
+            f"{field_name}_{code}" for field_name in field_names for code in LANGUAGES
+        ]
+        return self.annotate(**annotations).defer(*deferred)
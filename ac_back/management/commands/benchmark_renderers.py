@@ -0,0 +1,94 @@
+import json
+import time
+
+import orjson
+from django.core.management.base import BaseCommand
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+
+from ac_back.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+from ac_back.routes import get_routes
+
+
+def _median(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the payloads of real GET endpoints with DRF's JSONRenderer and "
+        "with the orjson (and MessagePack) renderers and compare timings and sizes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix", default="/api/", help="Only replay routes under this prefix"
+        )
+        parser.add_argument(
+            "--lang", default="ru", help="Language passed as ?lang= to every endpoint"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=50, help="Renders per endpoint and renderer"
+        )
+        parser.add_argument(
+            "--top", type=int, default=20, help="Show the N slowest endpoints"
+        )
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST="localhost")
+        renderers = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+        if msgpack is not None:
+            renderers["msgpack"] = MessagePackRenderer()
+
+        results = []
+        for route in get_routes(options["prefix"]):
+            response = client.get(route, {"lang": options["lang"]})
+            data = getattr(response, "data", None)
+            if response.status_code != 200 or data is None:
+                continue
+
+            row = {"route": route}
+            for name, renderer in renderers.items():
+                body = renderer.render(data)
+                row[name] = _median(lambda: renderer.render(data), options["repeat"])
+                row[f"{name}_bytes"] = len(body)
+            # The new renderer must produce the same document
+            row["same"] = json.loads(renderers["json"].render(data)) == orjson.loads(
+                renderers["orjson"].render(data)
+            )
+            results.append(row)
+
+        if not results:
+            self.stdout.write("No endpoint returned data")
+            return
+
+        results.sort(key=lambda row: row["json"], reverse=True)
+        names = list(renderers)
+        header = f"{'endpoint':<60}" + "".join(f"{name + ' ms':>12}" for name in names)
+        self.stdout.write(header + f"{'KB':>10}  same")
+        for row in results[: options["top"]]:
+            timings = "".join(f"{row[name] * 1000:>12.3f}" for name in names)
+            size = row["json_bytes"] / 1024
+            self.stdout.write(
+                f"{row['route'][:59]:<60}{timings}{size:>10.1f}  "
+                f"{'yes' if row['same'] else 'NO'}"
+            )
+
+        totals = {name: sum(row[name] for row in results) for name in names}
+        self.stdout.write("")
+        for name in names:
+            bytes_total = sum(row[f"{name}_bytes"] for row in results)
+            speedup = totals["json"] / totals[name] if totals[name] else 0
+            self.stdout.write(
+                f"{name:<8} total {totals[name] * 1000:9.2f} ms  "
+                f"{bytes_total / 1024:9.1f} KB  x{speedup:.1f}"
+            )
+        mismatches = [row["route"] for row in results if not row["same"]]
+        if mismatches:
+            self.stdout.write(self.style.WARNING(f"Different output: {mismatches}"))
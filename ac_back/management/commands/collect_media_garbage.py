@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+import cloudinary.exceptions
+import cloudinary.uploader
+from django.core.management.base import BaseCommand
+
+from ac_back.models import StoredFile
+
+from ac_back.storage import (
+    GARBAGE_GRACE,
+    forget_stored_file,
+    orphaned_files,
+    reference_counts,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete uploaded Cloudinary assets that nothing references any more "
+        "(file fields, PDF previews/copies and URLs in rich text)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=int(GARBAGE_GRACE.total_seconds() // 3600),
+            help="Keep assets uploaded or reused less than this many hours ago",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only list the orphaned assets",
+        )
+
+    def handle(self, *args, **options):
+        counts = reference_counts()
+        shared = sum(count - 1 for count in counts.values() if count > 1)
+        self.stdout.write(
+            f"{len(counts)} files referenced, {shared} references reuse "
+            f"an existing upload"
+        )
+
+        orphans = orphaned_files(timedelta(hours=options["grace_hours"]))
+        removed = freed = 0
+        for stored in orphans:
+            if options["dry_run"]:
+                self.stdout.write(f"  {stored.name} ({stored.size} bytes)")
+                continue
+            # Claim the row first: an upload reusing the file meanwhile has
+            # touched last_used_at, and then nothing is deleted
+            claimed, _ = StoredFile.objects.filter(
+                pk=stored.pk, last_used_at=stored.last_used_at
+            ).delete()
+            if not claimed:
+                continue
+            forget_stored_file(stored.name)
+            try:
+                cloudinary.uploader.destroy(
+                    stored.public_id,
+                    invalidate=True,
+                    resource_type=stored.resource_type,
+                )
+            except cloudinary.exceptions.Error as e:
+                self.stderr.write(f"Failed to delete {stored.name}: {e}")
+                stored.save(force_insert=True)
+                continue
+            removed += 1
+            freed += stored.size
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(orphans)} orphaned assets (dry run)")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Deleted {removed} orphaned assets, {freed} bytes")
+            )
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from ac_back.compression import ENCODINGS, flush_stats, get_stats
+
+
+class Command(BaseCommand):
+    help = "Bytes saved by response compression, per URL pattern"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top", type=int, default=30, help="Show the N routes that saved most"
+        )
+
+    def handle(self, *args, **options):
+        flush_stats()
+        stats = get_stats()
+        if not stats:
+            self.stdout.write("No compressed responses recorded yet")
+            return
+
+        self.stdout.write(f"Encodings: {', '.join(ENCODINGS)}")
+        rows = sorted(
+            stats.items(), key=lambda item: item[1]["original"] - item[1]["sent"],
+            reverse=True,
+        )
+        self.stdout.write(
+            f"{'route':<60}{'responses':>10}{'original KB':>13}{'sent KB':>10}{'saved':>8}"
+        )
+        for route, row in rows[: options["top"]]:
+            saved = 1 - row["sent"] / row["original"] if row["original"] else 0
+            self.stdout.write(
+                f"{route[:59]:<60}{row['responses']:>10}"
+                f"{row['original'] / 1024:>13.1f}{row['sent'] / 1024:>10.1f}{saved:>8.0%}"
+            )
+
+        original = sum(row["original"] for row in stats.values())
+        sent = sum(row["sent"] for row in stats.values())
+        self.stdout.write(
+            f"\nTotal: {original / 1024:.1f} KB -> {sent / 1024:.1f} KB, "
+            f"{(original - sent) / 1024:.1f} KB saved"
+        )
@@ -0,0 +1,60 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ac_back.bundles import HISTORY, SECTIONS, export_language
+from ac_back.localization import LANGUAGES
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the public content of every section and language as versioned "
+        "bundles with delta chunks in the default storage (manifests at "
+        "/bundles/<lang>/manifest.json)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--languages",
+            default=",".join(LANGUAGES),
+            help="Comma-separated languages",
+        )
+        parser.add_argument(
+            "--sections",
+            default=",".join(SECTIONS),
+            help="Comma-separated sections",
+        )
+        parser.add_argument(
+            "--history",
+            type=int,
+            default=HISTORY,
+            help="Previous versions per section that get a delta chunk",
+        )
+
+    def handle(self, *args, **options):
+        sections = [name for name in options["sections"].split(",") if name]
+        unknown = set(sections) - set(SECTIONS)
+        if unknown:
+            raise CommandError(f"Unknown sections: {', '.join(sorted(unknown))}")
+
+        # Endpoints that need parameters answer 4xx; that is expected here
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+        for language in options["languages"].split(","):
+            started = time.perf_counter()
+            manifest = export_language(
+                language, sections=sections, history=options["history"]
+            )
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"{language}: version {manifest['version']} in {elapsed:.1f} s"
+            )
+            for name in sections:
+                entry = manifest["sections"].get(name)
+                if entry is None:
+                    continue
+                self.stdout.write(
+                    f"  {name:<12} {entry['hash']}  {entry['size'] / 1024:9.1f} KB  "
+                    f"{len(entry['deltas'])} deltas"
+                )
+        self.stdout.write(self.style.SUCCESS("Bundles saved to the default storage"))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from ac_back.models import PdfDocument
+from ac_back.pdf_metadata import pending_files, process
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract page count, title, text and a thumbnail of the PDFs that "
+        "have no metadata yet (saved before the upload hook, or failed)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=0, help="Process at most N files"
+        )
+
+    def handle(self, *args, **options):
+        done = failed = 0
+        for name, storage, model in pending_files():
+            if options["limit"] and done + failed >= options["limit"]:
+                break
+            document = process(name, storage, model)
+            if document.status == PdfDocument.DONE:
+                done += 1
+                self.stdout.write(f"✓ {name}: {document.page_count} pages")
+            else:
+                failed += 1
+                self.stderr.write(f"✗ {name}: {document.error}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Processed {done} PDFs, {failed} failed")
+        )
@@ -0,0 +1,217 @@
+import re
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from ac_back.routes import get_routes
+
+TABLE_RE = re.compile(r'\bFROM "(\w+)"')
+COLUMN_RE = re.compile(r'"(\w+)"\."(\w+)"')
+ORDER_RE = re.compile(r'"(\w+)"\."(\w+)" (ASC|DESC)')
+CLAUSE_END_RE = re.compile(r" (ORDER BY|LIMIT|GROUP BY|OFFSET) ")
+
+# Plan fragments that mean an index was used
+INDEX_PLAN_MARKERS = (
+    "Index Scan",
+    "Index Only Scan",
+    "Bitmap Index Scan",
+    "USING INDEX",
+    "USING COVERING INDEX",
+    "USING INTEGER PRIMARY KEY",
+    "USING PRIMARY KEY",
+)
+
+
+def query_shape(sql):
+    """
+    Reduce a SELECT to ``(table, filter columns, order columns)``.
+
+    Only columns of the main table are considered; joined tables are
+    analysed through their own queries.
+    """
+    if not sql.startswith("SELECT"):
+        return None
+    table_match = TABLE_RE.search(sql)
+    if not table_match:
+        return None
+    table = table_match.group(1)
+    tail = sql[table_match.end():]
+
+    where = ""
+    if " WHERE " in tail:
+        where = tail.split(" WHERE ", 1)[1]
+        end = CLAUSE_END_RE.search(where)
+        if end:
+            where = where[: end.start()]
+
+    filters = []
+    for column_table, column in COLUMN_RE.findall(where):
+        if column_table == table and column not in filters:
+            filters.append(column)
+
+    order = []
+    if " ORDER BY " in tail:
+        order_clause = tail.rsplit(" ORDER BY ", 1)[1]
+        for column_table, column, direction in ORDER_RE.findall(order_clause):
+            if column_table == table:
+                order.append(column if direction == "ASC" else f"-{column}")
+
+    if not filters and not order:
+        return None
+    return table, tuple(filters), tuple(order)
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay every GET endpoint, collect the query shapes it issues and "
+        "propose indexes for the ones not covered by an existing index"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix", default="/api/", help="Only replay routes under this prefix"
+        )
+        parser.add_argument(
+            "--lang", default="ru", help="Language passed as ?lang= to every endpoint"
+        )
+        parser.add_argument(
+            "--explain",
+            action="store_true",
+            help="Run EXPLAIN for one query of every shape and report index usage",
+        )
+        parser.add_argument(
+            "--no-seqscan",
+            action="store_true",
+            help="PostgreSQL: SET enable_seqscan = off before EXPLAIN, so small "
+            "tables still show whether an index is usable",
+        )
+        parser.add_argument(
+            "--fail-on-seqscan",
+            action="store_true",
+            help="Exit with an error if any explained shape does not use an index",
+        )
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST="localhost")
+        shapes = defaultdict(lambda: {"count": 0, "endpoints": set(), "sql": None})
+
+        routes = get_routes(options["prefix"])
+        self.stdout.write(f"Replaying {len(routes)} endpoints...")
+        for route in routes:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(route, {"lang": options["lang"]})
+            if response.status_code >= 500:
+                self.stderr.write(f"⚠️ {route}: HTTP {response.status_code}")
+            for query in queries.captured_queries:
+                shape = query_shape(query["sql"])
+                if shape is None:
+                    continue
+                entry = shapes[shape]
+                entry["count"] += 1
+                entry["endpoints"].add(route)
+                entry["sql"] = entry["sql"] or query["sql"]
+
+        indexes = self._existing_indexes({table for table, _, _ in shapes})
+        proposals = []
+        for shape, entry in sorted(shapes.items(), key=lambda item: -item[1]["count"]):
+            table, filters, order = shape
+            covered = self._is_covered(indexes.get(table, []), filters, order)
+            self.stdout.write(
+                f"{'✅' if covered else '❌'} {table} "
+                f"WHERE {', '.join(filters) or '-'} ORDER BY {', '.join(order) or '-'} "
+                f"({entry['count']} queries, {len(entry['endpoints'])} endpoints)"
+            )
+            if not covered:
+                proposal = self._propose(table, filters, order)
+                if proposal:
+                    proposals.append(proposal)
+
+        if proposals:
+            self.stdout.write("\nProposed indexes:")
+            for proposal in sorted(set(proposals)):
+                self.stdout.write(f"  {proposal}")
+        else:
+            self.stdout.write(self.style.SUCCESS("\nEvery query shape is covered by an index"))
+
+        if options["explain"]:
+            seq_scans = self._explain(shapes, options["no_seqscan"])
+            if seq_scans and options["fail_on_seqscan"]:
+                raise CommandError(f"{seq_scans} query shapes do not use an index")
+
+    def _existing_indexes(self, tables):
+        """table -> list of column lists of its indexes (incl. PK/unique)"""
+        result = {}
+        with connection.cursor() as cursor:
+            existing_tables = set(connection.introspection.table_names(cursor))
+            for table in tables & existing_tables:
+                constraints = connection.introspection.get_constraints(cursor, table)
+                result[table] = [
+                    constraint["columns"]
+                    for constraint in constraints.values()
+                    if constraint["columns"]
+                    and (
+                        constraint["index"]
+                        or constraint["primary_key"]
+                        or constraint["unique"]
+                    )
+                ]
+        return result
+
+    @staticmethod
+    def _is_covered(table_indexes, filters, order):
+        """
+        An index helps if it starts with a filtered column or the sort key.
+
+        Partial indexes (WHERE is_active) are reported without their
+        condition by introspection, so they are matched by the sort key.
+        """
+        leading = set(filters)
+        if order:
+            leading.add(order[0].lstrip("-"))
+        return any(columns[0] in leading for columns in table_indexes)
+
+    @staticmethod
+    def _propose(table, filters, order):
+        # Boolean flags such as is_active are better served by a partial index
+        condition = ""
+        fields = [column for column in filters if not column.startswith("is_")]
+        flags = [column for column in filters if column.startswith("is_")]
+        if flags:
+            condition = f", condition=Q({', '.join(f'{flag}=True' for flag in flags)})"
+        fields.extend(column for column in order if column.lstrip("-") not in fields)
+        if not fields:
+            # An index on a boolean flag alone is not selective enough
+            return None
+        return f"{table}: models.Index(fields={fields!r}{condition})"
+
+    def _explain(self, shapes, no_seqscan):
+        vendor = connection.vendor
+        prefix = "EXPLAIN QUERY PLAN " if vendor == "sqlite" else "EXPLAIN "
+        seq_scans = 0
+        self.stdout.write("\nEXPLAIN:")
+        with connection.cursor() as cursor:
+            if no_seqscan and vendor == "postgresql":
+                cursor.execute("SET enable_seqscan = off")
+            for (table, filters, order), entry in shapes.items():
+                if not order and all(column.startswith("is_") for column in filters):
+                    # Flag-only filters are expected to scan
+                    continue
+                try:
+                    cursor.execute(prefix + entry["sql"])
+                except Exception as exc:
+                    self.stderr.write(f"⚠️ {table}: cannot explain ({exc})")
+                    continue
+                plan = "\n".join(" ".join(map(str, row)) for row in cursor.fetchall())
+                uses_index = any(marker in plan for marker in INDEX_PLAN_MARKERS)
+                if not uses_index:
+                    seq_scans += 1
+                self.stdout.write(
+                    f"{'✅ index' if uses_index else '❌ scan '} {table} "
+                    f"[{', '.join(filters)}] [{', '.join(order)}]"
+                )
+            if no_seqscan and vendor == "postgresql":
+                cursor.execute("RESET enable_seqscan")
+        return seq_scans
@@ -0,0 +1,142 @@
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+
+from ac_back.coalesce import clear_coalesced
+from ac_back.data_version import bump_data_version
+
+PAGES = [
+    "/api/science/scopus-page/",
+    "/api/science/wos-page/",
+    "/api/science/publications-page/",
+    "/api/science/student-scientific-society-page/",
+    "/api/admission/bachelor-quotas/",
+]
+
+
+class QueryCounter:
+    """Counts queries on every connection, request and background threads alike"""
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self.lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def attach(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+def _hit(path, lang, barrier, timings, errors):
+    client = Client(HTTP_HOST="localhost")
+    try:
+        barrier.wait()
+        started = time.perf_counter()
+        response = client.get(path, {"lang": lang})
+        timings.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+    finally:
+        connections.close_all()
+
+
+def _burst(path, lang, concurrency):
+    barrier = threading.Barrier(concurrency)
+    timings, errors = [], []
+    threads = [
+        threading.Thread(target=_hit, args=(path, lang, barrier, timings, errors))
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timings, errors
+
+
+def _wait_for_background(baseline, timeout=30):
+    """Let background refreshes started by the burst finish"""
+    deadline = time.monotonic() + timeout
+    while threading.active_count() > baseline and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+def _bump_all():
+    from django.apps import apps
+
+    for model in apps.get_models():
+        bump_data_version(model)
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire bursts of concurrent requests at the coalesced aggregate pages and "
+        "report database queries per burst: cold (nothing cached) and stale "
+        "(data changed, previous payload served while one worker refreshes)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="*", help=f"Pages to test (default: {PAGES})")
+        parser.add_argument(
+            "--concurrency",
+            default="1,4,16,32",
+            help="Comma-separated numbers of simultaneous requests",
+        )
+        parser.add_argument("--lang", default="ru")
+
+    def handle(self, *args, **options):
+        levels = [int(level) for level in options["concurrency"].split(",")]
+        counter = QueryCounter()
+        connection_created.connect(counter.attach)
+        for connection in connections.all():
+            counter.attach(None, connection)
+        baseline = threading.active_count()
+
+        self.stdout.write(
+            f"{'page':<48}{'N':>5}{'cold q':>9}{'stale q':>9}{'naive q':>9}"
+            f"{'p50 ms':>9}{'max ms':>9}"
+        )
+        try:
+            for path in options["paths"] or PAGES:
+                single = None
+                for concurrency in levels:
+                    clear_coalesced()
+                    counter.count = 0
+                    timings, errors = _burst(path, options["lang"], concurrency)
+                    cold = counter.count
+                    if single is None:
+                        single = cold / concurrency
+
+                    _bump_all()
+                    counter.count = 0
+                    stale_timings, stale_errors = _burst(
+                        path, options["lang"], concurrency
+                    )
+                    _wait_for_background(baseline)
+                    stale = counter.count
+
+                    timings += stale_timings
+                    errors += stale_errors
+                    self.stdout.write(
+                        f"{path[:47]:<48}{concurrency:>5}{cold:>9}{stale:>9}"
+                        f"{round(single * concurrency):>9}"
+                        f"{statistics.median(timings) * 1000:>9.1f}"
+                        f"{max(timings) * 1000:>9.1f}"
+                        + (f"  errors: {sorted(set(errors))}" if errors else "")
+                    )
+        finally:
+            connection_created.disconnect(counter.attach)
+
+        self.stdout.write(
+            "\n'naive' is what the burst would cost without coalescing "
+            "(every request building the page itself)."
+        )
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ac_back.media_migration import (
+    BATCH_SIZE,
+    CONCURRENCY,
+    Manifest,
+    collect,
+    default_manifest,
+    dry_run_report,
+    rewrite_references,
+    upload_all,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Upload the local media files referenced by file fields to Cloudinary "
+        "and point the rows to them (resumable, see ac_back/media_migration.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be migrated",
+        )
+        parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help="Row updates per transaction",
+        )
+        parser.add_argument(
+            "--manifest",
+            default=str(default_manifest()),
+            help="Progress file; a second run resumes from it",
+        )
+        parser.add_argument("--media-root", default=settings.MEDIA_ROOT)
+        parser.add_argument(
+            "--upload-only",
+            action="store_true",
+            help="Upload, but leave the database as it is",
+        )
+
+    def handle(self, *args, **options):
+        media_root = Path(options["media_root"]).resolve()
+        if not media_root.is_dir():
+            raise CommandError(f"{media_root} does not exist")
+        manifest = Manifest(options["manifest"])
+        files, remote = collect(media_root)
+
+        if options["dry_run"]:
+            for line in dry_run_report(files, remote, media_root, manifest):
+                self.stdout.write(line)
+            return
+
+        failures = upload_all(
+            files,
+            media_root,
+            manifest,
+            concurrency=max(1, options["concurrency"]),
+            report=self.stdout.write,
+        )
+        updated = 0
+        if not options["upload_only"]:
+            updated = rewrite_references(files, manifest, options["batch_size"])
+
+        message = (
+            f"{len(files) - len(failures)} of {len(files)} files in Cloudinary, "
+            f"{updated} rows updated; progress in {manifest.path}"
+        )
+        if failures:
+            self.stderr.write(message)
+            raise CommandError(f"{len(failures)} uploads failed, run again to retry")
+        self.stdout.write(self.style.SUCCESS(message))
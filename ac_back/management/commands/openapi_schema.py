@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ac_back.openapi import (
+    ARTIFACT,
+    artifact_hash,
+    code_hash,
+    generate_schema,
+    read_artifact,
+    write_artifact,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the OpenAPI schema served at /api/schema/ into ac_back/openapi.json. "
+        "With --check, fail if the committed file is stale instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error when the artifact does not match the code",
+        )
+
+    def handle(self, *args, **options):
+        version = code_hash()
+        if options["check"]:
+            current = artifact_hash(read_artifact())
+            if current != version:
+                raise CommandError(
+                    f"{ARTIFACT.name} is stale (built for {current}, code is {version}). "
+                    "Run: python manage.py openapi_schema"
+                )
+            self.stdout.write(self.style.SUCCESS(f"{ARTIFACT.name} is up to date ({version})"))
+            return
+
+        schema = generate_schema()
+        write_artifact(schema)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {ARTIFACT} ({len(schema.get('paths', {}))} paths, {version})"
+            )
+        )
@@ -0,0 +1,71 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from ac_back.models import PdfDocument
+from ac_back.pdf_metadata import PDF_FIELDS, pdf_fields
+from ac_back.pdf_optimization import optimize_document, savings_report
+
+
+def _storages():
+    """Model label -> storage of its PDF fields"""
+    storages = {}
+    for label in PDF_FIELDS:
+        model = apps.get_model(label)
+        for name in pdf_fields(model):
+            storages[label] = model._meta.get_field(name).storage
+    return storages
+
+
+class Command(BaseCommand):
+    help = (
+        "Build optimized copies (recompressed images, linearized) of the "
+        "processed PDFs and report the bytes saved per model"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild copies of documents that were already optimized",
+        )
+        parser.add_argument(
+            "--report", action="store_true", help="Only print the savings report"
+        )
+
+    def handle(self, *args, **options):
+        if not options["report"]:
+            self.optimize(rebuild=options["all"])
+        self.report()
+
+    def optimize(self, rebuild):
+        storages = _storages()
+        documents = PdfDocument.objects.filter(status=PdfDocument.DONE)
+        if not rebuild:
+            documents = documents.filter(optimized_at__isnull=True)
+        for document in documents.iterator():
+            try:
+                optimize_document(document, storage=storages.get(document.model))
+            except Exception as e:
+                self.stderr.write(f"✗ {document.name}: {e}")
+                continue
+            if document.optimized:
+                self.stdout.write(
+                    f"✓ {document.name}: {document.size} -> "
+                    f"{document.optimized_size} bytes"
+                )
+            else:
+                self.stdout.write(f"= {document.name}: kept the original")
+
+    def report(self):
+        self.stdout.write(
+            f"{'Model':40} {'Docs':>5} {'Optim.':>6} {'Size, MB':>9} "
+            f"{'Saved, MB':>9} {'Saved':>6}"
+        )
+        for row in savings_report():
+            share = row["saved"] / row["original_size"] if row["original_size"] else 0
+            self.stdout.write(
+                f"{row['model'] or '-':40} {row['documents']:>5} "
+                f"{row['optimized_count']:>6} "
+                f"{row['total_size'] / 1024 / 1024:>9.1f} "
+                f"{row['saved'] / 1024 / 1024:>9.1f} {share:>6.0%}"
+            )
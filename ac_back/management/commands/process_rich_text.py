@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+from django.db.models.functions import Length
+
+from ac_back.models import RichTextHtml
+from ac_back.rich_text import process_instance, rich_fields, rich_text_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the processed HTML (extracted images, img dimensions/srcset, "
+        "cleaned styles) of every CKEditor field"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            help="Only this model, e.g. news.newstranslation (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in rich_text_models():
+            label = model._meta.label_lower
+            if options["model"] and label not in options["model"]:
+                continue
+            changed = 0
+            for instance in model._default_manager.only(
+                "pk", *rich_fields(model)
+            ).iterator(chunk_size=100):
+                changed += process_instance(instance)
+            if changed:
+                self.stdout.write(f"{label}: {changed} fields")
+            total += changed
+
+        sizes = RichTextHtml.objects.aggregate(
+            source=Sum("source_size"), processed=Sum(Length("html"))
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {total} fields; {sizes['source'] or 0} -> "
+                f"{sizes['processed'] or 0} characters in total"
+            )
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from ac_back.excerpts import excerpt_models, rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the plain-text excerpts, word counts and reading times "
+        "(after imports that bypass save() or a change of EXCERPT_LENGTH)"
+    )
+
+    def handle(self, *args, **options):
+        for model in excerpt_models():
+            count = rebuild(model)
+            self.stdout.write(f"{model._meta.label_lower}: {count} rows")
+        self.stdout.write(self.style.SUCCESS("Excerpts rebuilt"))
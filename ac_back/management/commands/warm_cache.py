@@ -0,0 +1,167 @@
+import logging
+import re
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+
+from ac_back.data_version import is_shared_cache
+from ac_back.localization import LANGUAGES
+from ac_back.routes import get_detail_routes, get_routes
+
+# Endpoints that stream files or build exports: nothing to cache, costly to hit
+DEFAULT_EXCLUDE = r"download|export|/schema/"
+
+_local = threading.local()
+
+
+def _client(host):
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = _local.client = Client(
+            HTTP_HOST=host, raise_request_exception=False
+        )
+    return client
+
+
+def _host():
+    for host in settings.ALLOWED_HOSTS:
+        if host and "*" not in host and not host.startswith("."):
+            return host
+    return "localhost"
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every GET endpoint (list routes and detail routes of active "
+        "rows) in every language to fill the shared cache after a deploy, and "
+        "report the time per endpoint"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix", default="/api/", help="Only warm routes under this prefix"
+        )
+        parser.add_argument(
+            "--languages",
+            default=",".join(LANGUAGES),
+            help="Comma-separated languages passed as ?lang=",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=4, help="Requests in flight at once"
+        )
+        parser.add_argument(
+            "--detail-limit",
+            type=int,
+            default=25,
+            help="Detail pages per route (active rows); 0 for all, -1 for none",
+        )
+        parser.add_argument(
+            "--exclude",
+            default=DEFAULT_EXCLUDE,
+            help="Regex of URLs not to request",
+        )
+        parser.add_argument("--host", default=None, help="Host header of the requests")
+        parser.add_argument(
+            "--top", type=int, default=20, help="Show the N slowest endpoints, 0 for all"
+        )
+        parser.add_argument(
+            "--release",
+            action="store_true",
+            help=(
+                "Release-phase hook: do nothing unless WARM_CACHE_ON_RELEASE is set "
+                "and the cache is shared (REDIS_URL); errors never fail the release"
+            ),
+        )
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Exit with an error when an endpoint fails (5xx)",
+        )
+
+    def handle(self, *args, **options):
+        if options["release"]:
+            if not settings.WARM_CACHE_ON_RELEASE:
+                self.stdout.write("Cache warm-up skipped (WARM_CACHE_ON_RELEASE is off)")
+                return
+            if not is_shared_cache():
+                # Each web worker has its own memory cache: nothing would reach it
+                self.stdout.write("Cache warm-up skipped (no shared cache, REDIS_URL)")
+                return
+            try:
+                self.warm(**{**options, "strict": False})
+            except Exception as error:
+                self.stdout.write(self.style.WARNING(f"Cache warm-up failed: {error}"))
+            return
+        self.warm(**options)
+
+    def warm(self, **options):
+        prefix = options["prefix"]
+        languages = [lang for lang in options["languages"].split(",") if lang]
+        exclude = re.compile(options["exclude"]) if options["exclude"] else None
+        host = options["host"] or _host()
+        # 404s of empty detail pages are expected; keep the deploy log readable
+        logging.getLogger("django.request").setLevel(logging.ERROR)
+
+        urls = [(route, route) for route in get_routes(prefix)]
+        if options["detail_limit"] >= 0:
+            urls += get_detail_routes(prefix, limit=options["detail_limit"] or None)
+        if exclude is not None:
+            urls = [(route, url) for route, url in urls if not exclude.search(url)]
+        jobs = [(route, url, lang) for route, url in urls for lang in languages]
+
+        def fetch(job):
+            route, url, lang = job
+            started = time.perf_counter()
+            try:
+                status = _client(host).get(url, {"lang": lang}).status_code
+            except Exception as error:
+                status = type(error).__name__
+            finally:
+                connections.close_all()
+            return route, url, status, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(options["concurrency"], 1)) as pool:
+            results = list(pool.map(fetch, jobs))
+        elapsed = time.perf_counter() - started
+
+        by_route = {}
+        failures = []
+        for route, url, status, duration in results:
+            row = by_route.setdefault(route, {"timings": [], "statuses": set()})
+            row["timings"].append(duration)
+            row["statuses"].add(status)
+            if not isinstance(status, int) or status >= 500:
+                failures.append((url, status))
+
+        rows = sorted(
+            by_route.items(), key=lambda item: max(item[1]["timings"]), reverse=True
+        )
+        if options["top"]:
+            rows = rows[: options["top"]]
+        self.stdout.write(
+            f"{'endpoint':<64}{'requests':>9}{'p50 ms':>9}{'max ms':>9}  status"
+        )
+        for route, row in rows:
+            timings = row["timings"]
+            statuses = ",".join(sorted(str(status) for status in row["statuses"]))
+            self.stdout.write(
+                f"{route[:63]:<64}{len(timings):>9}"
+                f"{statistics.median(timings) * 1000:>9.1f}"
+                f"{max(timings) * 1000:>9.1f}  {statuses}"
+            )
+
+        self.stdout.write(
+            f"\n{len(results)} requests to {len(by_route)} endpoints "
+            f"in {elapsed:.1f} s ({', '.join(languages)})"
+        )
+        for url, status in failures:
+            self.stdout.write(self.style.WARNING(f"{status} {url}"))
+        if failures and options["strict"]:
+            raise CommandError(f"{len(failures)} requests failed")
@@ -0,0 +1,366 @@
+"""
+Перенос локальных медиа-файлов в Cloudinary.
+
+``manage.py migrate_media`` walks every ``FileField``/``ImageField``/
+``CloudinaryField`` of the project and collects the values that point to a
+file under ``MEDIA_ROOT``. Each referenced file is then
+
+1. hashed (SHA-256 for deduplication, MD5 to compare with Cloudinary's
+   ``etag``) and uploaded by a bounded thread pool, under the public id the
+   storage would have given it (``media/<path>``);
+2. checked: size and checksum of the response must match the local file;
+3. recorded in a JSON manifest, written atomically every few uploads, so an
+   interrupted run resumes where it stopped;
+4. referenced: the field values are rewritten in batched transactions, with
+   the old value in the ``WHERE`` clause so rows edited meanwhile are left
+   alone. Storage-backed fields also get a ``StoredFile`` record.
+
+Files whose content is already in ``StoredFile`` are not uploaded again.
+``dry_run`` only reports what would be migrated.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import cloudinary.uploader
+import orjson
+from cloudinary import CloudinaryResource
+from cloudinary.models import CloudinaryField
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from .data_version import bump_data_version
+from .storage import RAW, SNIFF_SIZE, MediaRouterStorage, sniff, stored_file
+
+CHUNK_SIZE = 1024 * 1024
+CONCURRENCY = 4
+BATCH_SIZE = 200
+# Uploads between two manifest checkpoints
+CHECKPOINT_EVERY = 10
+
+UPLOADED = "uploaded"
+REWRITTEN = "rewritten"
+
+
+class ChecksumMismatch(Exception):
+    pass
+
+
+def default_manifest():
+    return Path(settings.BASE_DIR) / "media_migration.json"
+
+
+def media_fields():
+    """``(model, field)`` of every file field of the project's models"""
+    for model in apps.get_models():
+        if model._meta.proxy:
+            continue
+        for field in model._meta.concrete_fields:
+            if isinstance(field, (models.FileField, CloudinaryField)):
+                yield model, field
+
+
+def forced_resource_type(field):
+    """Resource type a field always uploads as, ``None`` if it depends on content"""
+    if isinstance(field, CloudinaryField):
+        return field.resource_type or "image"
+    return getattr(field.storage, "forced_resource_type", None)
+
+
+def collect(media_root):
+    """
+    ``{relative path: [(model, field, value), ...]}`` of local files referenced
+    by rows, and the number of values that are not local files.
+    """
+    files = {}
+    remote = 0
+    for model, field in media_fields():
+        raw = Cast(field.attname, output_field=models.TextField())
+        values = (
+            model._default_manager.exclude(**{f"{field.attname}__isnull": True})
+            .exclude(**{field.attname: ""})
+            .values_list(raw, flat=True)
+            .distinct()
+        )
+        for value in values.iterator():
+            path = (media_root / value.lstrip("/")).resolve()
+            if media_root not in path.parents or not path.is_file():
+                remote += 1
+                continue
+            if stored_file(value) is not None:
+                # Same name already uploaded through the storage
+                remote += 1
+                continue
+            relative = path.relative_to(media_root).as_posix()
+            files.setdefault(relative, []).append((model, field, value))
+    return files, remote
+
+
+def local_files(media_root):
+    return {
+        path.relative_to(media_root).as_posix()
+        for path in media_root.rglob("*")
+        if path.is_file()
+    }
+
+
+def checksums(path):
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5()
+    with open(path, "rb") as source:
+        head = source.read(SNIFF_SIZE)
+        source.seek(0)
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+            md5.update(chunk)
+    return head, sha256.hexdigest(), md5.hexdigest()
+
+
+class Manifest:
+    """Progress of a migration, saved as JSON (atomic replace)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            self.entries = orjson.loads(self.path.read_bytes()).get("files", {})
+        self.pending = 0
+
+    def get(self, relative):
+        return self.entries.get(relative)
+
+    def set(self, relative, entry):
+        with self.lock:
+            self.entries[relative] = entry
+            self.pending += 1
+            if self.pending >= CHECKPOINT_EVERY:
+                self._save()
+
+    def save(self):
+        with self.lock:
+            self._save()
+
+    def _save(self):
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_bytes(
+            orjson.dumps({"files": self.entries}, option=orjson.OPT_INDENT_2)
+        )
+        os.replace(temporary, self.path)
+        self.pending = 0
+
+
+def upload_file(path, relative, resource_type=None):
+    """Upload one file, verify it; returns the manifest entry"""
+    try:
+        return _upload_file(path, relative, resource_type)
+    finally:
+        # Runs in a pool thread: don't leak its database connection
+        connection.close()
+
+
+def _upload_file(path, relative, resource_type):
+    from .models import StoredFile
+
+    head, sha256, md5 = checksums(path)
+    size = path.stat().st_size
+    sniffed_type, content_type = sniff(head)
+    resource_type = resource_type or sniffed_type
+
+    existing = StoredFile.objects.filter(sha256=sha256, resource_type=resource_type)
+    existing = existing.values("public_id", "format").first()
+    if existing:
+        return {
+            **existing,
+            "resource_type": resource_type,
+            "content_type": content_type,
+            "version": None,
+            "sha256": sha256,
+            "size": size,
+            "status": UPLOADED,
+        }
+
+    storage_prefix = MediaRouterStorage()._prepend_prefix("")
+    public_id = f"{storage_prefix}{relative}"
+    if resource_type != RAW:
+        # Image/video public ids have no extension; keep it in the id so that
+        # photo.png and photo.jpg stay two assets
+        stem, extension = os.path.splitext(public_id)
+        public_id = f"{stem}_{extension.lstrip('.')}" if extension else stem
+    options = {
+        "public_id": public_id,
+        "resource_type": resource_type,
+        "overwrite": True,
+        "tags": MediaRouterStorage.TAG,
+    }
+    with open(path, "rb") as source:
+        if size > MediaRouterStorage.MAX_SINGLE_UPLOAD_SIZE:
+            options["chunk_size"] = MediaRouterStorage.LARGE_UPLOAD_CHUNK_SIZE
+            response = cloudinary.uploader.upload_large(source, **options)
+        else:
+            response = cloudinary.uploader.upload(source, **options)
+
+    if response.get("bytes") not in (None, size):
+        raise ChecksumMismatch(f"{relative}: {response['bytes']} bytes, {size} local")
+    if response.get("etag") and response["etag"] != md5:
+        raise ChecksumMismatch(f"{relative}: etag {response['etag']}, md5 {md5}")
+    return {
+        "public_id": response["public_id"],
+        "format": response.get("format") or "",
+        "resource_type": resource_type,
+        "content_type": content_type,
+        "version": response.get("version"),
+        "sha256": sha256,
+        "size": size,
+        "status": UPLOADED,
+    }
+
+
+def upload_all(files, media_root, manifest, concurrency=CONCURRENCY, report=print):
+    """Upload the files not in the manifest yet; returns the failures"""
+    jobs = {}
+    for relative, references in files.items():
+        entry = manifest.get(relative)
+        if entry and entry["status"] in (UPLOADED, REWRITTEN):
+            continue
+        forced = {forced_resource_type(field) for _model, field, _value in references}
+        resource_type = forced.pop() if len(forced) == 1 else None
+        jobs[relative] = resource_type
+
+    failures = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(upload_file, media_root / relative, relative, resource_type):
+            relative
+            for relative, resource_type in jobs.items()
+        }
+        for future in as_completed(futures):
+            relative = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                failures[relative] = str(e)
+                report(f"✗ {relative}: {e}")
+                continue
+            manifest.set(relative, entry)
+            report(f"✓ {relative} -> {entry['public_id']}")
+    manifest.save()
+    return failures
+
+
+def new_value(field, entry):
+    """Value of ``field`` that points to the uploaded file"""
+    resource_type = entry["resource_type"]
+    file_format = entry["format"] if resource_type != RAW else ""
+    if isinstance(field, CloudinaryField):
+        return CloudinaryResource(
+            entry["public_id"],
+            format=file_format or None,
+            version=entry["version"],
+            type="upload",
+            resource_type=resource_type,
+        ).get_prep_value()
+    if file_format:
+        return f"{entry['public_id']}.{file_format}"
+    return entry["public_id"]
+
+
+def record_stored_file(name, entry):
+    from .models import StoredFile
+
+    StoredFile.objects.update_or_create(
+        name=name,
+        defaults=dict(
+            public_id=entry["public_id"],
+            resource_type=entry["resource_type"],
+            format=entry["format"],
+            content_type=entry["content_type"],
+            size=entry["size"],
+            sha256=entry["sha256"],
+            last_used_at=timezone.now(),
+        ),
+    )
+
+
+def rewrite_references(files, manifest, batch_size=BATCH_SIZE):
+    """
+    Point the rows to the uploaded files; returns the number of updated rows.
+
+    A file is marked ``REWRITTEN`` once every one of its references has been
+    processed, so a run interrupted between two batches resumes its remaining
+    rows. Files referenced from fields with another storage stay ``UPLOADED``.
+    """
+    updates = []
+    # References of each file not processed yet
+    remaining = {}
+    skipped = set()
+    for relative, references in files.items():
+        entry = manifest.get(relative)
+        if not entry or entry["status"] != UPLOADED:
+            continue
+        for model, field, value in references:
+            if not isinstance(field, CloudinaryField) and not isinstance(
+                field.storage, MediaRouterStorage
+            ):
+                skipped.add(relative)
+                continue
+            updates.append((relative, model, field, value, new_value(field, entry)))
+            remaining[relative] = remaining.get(relative, 0) + 1
+
+    updated = 0
+    changed_models = set()
+    for start in range(0, len(updates), batch_size):
+        batch = updates[start : start + batch_size]
+        with transaction.atomic():
+            for relative, model, field, value, target in batch:
+                if not isinstance(field, CloudinaryField):
+                    record_stored_file(target, manifest.get(relative))
+                # Only rows that still reference the local file
+                rows = model._default_manager.filter(**{field.attname: value})
+                count = rows.update(**{field.attname: target})
+                if count:
+                    updated += count
+                    changed_models.add(model)
+        for relative, *_rest in batch:
+            remaining[relative] -= 1
+        for relative in {update[0] for update in batch}:
+            if remaining[relative] == 0 and relative not in skipped:
+                manifest.set(relative, {**manifest.get(relative), "status": REWRITTEN})
+        manifest.save()
+
+    # update() sends no signals: invalidate the cached pages by hand
+    for model in changed_models:
+        bump_data_version(model)
+    return updated
+
+
+def dry_run_report(files, remote, media_root, manifest):
+    referenced = set(files)
+    pending = [
+        relative
+        for relative in referenced
+        if (manifest.get(relative) or {}).get("status") != REWRITTEN
+    ]
+    size = sum((media_root / relative).stat().st_size for relative in pending)
+    lines = [
+        f"Fields scanned: {len(list(media_fields()))}",
+        f"Local files referenced: {len(referenced)} "
+        f"({sum(len(refs) for refs in files.values())} field values)",
+        f"To migrate: {len(pending)} files, {size / 1024 / 1024:.1f} MB",
+        f"Values already remote (or missing): {remote}",
+        f"Local files no row references (not migrated): "
+        f"{len(local_files(media_root) - referenced)}",
+    ]
+    for relative in sorted(pending):
+        fields = sorted(
+            f"{model._meta.label_lower}.{field.name}"
+            for model, field, _value in files[relative]
+        )
+        lines.append(f"  {relative}  <- {', '.join(fields)}")
+    return lines
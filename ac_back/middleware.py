@@ -0,0 +1,31 @@
+from django.utils.cache import patch_vary_headers
+
+from .localization import CONTENT_LANGUAGES, request_language
+
+API_PREFIX = "/api/"
+
+
+class LanguageMiddleware:
+    """
+    Resolve the response language of API requests once and store it on the
+    request (``request.language``, see ``ac_back.localization``).
+
+    Responses negotiated from ``Accept-Language`` vary on it; every API
+    response states its ``Content-Language``.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not request.path.startswith(API_PREFIX):
+            return self.get_response(request)
+
+        language = request_language(request)
+        response = self.get_response(request)
+
+        if request.language_source != "param":
+            patch_vary_headers(response, ("Accept-Language",))
+        if "Content-Language" not in response:
+            response["Content-Language"] = CONTENT_LANGUAGES[language]
+        return response
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Имя')),
+                ('public_id', models.CharField(max_length=255, verbose_name='Public ID')),
+                ('resource_type', models.CharField(choices=[('image', 'Изображение'), ('raw', 'Файл'), ('video', 'Видео/аудио')], max_length=5, verbose_name='Тип ресурса')),
+                ('format', models.CharField(blank=True, max_length=20, verbose_name='Формат')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='MIME-тип')),
+                ('size', models.BigIntegerField(default=0, verbose_name='Размер, байт')),
+                ('width', models.PositiveIntegerField(blank=True, null=True, verbose_name='Ширина')),
+                ('height', models.PositiveIntegerField(blank=True, null=True, verbose_name='Высота')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Загружен')),
+            ],
+            options={
+                'verbose_name': 'Загруженный файл',
+                'verbose_name_plural': 'Загруженные файлы',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
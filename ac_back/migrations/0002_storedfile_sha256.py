@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedfile',
+            name='sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64, verbose_name='SHA-256'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0002_storedfile_sha256'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PdfDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Имя')),
+                ('model', models.CharField(blank=True, max_length=100, verbose_name='Модель')),
+                ('status', models.CharField(choices=[('pending', 'В очереди'), ('done', 'Обработан'), ('failed', 'Ошибка')], default='pending', max_length=7, verbose_name='Статус')),
+                ('error', models.TextField(blank=True, verbose_name='Ошибка')),
+                ('size', models.BigIntegerField(blank=True, null=True, verbose_name='Размер, байт')),
+                ('page_count', models.PositiveIntegerField(blank=True, null=True, verbose_name='Страниц')),
+                ('title', models.CharField(blank=True, max_length=500, verbose_name='Заголовок')),
+                ('thumbnail', models.CharField(blank=True, max_length=255, verbose_name='Превью первой страницы')),
+                ('text', models.TextField(blank=True, verbose_name='Текст')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Обработан')),
+            ],
+            options={
+                'verbose_name': 'PDF-документ',
+                'verbose_name_plural': 'PDF-документы',
+                'ordering': ['-processed_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0003_pdfdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='linearized',
+            field=models.BooleanField(default=False, verbose_name='Линеаризован'),
+        ),
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='optimized',
+            field=models.CharField(blank=True, max_length=255, verbose_name='Оптимизированная копия'),
+        ),
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='optimized_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Оптимизирован'),
+        ),
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='optimized_size',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='Размер копии, байт'),
+        ),
+    ]
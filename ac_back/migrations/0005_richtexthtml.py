@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0004_pdfdocument_optimized'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RichTextHtml',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, verbose_name='Модель')),
+                ('object_id', models.CharField(max_length=64, verbose_name='ID объекта')),
+                ('field', models.CharField(max_length=100, verbose_name='Поле')),
+                ('source_hash', models.CharField(max_length=64, verbose_name='Хеш исходного HTML')),
+                ('html', models.TextField(blank=True, verbose_name='HTML')),
+                ('source_size', models.PositiveIntegerField(default=0, verbose_name='Исходный размер')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлён')),
+            ],
+            options={
+                'verbose_name': 'Обработанный HTML',
+                'verbose_name_plural': 'Обработанный HTML',
+                'constraints': [models.UniqueConstraint(fields=('model', 'object_id', 'field'), name='rich_text_html_unique')],
+            },
+        ),
+    ]
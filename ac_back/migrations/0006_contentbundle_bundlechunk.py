@@ -0,0 +1,41 @@
+# Generated by Django 5.1.2 on 2026-10-19 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0005_richtexthtml'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BundleChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=5, verbose_name='Язык')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='Имя')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Создан')),
+            ],
+            options={
+                'verbose_name': 'Файл офлайн-пакета',
+                'verbose_name_plural': 'Файлы офлайн-пакетов',
+            },
+        ),
+        migrations.CreateModel(
+            name='ContentBundle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=5, unique=True, verbose_name='Язык')),
+                ('version', models.PositiveIntegerField(default=0, verbose_name='Версия')),
+                ('manifest', models.JSONField(default=dict, verbose_name='Манифест')),
+                ('history', models.JSONField(default=dict, verbose_name='История версий')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Обновлён')),
+            ],
+            options={
+                'verbose_name': 'Офлайн-пакет',
+                'verbose_name_plural': 'Офлайн-пакеты',
+            },
+        ),
+    ]
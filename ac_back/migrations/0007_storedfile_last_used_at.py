@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-19 19:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_created_at(apps, schema_editor):
+    StoredFile = apps.get_model("ac_back", "StoredFile")
+    StoredFile.objects.update(last_used_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ac_back', '0006_contentbundle_bundlechunk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='storedfile',
+            name='last_used_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Последнее использование'),
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+    ]
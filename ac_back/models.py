@@ -0,0 +1,155 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class StoredFile(models.Model):
+    """Файл, загруженный в Cloudinary через хранилище по умолчанию"""
+
+    IMAGE = "image"
+    RAW = "raw"
+    VIDEO = "video"
+    RESOURCE_TYPE_CHOICES = [
+        (IMAGE, _("Изображение")),
+        (RAW, _("Файл")),
+        (VIDEO, _("Видео/аудио")),
+    ]
+
+    # Value stored in the FileField
+    name = models.CharField(_("Имя"), max_length=255, unique=True)
+    public_id = models.CharField(_("Public ID"), max_length=255)
+    resource_type = models.CharField(
+        _("Тип ресурса"), max_length=5, choices=RESOURCE_TYPE_CHOICES
+    )
+    format = models.CharField(_("Формат"), max_length=20, blank=True)
+    content_type = models.CharField(_("MIME-тип"), max_length=100, blank=True)
+    size = models.BigIntegerField(_("Размер, байт"), default=0)
+    # Uploads with the same content reuse the asset instead of uploading again
+    sha256 = models.CharField(_("SHA-256"), max_length=64, blank=True, db_index=True)
+    width = models.PositiveIntegerField(_("Ширина"), null=True, blank=True)
+    height = models.PositiveIntegerField(_("Высота"), null=True, blank=True)
+    created_at = models.DateTimeField(_("Загружен"), auto_now_add=True)
+    # Uploaded or reused by a deduplicated upload; garbage collection waits
+    # GARBAGE_GRACE after this
+    last_used_at = models.DateTimeField(
+        _("Последнее использование"), default=timezone.now, db_index=True
+    )
+
+    class Meta:
+        verbose_name = _("Загруженный файл")
+        verbose_name_plural = _("Загруженные файлы")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return self.name
+
+
+class PdfDocument(models.Model):
+    """Сведения о PDF-файле: страницы, размер, заголовок, превью и текст"""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, _("В очереди")),
+        (DONE, _("Обработан")),
+        (FAILED, _("Ошибка")),
+    ]
+
+    # Value stored in the FileField
+    name = models.CharField(_("Имя"), max_length=255, unique=True)
+    # Model the file was first seen in, e.g. journal.journalsection
+    model = models.CharField(_("Модель"), max_length=100, blank=True)
+    status = models.CharField(
+        _("Статус"), max_length=7, choices=STATUS_CHOICES, default=PENDING
+    )
+    error = models.TextField(_("Ошибка"), blank=True)
+    size = models.BigIntegerField(_("Размер, байт"), null=True, blank=True)
+    page_count = models.PositiveIntegerField(_("Страниц"), null=True, blank=True)
+    title = models.CharField(_("Заголовок"), max_length=500, blank=True)
+    thumbnail = models.CharField(_("Превью первой страницы"), max_length=255, blank=True)
+    text = models.TextField(_("Текст"), blank=True)
+    processed_at = models.DateTimeField(_("Обработан"), null=True, blank=True)
+    # Optimized copy served instead of the original, which is kept as is
+    optimized = models.CharField(
+        _("Оптимизированная копия"), max_length=255, blank=True
+    )
+    optimized_size = models.BigIntegerField(
+        _("Размер копии, байт"), null=True, blank=True
+    )
+    linearized = models.BooleanField(_("Линеаризован"), default=False)
+    optimized_at = models.DateTimeField(_("Оптимизирован"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("PDF-документ")
+        verbose_name_plural = _("PDF-документы")
+        ordering = ["-processed_at"]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def bytes_saved(self):
+        if self.optimized and self.size and self.optimized_size is not None:
+            return self.size - self.optimized_size
+        return 0
+
+
+class RichTextHtml(models.Model):
+    """Обработанный HTML поля CKEditor (отдаётся API вместо исходного)"""
+
+    model = models.CharField(_("Модель"), max_length=100)
+    object_id = models.CharField(_("ID объекта"), max_length=64)
+    field = models.CharField(_("Поле"), max_length=100)
+    # SHA-256 of the source HTML the row was built from
+    source_hash = models.CharField(_("Хеш исходного HTML"), max_length=64)
+    html = models.TextField(_("HTML"), blank=True)
+    source_size = models.PositiveIntegerField(_("Исходный размер"), default=0)
+    updated_at = models.DateTimeField(_("Обновлён"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Обработанный HTML")
+        verbose_name_plural = _("Обработанный HTML")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model", "object_id", "field"], name="rich_text_html_unique"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.model}:{self.object_id}.{self.field}"
+
+
+class ContentBundle(models.Model):
+    """Манифест офлайн-пакетов одного языка и хеши прежних версий разделов"""
+
+    language = models.CharField(_("Язык"), max_length=5, unique=True)
+    version = models.PositiveIntegerField(_("Версия"), default=0)
+    # Served at /bundles/<language>/manifest.json
+    manifest = models.JSONField(_("Манифест"), default=dict)
+    # section -> [{"hash", "endpoints": {url: hash}}], newest first
+    history = models.JSONField(_("История версий"), default=dict)
+    updated_at = models.DateTimeField(_("Обновлён"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Офлайн-пакет")
+        verbose_name_plural = _("Офлайн-пакеты")
+
+    def __str__(self):
+        return f"{self.language} v{self.version}"
+
+
+class BundleChunk(models.Model):
+    """Файл офлайн-пакета в хранилище по умолчанию"""
+
+    language = models.CharField(_("Язык"), max_length=5)
+    # Name in the default storage
+    name = models.CharField(_("Имя"), max_length=255, unique=True)
+    created_at = models.DateTimeField(_("Создан"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Файл офлайн-пакета")
+        verbose_name_plural = _("Файлы офлайн-пакетов")
+
+    def __str__(self):
+        return self.name
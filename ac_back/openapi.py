@@ -0,0 +1,141 @@
+"""
+Prebuilt OpenAPI schema.
+
+drf-spectacular introspects every view and serializer to build the schema,
+which takes seconds. The document is built once — ``manage.py openapi_schema``
+writes ``ac_back/openapi.json``, committed with the code — and served as a
+static body. The artifact records the hash of the code it was built from
+(``info.x-code-hash``); when it does not match the running code, the schema is
+rebuilt on first request and shared between workers through the cache.
+``manage.py openapi_schema --check`` fails on a stale artifact and runs in
+the release phase.
+
+Only inputs that shape the schema are hashed: the REST framework settings
+without the renderers and parsers that depend on the environment (the
+browsable API behind ``DRF_BROWSABLE_API``, msgpack when it is installed), and
+the modules that declare the API — URL confs, models and everything importing DRF or
+drf-spectacular. Admin, storage or command edits leave the artifact fresh.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import drf_spectacular
+import rest_framework
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+
+ARTIFACT = Path(__file__).resolve().parent / "openapi.json"
+HASH_FIELD = "x-code-hash"
+
+# Directories that cannot change the schema
+SKIPPED_DIRS = {"migrations", "management", "__pycache__", "tests"}
+
+# Modules whose content can change the schema
+SCHEMA_MARKERS = (b"rest_framework", b"drf_spectacular", b"models.Model")
+SCHEMA_FILES = {"urls.py", "models.py"}
+
+# Renderers and parsers present only in some environments
+OPTIONAL_CLASSES = {
+    "rest_framework.renderers.BrowsableAPIRenderer",
+    "ac_back.renderers.MessagePackRenderer",
+    "ac_back.parsers.MessagePackParser",
+}
+
+_code_hash = None
+_schema = None
+
+
+def _source_files():
+    base = Path(settings.BASE_DIR).resolve()
+    for config in apps.get_app_configs():
+        path = Path(config.path).resolve()
+        if base not in path.parents:
+            continue
+        for file in path.rglob("*.py"):
+            if SKIPPED_DIRS & set(file.relative_to(path).parts):
+                continue
+            content = file.read_bytes()
+            if file.name in SCHEMA_FILES or any(
+                marker in content for marker in SCHEMA_MARKERS
+            ):
+                yield str(file.relative_to(base)), content
+
+
+def _schema_settings():
+    """REST_FRAMEWORK without the environment-dependent classes"""
+    return sorted(
+        (
+            key,
+            [item for item in value if item not in OPTIONAL_CLASSES]
+            if isinstance(value, (list, tuple))
+            else value,
+        )
+        for key, value in settings.REST_FRAMEWORK.items()
+    )
+
+
+def code_hash():
+    """Hash of the API modules, the schema settings and library versions"""
+    global _code_hash
+    if _code_hash is None:
+        digest = hashlib.sha256()
+        digest.update(drf_spectacular.__version__.encode())
+        digest.update(rest_framework.VERSION.encode())
+        digest.update(repr(sorted(settings.SPECTACULAR_SETTINGS.items())).encode())
+        digest.update(repr(_schema_settings()).encode())
+        for name, content in sorted(_source_files()):
+            digest.update(name.encode())
+            digest.update(content)
+        _code_hash = digest.hexdigest()[:16]
+    return _code_hash
+
+
+def generate_schema():
+    """Build the schema with drf-spectacular (slow)"""
+    from drf_spectacular.generators import SchemaGenerator
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+
+    generator = SchemaGenerator()
+    schema = generator.get_schema(request=None, public=True)
+    schema["info"][HASH_FIELD] = code_hash()
+    # Plain JSON types only (lazy strings etc.), exactly what the artifact holds
+    return json.loads(OpenApiJsonRenderer().render(schema))
+
+
+def read_artifact():
+    try:
+        return json.loads(ARTIFACT.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_artifact(schema):
+    ARTIFACT.write_text(
+        json.dumps(schema, ensure_ascii=False, indent=1) + "\n",
+        encoding="utf-8",
+    )
+
+
+def artifact_hash(schema):
+    return (schema or {}).get("info", {}).get(HASH_FIELD)
+
+
+def get_schema():
+    """Current schema: artifact, shared cache, or a fresh build, in that order"""
+    global _schema
+    version = code_hash()
+    if _schema is not None and artifact_hash(_schema) == version:
+        return _schema
+
+    schema = read_artifact()
+    if artifact_hash(schema) != version:
+        key = f"openapi-schema:{version}"
+        schema = cache.get(key)
+        if schema is None:
+            schema = generate_schema()
+            cache.set(key, schema, None)
+    _schema = schema
+    return schema
@@ -0,0 +1,323 @@
+"""
+PDF metadata extracted at upload time.
+
+When a row with a PDF field is saved with a file that has no ``PdfDocument``
+yet, the file is queued (after commit) to a small background thread pool,
+which reads it once and stores the page count, size, title, plain text (for
+search) and a JPEG thumbnail of the first page. Serializers expose it with
+``PdfInfoField``, so lists can show sizes and previews without downloading
+the files.
+
+Parsing needs ``pypdf``, thumbnails ``pypdfium2``; without them the rows are
+marked as failed or left without a thumbnail. ``manage.py extract_pdf_metadata``
+processes files saved before this module existed and retries failures.
+"""
+
+import hashlib
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from . import pdf_optimization
+from .data_version import bump_data_version, context_cached
+from .localization import LANGUAGES, normalize_language, request_language
+
+try:
+    import pypdf
+except ImportError:  # optional dependency
+    pypdf = None
+
+try:
+    import pypdfium2
+except ImportError:  # optional dependency
+    pypdfium2 = None
+
+logger = logging.getLogger(__name__)
+
+# model -> PDF fields (base names of *_ru/_en/_kg triplets, or plain names)
+PDF_FIELDS = {
+    "journal.journalsection": ["pdf"],
+    "journal.archiveitem": ["file"],
+    "journal.latestissue": ["pdf"],
+    "journal.themeregistry": ["pdf"],
+    "journal.regulation": ["pdf"],
+    "leadership_structure.document": ["pdf"],
+    "science.vestnikrelease": ["pdf"],
+    "science.scientificpublication": ["file"],
+    "admission.aspirantdocuments": ["file"],
+    "students.studentinstractions": ["pdf"],
+}
+
+WORKERS = int(os.getenv("PDF_METADATA_WORKERS", "2"))
+THUMBNAIL_WIDTH = 400
+THUMBNAIL_FOLDER = "pdf_previews"
+# Text kept for search
+MAX_TEXT_PAGES = 50
+MAX_TEXT_LENGTH = 200_000
+
+_executor = None
+
+
+def field_names(model, base):
+    names = {field.name for field in model._meta.concrete_fields}
+    localized = [f"{base}_{code}" for code in LANGUAGES]
+    if all(name in names for name in localized):
+        return localized
+    return [base]
+
+
+def pdf_fields(model):
+    """Concrete PDF field names of ``model``"""
+    names = []
+    for base in PDF_FIELDS.get(model._meta.label_lower, []):
+        names += field_names(model, base)
+    return names
+
+
+# ------------------------------------------------------------- extraction
+
+
+def extract(content):
+    """Page count, title and text of PDF bytes (needs ``pypdf``)"""
+    if pypdf is None:
+        raise RuntimeError("pypdf is not installed")
+    reader = pypdf.PdfReader(io.BytesIO(content))
+    metadata = reader.metadata
+    text = []
+    length = 0
+    for page in reader.pages[:MAX_TEXT_PAGES]:
+        page_text = page.extract_text() or ""
+        text.append(page_text)
+        length += len(page_text)
+        if length >= MAX_TEXT_LENGTH:
+            break
+    return {
+        "page_count": len(reader.pages),
+        "title": ((metadata.title if metadata else None) or "").strip()[:500],
+        "text": "\n".join(text)[:MAX_TEXT_LENGTH],
+    }
+
+
+def render_thumbnail(content):
+    """JPEG of the first page, ``None`` without ``pypdfium2``"""
+    if pypdfium2 is None:
+        return None
+    document = pypdfium2.PdfDocument(content)
+    try:
+        page = document[0]
+        scale = THUMBNAIL_WIDTH / max(page.get_width(), 1)
+        image = page.render(scale=scale).to_pil().convert("RGB")
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=80, optimize=True)
+        return output.getvalue()
+    finally:
+        document.close()
+
+
+def process(name, storage=None, model=""):
+    """Read the file once and fill its ``PdfDocument``"""
+    from .models import PdfDocument
+
+    storage = storage or default_storage
+    document, _created = PdfDocument.objects.get_or_create(
+        name=name, defaults={"model": model}
+    )
+    try:
+        with storage.open(name, "rb") as file:
+            content = file.read()
+        fields = extract(content)
+        thumbnail = render_thumbnail(content)
+        if thumbnail:
+            digest = hashlib.sha256(content).hexdigest()
+            fields["thumbnail"] = f"{THUMBNAIL_FOLDER}/{digest}.jpg"
+            if not default_storage.exists(fields["thumbnail"]):
+                fields["thumbnail"] = default_storage.save(
+                    fields["thumbnail"], ContentFile(thumbnail)
+                )
+        fields.update(size=len(content), status=PdfDocument.DONE, error="")
+    except Exception as e:
+        logger.warning("PDF metadata of %s failed: %s", name, e)
+        fields = {"status": PdfDocument.FAILED, "error": str(e)[:1000]}
+    for key, value in fields.items():
+        setattr(document, key, value)
+    document.processed_at = timezone.now()
+    document.save()
+    if document.status == PdfDocument.DONE and pdf_optimization.enabled():
+        try:
+            pdf_optimization.optimize_document(document, content)
+        except Exception as e:
+            logger.warning("PDF optimization of %s failed: %s", name, e)
+    if document.model:
+        # Cached pages of the owning model embed the metadata
+        try:
+            bump_data_version(apps.get_model(document.model))
+        except LookupError:
+            pass
+    return document
+
+
+def _run(name, storage, model):
+    close_old_connections()
+    try:
+        process(name, storage, model)
+    except Exception:
+        logger.exception("PDF metadata of %s failed", name)
+    finally:
+        close_old_connections()
+
+
+def schedule(name, storage, model=""):
+    """Process ``name`` in the background"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=WORKERS, thread_name_prefix="pdf-metadata"
+        )
+    _executor.submit(_run, name, storage, model)
+
+
+def pending_files():
+    """``(name, storage, model)`` of PDFs without metadata (or with a failure)"""
+    from .models import PdfDocument
+
+    done = set(
+        PdfDocument.objects.filter(status=PdfDocument.DONE).values_list(
+            "name", flat=True
+        )
+    )
+    seen = set()
+    for label in PDF_FIELDS:
+        model = apps.get_model(label)
+        for name in pdf_fields(model):
+            field = model._meta.get_field(name)
+            values = (
+                model._default_manager.exclude(**{f"{name}__isnull": True})
+                .exclude(**{name: ""})
+                .values_list(name, flat=True)
+                .distinct()
+            )
+            for value in values.iterator():
+                if value not in done and value not in seen:
+                    seen.add(value)
+                    yield value, field.storage, label
+
+
+def stored_references():
+    """Columns of ``PdfDocument`` holding names in the default storage"""
+    from .models import PdfDocument
+
+    yield PdfDocument, "thumbnail"
+    yield PdfDocument, "optimized"
+
+
+# ---------------------------------------------------------------- signals
+
+
+def _on_save(sender, instance, **kwargs):
+    from .models import PdfDocument
+
+    files = {}
+    for name in pdf_fields(sender):
+        fieldfile = getattr(instance, name)
+        if fieldfile and fieldfile.name:
+            files[fieldfile.name] = fieldfile.storage
+    if not files:
+        return
+    known = set(
+        PdfDocument.objects.filter(name__in=files).values_list("name", flat=True)
+    )
+    label = sender._meta.label_lower
+    for name, storage in files.items():
+        if name not in known:
+            transaction.on_commit(
+                lambda name=name, storage=storage: schedule(name, storage, label)
+            )
+
+
+def connect_signals():
+    for label in PDF_FIELDS:
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        post_save.connect(_on_save, sender=model, dispatch_uid=f"pdf-metadata-{label}")
+
+
+# ------------------------------------------------------------ serializers
+
+
+def _info_map():
+    from .models import PdfDocument
+
+    info = {}
+    rows = PdfDocument.objects.filter(status=PdfDocument.DONE).values_list(
+        "name", "size", "page_count", "title", "thumbnail"
+    )
+    for name, size, page_count, title, thumbnail in rows:
+        info[name] = {
+            "size": size,
+            "pages": page_count,
+            "title": title or None,
+            "thumbnail": default_storage.url(thumbnail) if thumbnail else None,
+        }
+    return info
+
+
+def pdf_info(name, context=None):
+    """
+    Metadata of a stored PDF for API responses, ``None`` if not processed.
+    Pass the serializer ``context`` to read the metadata once per response.
+    """
+    from .models import PdfDocument
+
+    if not name:
+        return None
+    return context_cached(context, "pdf-info", [PdfDocument], _info_map).get(name)
+
+
+@extend_schema_field(
+    {
+        "type": "object",
+        "nullable": True,
+        "properties": {
+            "size": {"type": "integer"},
+            "pages": {"type": "integer"},
+            "title": {"type": "string", "nullable": True},
+            "thumbnail": {"type": "string", "nullable": True},
+        },
+    }
+)
+class PdfInfoField(serializers.Field):
+    """
+    Size, pages, title and thumbnail URL of the PDF in ``base`` (``pdf`` reads
+    ``pdf_<language>`` on localized models).
+    """
+
+    def __init__(self, base, **kwargs):
+        self.base = base
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+
+    def _language(self):
+        language = self.context.get("language") or self.context.get("lang")
+        if not language and self.context.get("request") is not None:
+            language = request_language(self.context["request"])
+        return normalize_language(language)
+
+    def to_representation(self, instance):
+        names = field_names(type(instance), self.base)
+        if len(names) > 1:
+            fieldfile = getattr(instance, f"{self.base}_{self._language()}", None)
+        else:
+            fieldfile = getattr(instance, self.base, None)
+        return pdf_info(fieldfile.name if fieldfile else None, self.context)
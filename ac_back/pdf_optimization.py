@@ -0,0 +1,204 @@
+"""
+Optimized copies of published PDFs.
+
+Scanned PDFs are often stored with uncompressed or oversized page images.
+``optimize`` rewrites a PDF with ``pypdf``:
+
+* page images without transparency are downscaled to ``MAX_IMAGE_SIDE`` and
+  re-encoded as JPEG when that makes them smaller (bilevel scans are left
+  alone: CCITT/JBIG2 beats JPEG there);
+* content streams are deflated and identical objects merged;
+* with ``pikepdf`` (qpdf) installed, the result is linearized ("fast web
+  view") so browsers show page one before the download finishes.
+
+The copy is saved next to the thumbnails (``pdf_optimized/<sha256>.pdf``) and
+recorded on the ``PdfDocument``; the original file and field value are never
+touched. ``optimized_url`` is what the serializers link to. Runs after the
+metadata extraction when ``PDF_OPTIMIZATION`` is on, or through
+``manage.py optimize_pdfs``.
+"""
+
+import hashlib
+import io
+import logging
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from .data_version import bump_data_version, context_cached
+
+try:
+    import pypdf
+except ImportError:  # optional dependency
+    pypdf = None
+
+try:
+    import pikepdf
+except ImportError:  # optional dependency
+    pikepdf = None
+
+logger = logging.getLogger(__name__)
+
+OPTIMIZED_FOLDER = "pdf_optimized"
+MAX_IMAGE_SIDE = 2000
+JPEG_QUALITY = 75
+# Smaller images aren't worth re-encoding
+MIN_IMAGE_BYTES = 32 * 1024
+# Keep the copy only if it saves at least this share (or is linearized)
+MIN_SAVING = 0.05
+
+
+def enabled():
+    return getattr(settings, "PDF_OPTIMIZATION", False)
+
+
+def _stream_length(xobject):
+    # Encoded size: pypdf only writes /Length on output
+    return len(getattr(xobject.get_object(), "_data", b"") or b"")
+
+
+def _recompress_image(image_file):
+    """Replace one page image with a smaller JPEG; returns the bytes saved"""
+    xobject = image_file.indirect_reference.get_object()
+    if any(key in xobject for key in ("/SMask", "/Mask", "/ImageMask")):
+        return 0
+    if xobject.get("/BitsPerComponent") == 1:
+        return 0
+    before = _stream_length(xobject)
+    if before < MIN_IMAGE_BYTES:
+        return 0
+    image = image_file.image
+    if image.mode not in ("RGB", "L"):
+        return 0
+    if max(image.size) > MAX_IMAGE_SIDE:
+        image = image.copy()
+        image.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+    encoded = io.BytesIO()
+    image.save(encoded, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    if encoded.tell() >= before:
+        return 0
+    image_file.replace(image, quality=JPEG_QUALITY)
+    return before - _stream_length(image_file.indirect_reference)
+
+
+def linearize(content):
+    """Linearized ``content``, ``None`` without ``pikepdf``"""
+    if pikepdf is None:
+        return None
+    output = io.BytesIO()
+    with pikepdf.open(io.BytesIO(content)) as document:
+        document.save(
+            output,
+            linearize=True,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+    return output.getvalue()
+
+
+def optimize(content):
+    """``(optimized bytes, linearized)`` of PDF bytes (needs ``pypdf``)"""
+    if pypdf is None:
+        raise RuntimeError("pypdf is not installed")
+    writer = pypdf.PdfWriter(clone_from=pypdf.PdfReader(io.BytesIO(content)))
+    for page in writer.pages:
+        for image_file in page.images:
+            try:
+                _recompress_image(image_file)
+            except Exception as e:
+                # Exotic color spaces/filters: leave the image as it is
+                logger.debug("Image %s kept: %s", image_file.name, e)
+        page.compress_content_streams()
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    output = io.BytesIO()
+    writer.write(output)
+    optimized = output.getvalue()
+
+    linearized = linearize(optimized)
+    if linearized is not None:
+        return linearized, True
+    return optimized, False
+
+
+def optimize_document(document, content=None, storage=None):
+    """Build and record the optimized copy of a ``PdfDocument``"""
+    if content is None:
+        with (storage or default_storage).open(document.name, "rb") as file:
+            content = file.read()
+    optimized, linearized = optimize(content)
+    document.optimized_at = timezone.now()
+    if linearized or len(optimized) <= len(content) * (1 - MIN_SAVING):
+        digest = hashlib.sha256(content).hexdigest()
+        name = f"{OPTIMIZED_FOLDER}/{digest}.pdf"
+        if not default_storage.exists(name):
+            name = default_storage.save(name, ContentFile(optimized))
+        document.optimized = name
+        document.optimized_size = len(optimized)
+        document.linearized = linearized
+    else:
+        # Already compact: serve the original
+        document.optimized = ""
+        document.optimized_size = None
+        document.linearized = False
+    document.save(
+        update_fields=["optimized", "optimized_size", "linearized", "optimized_at"]
+    )
+    if document.model:
+        try:
+            bump_data_version(apps.get_model(document.model))
+        except LookupError:
+            pass
+    return document
+
+
+def _optimized_map():
+    from .models import PdfDocument
+
+    rows = PdfDocument.objects.exclude(optimized="").values_list("name", "optimized")
+    return dict(rows)
+
+
+def optimized_url(fieldfile, context=None):
+    """
+    URL of the optimized copy of ``fieldfile``, or of the file itself. Pass the
+    serializer ``context`` to read the copies once per response.
+    """
+    from .models import PdfDocument
+
+    optimized = context_cached(
+        context, "pdf-optimized", [PdfDocument], _optimized_map
+    )
+    name = optimized.get(fieldfile.name)
+    if name:
+        return default_storage.url(name)
+    return fieldfile.url
+
+
+def savings_report():
+    """Per model: documents, optimized copies, their original and optimized bytes"""
+    from .models import PdfDocument
+
+    has_copy = ~Q(optimized="")
+    rows = (
+        PdfDocument.objects.filter(status=PdfDocument.DONE)
+        .values("model")
+        .annotate(
+            documents=Count("id"),
+            optimized_count=Count("id", filter=has_copy),
+            total_size=Sum("size"),
+            original_size=Sum("size", filter=has_copy),
+            optimized_size=Sum("optimized_size", filter=has_copy),
+        )
+        .order_by("model")
+    )
+    report = []
+    for row in rows:
+        for key in ("total_size", "original_size", "optimized_size"):
+            row[key] = row[key] or 0
+        row["saved"] = row["original_size"] - row["optimized_size"]
+        report.append(row)
+    return report
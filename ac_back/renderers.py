@@ -0,0 +1,58 @@
+"""
+orjson / MessagePack renderers.
+
+``ORJSONRenderer`` replaces DRF's ``JSONRenderer`` (stdlib ``json``): orjson
+encodes the large HTML-rich payloads several times faster and writes UTF-8
+bytes directly. Types orjson does not know natively (``Decimal``, lazy
+translation strings, querysets, ...) go through DRF's own ``JSONEncoder``, so
+the output matches the previous renderer.
+
+``MessagePackRenderer`` is available when ``msgpack`` is installed; clients
+opt in with ``Accept: application/msgpack`` (or ``?format=msgpack``).
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+_encoder = JSONEncoder()
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def encode_default(obj):
+    """Fallback for types without a native orjson/msgpack encoding"""
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        options = ORJSON_OPTIONS
+        # Honour "Accept: application/json; indent=4" like DRF does (orjson
+        # only supports two-space indentation)
+        if accepted_media_type and "indent=" in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=encode_default, option=options)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
@@ -0,0 +1,489 @@
+"""
+Save-time post-processing of CKEditor HTML.
+
+``CKEDITOR_CONFIGS`` allows any content, so pasted images end up in the
+columns as ``data:`` URIs and ``<img>`` tags carry their size in inline
+styles. When a model with rich-text fields is saved, each field is rewritten
+once and the result stored in ``RichTextHtml`` (the source column is left as
+the editor wrote it):
+
+* ``data:image/...;base64`` images are saved to the default storage
+  (``rich_text/<sha256>.<ext>``) and referenced by URL;
+* ``<img>`` gets ``width``/``height`` (from the inline style, or the image
+  itself), ``loading="lazy"``, ``decoding="async"`` and a ``srcset`` of
+  narrower variants (Cloudinary transformations, or resized copies saved next
+  to the extracted images);
+* vendor/Word (``mso-``) declarations, global keywords and no-op values are
+  dropped from ``style`` attributes, and ``<span>`` wrappers left without
+  attributes are unwrapped.
+
+``rich_html`` / ``localized_rich_html`` return the processed HTML when it was
+built from the current value (rows changed with ``update()`` fall back to the
+source). ``manage.py process_rich_text`` processes existing rows.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import mimetypes
+import re
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import unquote
+
+from ckeditor.fields import RichTextField
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_save
+from rest_framework import serializers
+
+from .localization import fallback_chain
+
+try:
+    from PIL import Image
+except ImportError:  # optional dependency
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Text fields edited with CKEditor that aren't RichTextFields
+EXTRA_FIELDS = {
+    "news.newstranslation": ["content"],
+}
+
+IMAGE_FOLDER = "rich_text"
+SRCSET_WIDTHS = (480, 960, 1600)
+DATA_URI_RE = re.compile(r"^data:(image/[\w.+-]+);base64,(.*)$", re.S)
+CLOUDINARY_RE = re.compile(
+    r"^(?P<prefix>https?://res\.cloudinary\.com/[^/]+/image/upload/)"
+    r"(?:v\d+/)?(?P<public_id>[^?#]+?)(?:\.\w+)?$"
+)
+DECLARATION_RE = re.compile(r"([-\w]+)\s*:\s*((?:[^;(]|\([^)]*\))+)")
+PX_RE = re.compile(r"^(\d+(?:\.\d+)?)(?:px)?$")
+
+REDUNDANT_PREFIXES = ("mso-", "-webkit-", "-moz-", "-ms-")
+REDUNDANT_VALUES = {"inherit", "initial", "unset"}
+REDUNDANT_DECLARATIONS = {
+    ("background-color", "transparent"),
+    ("background", "transparent"),
+    ("vertical-align", "baseline"),
+    ("font-style", "normal"),
+    ("font-variant", "normal"),
+    ("font-variant-ligatures", "normal"),
+    ("font-variant-caps", "normal"),
+    ("font-variant-numeric", "normal"),
+    ("font-variant-east-asian", "normal"),
+    ("font-variant-position", "normal"),
+    ("text-decoration-skip-ink", "auto"),
+    ("white-space", "normal"),
+}
+
+
+def rich_fields(model):
+    """Names of the CKEditor fields of ``model``"""
+    names = [
+        field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, RichTextField)
+    ]
+    return names + EXTRA_FIELDS.get(model._meta.label_lower, [])
+
+
+def source_hash(value):
+    return hashlib.sha256((value or "").encode()).hexdigest()
+
+
+# ------------------------------------------------------------------ styles
+
+
+def clean_style(style):
+    """``style`` without redundant declarations (last one wins)"""
+    declarations = {}
+    for prop, value in DECLARATION_RE.findall(style or ""):
+        prop = prop.lower()
+        value = value.strip()
+        if prop.startswith(REDUNDANT_PREFIXES):
+            continue
+        if value.lower() in REDUNDANT_VALUES:
+            continue
+        if (prop, value.lower()) in REDUNDANT_DECLARATIONS:
+            continue
+        declarations.pop(prop, None)
+        declarations[prop] = value
+    return declarations
+
+
+def format_style(declarations):
+    return "; ".join(f"{prop}: {value}" for prop, value in declarations.items())
+
+
+def _pixels(value):
+    match = PX_RE.match((value or "").strip())
+    return round(float(match.group(1))) if match else None
+
+
+# ------------------------------------------------------------------ images
+
+
+def _save_image(name, content):
+    if not default_storage.exists(name):
+        name = default_storage.save(name, ContentFile(content))
+    return default_storage.url(name)
+
+
+def _extension(content_type):
+    if content_type == "image/jpeg":
+        return "jpg"
+    return (mimetypes.guess_extension(content_type) or ".bin").lstrip(".")
+
+
+def _open_image(content):
+    if Image is None or not content:
+        return None
+    try:
+        image = Image.open(io.BytesIO(content))
+        image.size  # header parsed
+        return image
+    except Exception:
+        return None
+
+
+def _resized_variants(image, digest, extension, content_type):
+    """``[(url, width)]`` of narrower copies of an extracted/local image"""
+    if content_type == "image/gif" or image.format not in ("JPEG", "PNG", "WEBP"):
+        return []
+    variants = []
+    for width in SRCSET_WIDTHS:
+        if width >= image.width:
+            break
+        copy = image.copy()
+        copy.thumbnail((width, image.height))
+        output = io.BytesIO()
+        copy.save(output, image.format, quality=80, optimize=True)
+        url = _save_image(
+            f"{IMAGE_FOLDER}/{digest}_{width}.{extension}", output.getvalue()
+        )
+        variants.append((url, width))
+    return variants
+
+
+def _cloudinary_size(public_id):
+    from .models import StoredFile
+
+    row = (
+        StoredFile.objects.filter(public_id=public_id)
+        .exclude(width=None)
+        .values_list("width", "height")
+        .first()
+    )
+    return row or (None, None)
+
+
+def _local_content(src):
+    """Bytes of a file referenced by a ``MEDIA_URL`` URL, ``None`` otherwise"""
+    media_url = settings.MEDIA_URL or ""
+    if not media_url or not src.startswith(media_url):
+        return None
+    try:
+        with default_storage.open(unquote(src[len(media_url) :]), "rb") as file:
+            return file.read()
+    except Exception:
+        return None
+
+
+def rewrite_img(attrs):
+    """Attributes of a processed ``<img>``"""
+    src = (attrs.get("src") or "").strip()
+    width = _pixels(attrs.get("width"))
+    height = _pixels(attrs.get("height"))
+
+    declarations = clean_style(attrs.get("style"))
+    style_width = _pixels(declarations.get("width"))
+    style_height = _pixels(declarations.get("height"))
+    if style_width:
+        width = style_width
+        declarations.pop("width")
+    if style_height:
+        height = style_height
+        declarations.pop("height")
+
+    intrinsic = (None, None)
+    variants = []
+    data_uri = DATA_URI_RE.match(src)
+    cloudinary = CLOUDINARY_RE.match(src)
+    if data_uri:
+        content_type = data_uri.group(1).lower()
+        try:
+            content = base64.b64decode(data_uri.group(2), validate=False)
+        except (binascii.Error, ValueError):
+            content = None
+        if content:
+            digest = hashlib.sha256(content).hexdigest()
+            extension = _extension(content_type)
+            src = _save_image(f"{IMAGE_FOLDER}/{digest}.{extension}", content)
+            image = _open_image(content)
+            if image is not None:
+                intrinsic = image.size
+                variants = _resized_variants(image, digest, extension, content_type)
+    elif cloudinary:
+        intrinsic = _cloudinary_size(cloudinary.group("public_id"))
+        rest = src[len(cloudinary.group("prefix")) :]
+        variants = [
+            (f"{cloudinary.group('prefix')}w_{size},c_limit,q_auto,f_auto/{rest}", size)
+            for size in SRCSET_WIDTHS
+            if not intrinsic[0] or size < intrinsic[0]
+        ]
+    else:
+        content = _local_content(src)
+        image = _open_image(content)
+        if image is not None:
+            intrinsic = image.size
+            digest = hashlib.sha256(content).hexdigest()
+            content_type = Image.MIME.get(image.format, "")
+            variants = _resized_variants(
+                image, digest, _extension(content_type), content_type
+            )
+
+    intrinsic_width, intrinsic_height = intrinsic
+    if intrinsic_width and intrinsic_height:
+        if width and not height:
+            height = round(width * intrinsic_height / intrinsic_width)
+        elif height and not width:
+            width = round(height * intrinsic_width / intrinsic_height)
+        elif not width and not height:
+            width, height = intrinsic_width, intrinsic_height
+
+    attrs["src"] = src
+    if width:
+        attrs["width"] = str(width)
+    if height:
+        attrs["height"] = str(height)
+    if declarations:
+        attrs["style"] = format_style(declarations)
+    else:
+        attrs.pop("style", None)
+    attrs.setdefault("loading", "lazy")
+    attrs.setdefault("decoding", "async")
+    if variants and "srcset" not in attrs:
+        candidates = [f"{url} {size}w" for url, size in variants]
+        if intrinsic_width:
+            candidates.append(f"{src} {intrinsic_width}w")
+        attrs["srcset"] = ", ".join(candidates)
+        display = width or intrinsic_width
+        attrs["sizes"] = (
+            f"(max-width: {display}px) 100vw, {display}px" if display else "100vw"
+        )
+    return attrs
+
+
+# -------------------------------------------------------------------- HTML
+
+
+def _format_attrs(attrs):
+    parts = []
+    for name, value in attrs.items():
+        parts.append(name if value is None else f'{name}="{escape(value)}"')
+    return "".join(f" {part}" for part in parts)
+
+
+class _Rewriter(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.output = []
+        # Whether each open <span> was kept
+        self.spans = []
+
+    def _start(self, tag, attrs, closed):
+        attrs = dict(attrs)
+        original = dict(attrs)
+        if "style" in attrs:
+            declarations = clean_style(attrs["style"])
+            if declarations:
+                attrs["style"] = format_style(declarations)
+            else:
+                del attrs["style"]
+        if tag == "img":
+            attrs = rewrite_img(attrs)
+        if tag == "span" and not closed:
+            keep = bool(attrs)
+            self.spans.append(keep)
+            if not keep:
+                return
+        if attrs == original:
+            self.output.append(self.get_starttag_text())
+        else:
+            end = " />" if closed else ">"
+            self.output.append(f"<{tag}{_format_attrs(attrs)}{end}")
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag, attrs, closed=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag, attrs, closed=True)
+
+    def handle_endtag(self, tag):
+        if tag == "span" and self.spans and not self.spans.pop():
+            return
+        self.output.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        self.output.append(data)
+
+    def handle_entityref(self, name):
+        self.output.append(f"&{name};")
+
+    def handle_charref(self, name):
+        self.output.append(f"&#{name};")
+
+    def handle_comment(self, data):
+        self.output.append(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self.output.append(f"<!{decl}>")
+
+    def handle_pi(self, data):
+        self.output.append(f"<?{data}>")
+
+    def unknown_decl(self, data):
+        self.output.append(f"<![{data}]>")
+
+
+def process_html(html):
+    """Processed copy of CKEditor ``html``"""
+    if not html:
+        return html or ""
+    rewriter = _Rewriter()
+    rewriter.feed(html)
+    rewriter.close()
+    return "".join(rewriter.output)
+
+
+# ----------------------------------------------------------------- storage
+
+
+def process_instance(instance, fields=None):
+    """Build the ``RichTextHtml`` rows of ``instance``; returns how many changed"""
+    from .models import RichTextHtml
+
+    label = instance._meta.label_lower
+    object_id = str(instance.pk)
+    existing = dict(
+        RichTextHtml.objects.filter(model=label, object_id=object_id).values_list(
+            "field", "source_hash"
+        )
+    )
+    changed = 0
+    for name in fields or rich_fields(type(instance)):
+        value = getattr(instance, name) or ""
+        digest = source_hash(value)
+        if existing.get(name) == digest or (not value and name not in existing):
+            continue
+        try:
+            html = process_html(value)
+        except Exception:
+            logger.exception("Processing %s.%s of %s failed", label, name, object_id)
+            continue
+        RichTextHtml.objects.update_or_create(
+            model=label,
+            object_id=object_id,
+            field=name,
+            defaults={
+                "source_hash": digest,
+                "html": html,
+                "source_size": len(value),
+            },
+        )
+        changed += 1
+    return changed
+
+
+def _on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(lambda: process_instance(instance))
+
+
+def rich_text_models():
+    return [model for model in apps.get_models() if rich_fields(model)]
+
+
+def stored_references():
+    """
+    Texts that embed URLs of stored files: the CKEditor fields (uploads) and
+    the processed HTML (extracted images and their resized copies)
+    """
+    from .models import RichTextHtml
+
+    for model in rich_text_models():
+        for name in rich_fields(model):
+            yield model, model._meta.get_field(name).attname
+    yield RichTextHtml, "html"
+
+
+def connect_signals():
+    for model in rich_text_models():
+        post_save.connect(
+            _on_save,
+            sender=model,
+            dispatch_uid=f"rich-text-{model._meta.label_lower}",
+        )
+
+
+# ----------------------------------------------------------------- reading
+
+
+def attach_rich_html(instances):
+    """Load the processed HTML of ``instances`` with one query"""
+    from .models import RichTextHtml
+
+    instances = [instance for instance in instances if instance.pk is not None]
+    if not instances:
+        return instances
+    label = instances[0]._meta.label_lower
+    rows = RichTextHtml.objects.filter(
+        model=label, object_id__in=[str(instance.pk) for instance in instances]
+    ).values_list("object_id", "field", "source_hash", "html")
+    loaded = {str(instance.pk): {} for instance in instances}
+    for object_id, field, digest, html in rows:
+        loaded[object_id][field] = (digest, html)
+    for instance in instances:
+        instance._rich_html = loaded[str(instance.pk)]
+    return instances
+
+
+def rich_html(instance, name, value=None):
+    """Processed HTML of field ``name``, or its value when not processed yet"""
+    if value is None:
+        value = getattr(instance, name)
+    if not value:
+        return value
+    if "_rich_html" not in instance.__dict__:
+        attach_rich_html([instance])
+    digest, html = instance._rich_html.get(name, (None, None))
+    if digest == source_hash(value):
+        return html
+    return value
+
+
+def localized_rich_html(instance, base, language):
+    """``rich_html`` of the first non-empty ``<base>_<language>`` (ru fallback)"""
+    for code in fallback_chain(language):
+        name = f"{base}_{code}"
+        value = getattr(instance, name, None)
+        if value:
+            return rich_html(instance, name, value)
+    return ""
+
+
+class RichHtmlListSerializer(serializers.ListSerializer):
+    """Loads the processed HTML of the whole page at once"""
+
+    def to_representation(self, data):
+        instances = list(data.all() if hasattr(data, "all") else data)
+        attach_rich_html(instances)
+        return super().to_representation(instances)
@@ -0,0 +1,130 @@
+"""
+Enumeration of the GET routes exposed by the URL resolver.
+
+Used by the management commands that need to replay every public endpoint
+(index advisor, cache warm-up).
+"""
+
+import re
+from urllib.parse import quote
+
+from django.core.exceptions import FieldDoesNotExist
+from django.test import RequestFactory
+from django.urls import URLPattern, URLResolver, get_resolver
+
+# Anything that still looks like a regex / converter after cleaning means the
+# route needs arguments (detail routes, format suffixes).
+PARAMETER_RE = re.compile(r"[<>(\[\\?*+|]")
+# A named regex group or a path converter: ``(?P<pk>[^/.]+)``, ``<int:pk>``
+NAMED_PARAMETER_RE = re.compile(r"\(\?P<(\w+)>[^)]*\)|<(?:\w+:)?(\w+)>")
+
+
+def _clean(pattern):
+    route = str(pattern)
+    if route.startswith("^"):
+        route = route[1:]
+    if route.endswith("$"):
+        route = route[:-1]
+    return route
+
+
+def _allows_get(callback):
+    actions = getattr(callback, "actions", None)
+    if actions is not None:  # DRF ViewSet
+        return "get" in actions
+    view_class = getattr(callback, "cls", None) or getattr(callback, "view_class", None)
+    if view_class is not None:
+        return hasattr(view_class, "get")
+    return True
+
+
+def iter_routes(patterns=None, prefix=""):
+    """Yield ``(route, URLPattern)`` for every pattern, routes unprefixed by '/'"""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for entry in patterns:
+        route = prefix + _clean(entry.pattern)
+        if isinstance(entry, URLResolver):
+            yield from iter_routes(entry.url_patterns, route)
+        elif isinstance(entry, URLPattern):
+            yield route, entry
+
+
+def get_routes(prefix="/api/", with_parameters=False):
+    """
+    Sorted list of GET routes under ``prefix``.
+
+    Routes with parameters are included (unresolved) only when
+    ``with_parameters`` is set.
+    """
+    routes = set()
+    for route, entry in iter_routes():
+        url = "/" + route
+        if not url.startswith(prefix) or not _allows_get(entry.callback):
+            continue
+        if PARAMETER_RE.search(route) and not with_parameters:
+            continue
+        routes.add(url)
+    return sorted(routes)
+
+
+def _detail_view(callback):
+    """Instance of the DRF view behind ``callback`` with a dummy GET request"""
+    from rest_framework.generics import GenericAPIView
+    from rest_framework.request import Request
+
+    view_class = getattr(callback, "cls", None)
+    if view_class is None or not issubclass(view_class, GenericAPIView):
+        return None
+    view = view_class(**(getattr(callback, "initkwargs", None) or {}))
+    view.request = Request(RequestFactory().get("/"))
+    view.args, view.kwargs, view.format_kwarg = (), {}, None
+    actions = getattr(callback, "actions", None) or {}
+    view.action = actions.get("get")
+    return view
+
+
+def _lookup_values(view, limit):
+    queryset = view.get_queryset()
+    try:
+        queryset.model._meta.get_field("is_active")
+    except FieldDoesNotExist:
+        pass
+    else:
+        queryset = queryset.filter(is_active=True)
+    values = queryset.values_list(view.lookup_field, flat=True)
+    return list(values[:limit] if limit else values)
+
+
+def get_detail_routes(prefix="/api/", limit=None):
+    """
+    ``[(route, url)]`` of the GET detail routes under ``prefix``, e.g.
+    ``("/api/news/{pk}/", "/api/news/7/")``,
+    resolved with the lookup values of active rows (at most ``limit`` per
+    route). Routes with other parameters, or whose view cannot list its rows
+    without a real request, are skipped.
+    """
+    results = []
+    for route, entry in iter_routes():
+        url = "/" + route
+        if not url.startswith(prefix) or not _allows_get(entry.callback):
+            continue
+        parameters = NAMED_PARAMETER_RE.findall(route)
+        if len(parameters) != 1:
+            continue
+        try:
+            view = _detail_view(entry.callback)
+            if view is None:
+                continue
+            kwarg = view.lookup_url_kwarg or view.lookup_field
+            if kwarg not in parameters[0]:
+                continue
+            values = _lookup_values(view, limit)
+        except Exception:
+            continue
+        pattern = NAMED_PARAMETER_RE.sub("{%s}" % kwarg, url)
+        for value in values:
+            resolved = NAMED_PARAMETER_RE.sub(quote(str(value), safe=""), url)
+            if not PARAMETER_RE.search(resolved):
+                results.append((pattern, resolved))
+    return sorted(set(results))
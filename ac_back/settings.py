@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from importlib.util import find_spec
 from pathlib import Path
 import dj_database_url
 from dotenv import load_dotenv
@@ -60,6 +61,7 @@ INSTALLED_APPS = [
     "django_filters",
     # 'drf_yasg', удалил, так как используется drf_spectacular
     # Local apps
+    "ac_back",  # Общие management-команды проекта
     "students",
     "leadership_structure",
     "admission",
@@ -87,6 +89,7 @@ INSTALLED_APPS = [
     "sport_achievements", # Приложение для спортивных достижений
     "administrative_structure",
     "journal",
+    "changes",  # Журнал изменений для синхронизации клиентов
     
 ]
 
@@ -94,8 +97,10 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "ac_back.compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "ac_back.middleware.LanguageMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -132,6 +137,33 @@ DATABASES = {
 }
 
 
+# Cache
+# Shared Redis cache when REDIS_URL is set: data versions bumped by a save in
+# one worker (ac_back.data_version) must invalidate cached data in all of them
+
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                # Heroku Redis uses self-signed certificates
+                "CONNECTION_POOL_KWARGS": {"ssl_cert_reqs": None}
+                if os.getenv("REDIS_URL", "").startswith("rediss://")
+                else {},
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# Warm the shared cache in the release phase (manage.py warm_cache --release)
+WARM_CACHE_ON_RELEASE = os.getenv("WARM_CACHE_ON_RELEASE", "").lower() in ("1", "true")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -198,7 +230,7 @@ cloudinary.config(
 # Cloudinary Storage Settings (Django 4.2+ format)
 STORAGES = {
     "default": {
-        "BACKEND": "ac_back.storage.RawMediaCloudinaryStorage",
+        "BACKEND": "ac_back.storage.MediaRouterStorage",
     },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
@@ -211,6 +243,13 @@ STORAGES = {
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Local files served by views (ac_back/file_serving.py): "" for FileResponse
+# (sendfile), "x-accel-redirect" behind nginx, "x-sendfile" behind Apache
+FILE_SERVING = os.getenv("FILE_SERVING", "")
+FILE_SERVING_INTERNAL_PREFIX = os.getenv(
+    "FILE_SERVING_INTERNAL_PREFIX", "/protected-media/"
+)
+
 
 cloudinary.config(
     cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
@@ -219,6 +258,22 @@ cloudinary.config(
     secure=True,
 )
 
+# Direct browser uploads from the admin (ac_back/direct_upload.py): another
+# upload API base URL, e.g. the local fake endpoint /admin-upload/fake
+DIRECT_UPLOAD_URL = os.getenv("DIRECT_UPLOAD_URL", "")
+DIRECT_UPLOAD_FAKE = os.getenv("DIRECT_UPLOAD_FAKE", "").lower() in ("1", "true")
+
+# Optimized (recompressed, linearized) copies of uploaded PDFs, served
+# instead of the originals (ac_back/pdf_optimization.py)
+PDF_OPTIMIZATION = os.getenv("PDF_OPTIMIZATION", "").lower() in ("1", "true")
+
+# Plain-text excerpts of list/card texts (ac_back/excerpts.py)
+EXCERPT_LENGTH = int(os.getenv("EXCERPT_LENGTH", "200"))
+READING_WPM = int(os.getenv("READING_WPM", "200"))
+
+# Rows fetched per query by the CSV/XLSX exports (ac_back/export.py)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -226,6 +281,7 @@ cloudinary.config(
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Django REST Framework settings
+DRF_BROWSABLE_API = os.getenv("DRF_BROWSABLE_API", "").lower() in ("1", "true")
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
@@ -233,6 +289,18 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "ac_back.renderers.ORJSONRenderer",
+        *(["ac_back.renderers.MessagePackRenderer"] if find_spec("msgpack") else []),
+        # The browsable API only where explicitly enabled (DEBUG is always on here)
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if DRF_BROWSABLE_API else []),
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "ac_back.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+        *(["ac_back.parsers.MessagePackParser"] if find_spec("msgpack") else []),
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_FILTER_BACKENDS": [
@@ -243,16 +311,6 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
-# drf-spectacular settings
-SPECTACULAR_SETTINGS = {
-    "TITLE": "Academy Management API",
-    "DESCRIPTION": "API for Academy Management System - About Section",
-    "VERSION": "1.0.0",
-    "SERVE_INCLUDE_SCHEMA": False,
-    "COMPONENT_SPLIT_REQUEST": True,
-    "SCHEMA_PATH_PREFIX": "/api",
-}
-
 # CORS settings for frontend integration
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",  # React default
@@ -0,0 +1,82 @@
+"""
+Process-local cache for "the one row" content models.
+
+Pages like the Student Scientific Society info, the administrative structure
+or the history/mission blocks read the same few rows on every request. The
+rows are kept in a dict of the worker process and revalidated against the data
+versions of their models (``ac_back.data_version``) — with the Redis cache
+configured that is one Redis round trip and no database query; a save in any
+process (another worker, the admin, a shell or a management command) makes
+every worker reload on its next request, including workers that have not
+read the row yet.
+
+Entries also expire after ``LOCAL_TIMEOUT`` seconds, which bounds staleness
+when the cache backend is per-process memory (development, no ``REDIS_URL``).
+Nothing here ever writes to the database.
+"""
+
+import time
+
+from rest_framework.response import Response
+
+from .data_version import get_data_version
+
+LOCAL_TIMEOUT = 300
+
+_local = {}
+
+
+def _cached(name, queryset, related, load):
+    models = [queryset.model, *related]
+    version = get_data_version(*models)
+
+    entry = _local.get(name)
+    now = time.monotonic()
+    if entry is not None and entry[0] == version and now - entry[1] < LOCAL_TIMEOUT:
+        return entry[2]
+
+    value = load(queryset)
+    _local[name] = (version, now, value)
+    return value
+
+
+def cached_first(queryset, name, related=()):
+    """
+    ``queryset.first()`` served from the process cache; ``None`` when there is
+    no row. ``related`` are models whose changes must also invalidate it
+    (e.g. prefetched translations).
+    """
+    return _cached(name, queryset, related, lambda qs: qs.first())
+
+
+def cached_rows(queryset, name, related=()):
+    """``list(queryset)`` served from the process cache, see ``cached_first``"""
+    return _cached(name, queryset, related, list)
+
+
+def clear_local_cache():
+    _local.clear()
+
+
+class CachedListMixin:
+    """
+    ``list`` of a read-only viewset over a handful of content rows from the
+    process cache. Requests with query parameters other than the language/``page``
+    (filters, ordering, search) go to the database as usual.
+    """
+
+    cache_related = ()
+    cache_params = {"lang", "language", "page"}
+
+    def list(self, request, *args, **kwargs):
+        if set(request.query_params) - self.cache_params:
+            return super().list(request, *args, **kwargs)
+
+        name = f"{type(self).__module__}.{type(self).__name__}"
+        rows = cached_rows(self.get_queryset(), name, self.cache_related)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(rows, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,190 @@
+// Direct, chunked and resumable uploads to Cloudinary for admin file fields.
+// See ac_back/direct_upload.py for the server side.
+(function () {
+  "use strict";
+
+  var STATE_PREFIX = "direct-upload:";
+
+  function csrfToken() {
+    var match = document.cookie.match(/(?:^|;\s*)csrftoken=([^;]+)/);
+    if (match) {
+      return decodeURIComponent(match[1]);
+    }
+    var input = document.querySelector("input[name=csrfmiddlewaretoken]");
+    return input ? input.value : "";
+  }
+
+  function postJSON(url, body) {
+    return fetch(url, {
+      method: "POST",
+      credentials: "same-origin",
+      headers: {
+        "Content-Type": "application/json",
+        "X-CSRFToken": csrfToken(),
+      },
+      body: JSON.stringify(body),
+    }).then(function (response) {
+      return response.json().then(function (data) {
+        if (!response.ok) {
+          throw new Error(data.error || response.statusText);
+        }
+        return data;
+      });
+    });
+  }
+
+  function stateKey(field, file) {
+    return STATE_PREFIX + [field, file.name, file.size, file.lastModified].join(":");
+  }
+
+  function loadState(key) {
+    try {
+      var state = JSON.parse(localStorage.getItem(key));
+      var age = Date.now() / 1000 - state.upload.params.timestamp;
+      // Signatures expire after an hour
+      return age < 3000 ? state : null;
+    } catch (error) {
+      return null;
+    }
+  }
+
+  function saveState(key, state) {
+    try {
+      localStorage.setItem(key, JSON.stringify(state));
+    } catch (error) {
+      // Private mode: the upload just won't resume
+    }
+  }
+
+  function sendChunk(upload, file, start, onProgress) {
+    var end = Math.min(start + upload.chunk_size, file.size);
+    var form = new FormData();
+    Object.keys(upload.params).forEach(function (key) {
+      form.append(key, upload.params[key]);
+    });
+    form.append("file", file.slice(start, end), file.name);
+
+    return new Promise(function (resolve, reject) {
+      var request = new XMLHttpRequest();
+      request.open("POST", upload.url);
+      request.setRequestHeader("X-Unique-Upload-Id", upload.upload_id);
+      request.setRequestHeader(
+        "Content-Range",
+        "bytes " + start + "-" + (end - 1) + "/" + file.size
+      );
+      request.upload.onprogress = function (event) {
+        onProgress(start + event.loaded);
+      };
+      request.onload = function () {
+        var data = {};
+        try {
+          data = JSON.parse(request.responseText);
+        } catch (error) {
+          // handled below
+        }
+        if (request.status >= 200 && request.status < 300) {
+          resolve({ end: end, result: data });
+        } else {
+          reject(new Error((data.error && data.error.message) || request.statusText));
+        }
+      };
+      request.onerror = function () {
+        reject(new Error("Network error"));
+      };
+      request.send(form);
+    });
+  }
+
+  function uploadFile(input, file, status) {
+    var field = input.dataset.directUpload;
+    var key = stateKey(field, file);
+    var state = loadState(key);
+
+    var signed = state
+      ? Promise.resolve(state.upload)
+      : postJSON(input.dataset.signUrl, {
+          field: field,
+          filename: file.name,
+          size: file.size,
+        });
+
+    return signed.then(function (upload) {
+      state = state || { upload: upload, offset: 0 };
+      saveState(key, state);
+
+      function progress(loaded) {
+        status.textContent = Math.floor((100 * loaded) / file.size) + "%";
+      }
+
+      function next(offset) {
+        return sendChunk(upload, file, offset, progress).then(function (sent) {
+          if (sent.end < file.size) {
+            state.offset = sent.end;
+            saveState(key, state);
+            return next(sent.end);
+          }
+          return sent.result;
+        });
+      }
+
+      return next(state.offset).then(function (result) {
+        localStorage.removeItem(key);
+        return postJSON(input.dataset.confirmUrl, {
+          token: upload.token,
+          result: result,
+        });
+      });
+    });
+  }
+
+  function attach(input) {
+    if (input.dataset.directUploadBound) {
+      return;
+    }
+    input.dataset.directUploadBound = "1";
+    var hidden = input.form.querySelector(
+      "input[name='" + input.name + "__direct']"
+    );
+    var status = document.createElement("span");
+    status.className = "help";
+    input.insertAdjacentElement("afterend", status);
+
+    input.addEventListener("change", function () {
+      var file = input.files[0];
+      if (!file || !hidden) {
+        return;
+      }
+      hidden.value = "";
+      input.dataset.uploading = "1";
+      uploadFile(input, file, status)
+        .then(function (confirmed) {
+          hidden.value = confirmed.value;
+          // The file is already in Cloudinary: don't post it again
+          input.value = "";
+          status.textContent = "✓ " + confirmed.name;
+        })
+        .catch(function (error) {
+          // Fall back to the regular form upload
+          status.textContent = "⚠ " + error.message;
+        })
+        .then(function () {
+          delete input.dataset.uploading;
+        });
+    });
+
+    input.form.addEventListener("submit", function (event) {
+      if (input.dataset.uploading) {
+        event.preventDefault();
+        status.textContent += " …";
+      }
+    });
+  }
+
+  function attachAll() {
+    document.querySelectorAll("input[data-direct-upload]").forEach(attach);
+  }
+
+  document.addEventListener("DOMContentLoaded", attachAll);
+  // Rows added to inlines
+  document.addEventListener("formset:added", attachAll);
+})();
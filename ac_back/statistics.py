@@ -0,0 +1,101 @@
+"""
+Registry of computed statistics.
+
+Apps declare metrics in their ``statistics.py`` (autodiscovered on startup)::
+
+    register_metric("sports.sections", SportSection, Count("id", filter=Q(is_active=True)),
+                    label="Спортивные секции")
+
+``compute_metrics()`` evaluates all metrics of the same model in a single
+``aggregate()`` query and caches the result by the data version of the models
+involved. Models with hand-entered statistics (``PublicationStats``,
+``AcademyStatistics``, ``aboutStatistics``) expose a ``metric`` field: when it
+is set, the displayed value is taken from here instead of the admin input.
+"""
+
+from collections import defaultdict
+
+from django.db.models import Count
+
+from .data_version import cached_by_version
+
+_metrics = {}
+
+
+class Metric:
+    def __init__(self, key, model, aggregate, label, compute=None):
+        self.key = key
+        self.model = model
+        self.aggregate = aggregate
+        self.label = label
+        self.compute = compute
+
+    @property
+    def alias(self):
+        return self.key.replace(".", "__").replace("-", "_")
+
+
+def register_metric(key, model, aggregate, label=""):
+    _metrics[key] = Metric(key, model, aggregate, label or key)
+
+
+def register_computed_metric(key, model, compute, label=""):
+    """
+    Metric that is not a single aggregate (e.g. an h-index): ``compute()``
+    returns the value, cached by the data version of ``model`` like the rest.
+    """
+    _metrics[key] = Metric(key, model, None, label or key, compute=compute)
+
+
+def metric_choices():
+    """Choices for the ``metric`` fields of statistics models"""
+    return [(key, f"{metric.label} ({key})") for key, metric in sorted(_metrics.items())]
+
+
+def _compute(keys):
+    by_model = defaultdict(list)
+    values = {}
+    for key in keys:
+        metric = _metrics[key]
+        if metric.compute is not None:
+            values[key] = metric.compute() or 0
+        else:
+            by_model[metric.model].append(metric)
+
+    for model, metrics in by_model.items():
+        # One query per model, whatever the number of metrics
+        row = model._default_manager.order_by().aggregate(
+            **{metric.alias: metric.aggregate for metric in metrics}
+        )
+        for metric in metrics:
+            values[metric.key] = row[metric.alias] or 0
+    return values
+
+
+def compute_metrics(keys=None):
+    """``{metric key: value}`` for ``keys`` (all registered metrics by default)"""
+    keys = sorted(_metrics if keys is None else (key for key in keys if key in _metrics))
+    if not keys:
+        return {}
+    models = sorted({_metrics[key].model for key in keys}, key=lambda m: m._meta.label)
+    return cached_by_version(
+        f"metrics:{','.join(keys)}", models, lambda: _compute(keys)
+    )
+
+
+def metric_values(context):
+    """All metric values, computed once per serializer context (i.e. per request)"""
+    if "metric_values" not in context:
+        context["metric_values"] = compute_metrics()
+    return context["metric_values"]
+
+
+def group_counts(queryset, field, name=None):
+    """
+    ``[{name: value, "count": n}, ...]`` for ``queryset`` grouped by ``field``
+    with a single GROUP BY. ``name`` renames the key in the output (an alias
+    can't be used in ``values()`` when it shadows a model field).
+    """
+    rows = queryset.values(field).annotate(count=Count("pk")).order_by()
+    name = name or field
+    return [{name: row[field], "count": row["count"]} for row in rows]
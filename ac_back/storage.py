@@ -1,12 +1,293 @@
+"""
+Cloudinary storage that routes uploads by content.
+
+Cloudinary keeps images, videos and other files under different resource
+types (``image``, ``video``, ``raw``), and the URL of a file depends on it.
+``MediaRouterStorage`` reads the first bytes of every upload, picks the
+resource type from the file signature (not the name), uploads small files in
+one request and larger ones in chunks, and records the result in
+``StoredFile``, from which URLs are built. Names without a record are files
+uploaded before the router, which all went to ``raw``.
+
+Uploads are content-addressed: the SHA-256 of a new file is looked up in
+``StoredFile`` and, when the same bytes were uploaded before, the existing
+asset is reused and no request is made. Several rows may then share a file,
+so ``delete`` keeps assets that are still referenced and
+``manage.py collect_media_garbage`` removes the ones no row references.
+
+References are the values of the file fields, of the columns listed by
+``REFERENCE_SOURCES`` (PDF previews, optimized copies, bundle chunks: saved
+with ``default_storage.save`` and kept as plain names) and any mention of a
+file's name or public id in the HTML of ``TEXT_REFERENCE_SOURCES`` (CKEditor
+uploads, images extracted from rich text).
+"""
+
+import hashlib
 import os
+import re
+from collections import Counter
+from datetime import timedelta
+from urllib.parse import unquote
+
+import cloudinary
+import cloudinary.uploader
+from cloudinary_storage.storage import MediaCloudinaryStorage
+from django.apps import apps
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DatabaseError
+from django.db.models import FileField, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+RAW = "raw"
+IMAGE = "image"
+VIDEO = "video"
+
+# (offset, signature, resource type, MIME type)
+SIGNATURES = [
+    (0, b"\xff\xd8\xff", IMAGE, "image/jpeg"),
+    (0, b"\x89PNG\r\n\x1a\n", IMAGE, "image/png"),
+    (0, b"GIF87a", IMAGE, "image/gif"),
+    (0, b"GIF89a", IMAGE, "image/gif"),
+    (8, b"WEBP", IMAGE, "image/webp"),
+    (0, b"II*\x00", IMAGE, "image/tiff"),
+    (0, b"MM\x00*", IMAGE, "image/tiff"),
+    (0, b"\x00\x00\x01\x00", IMAGE, "image/x-icon"),
+    (4, b"ftypavif", IMAGE, "image/avif"),
+    (4, b"ftypheic", IMAGE, "image/heic"),
+    (4, b"ftypmif1", IMAGE, "image/heif"),
+    (0, b"%PDF-", RAW, "application/pdf"),
+    (4, b"ftypqt", VIDEO, "video/quicktime"),
+    (4, b"ftypM4A", VIDEO, "audio/mp4"),
+    (4, b"ftyp", VIDEO, "video/mp4"),
+    (0, b"\x1a\x45\xdf\xa3", VIDEO, "video/webm"),
+    (8, b"AVI ", VIDEO, "video/x-msvideo"),
+    (8, b"WAVE", VIDEO, "audio/wav"),
+    (0, b"OggS", VIDEO, "audio/ogg"),
+]
+# Enough for two MPEG audio frames at the highest bitrate
+SNIFF_SIZE = 4096
+HASH_CHUNK_SIZE = 1024 * 1024
+# Records younger than this may belong to a form that is still being saved
+GARBAGE_GRACE = timedelta(days=1)
+
+# Functions yielding ``(model, column)`` pairs of columns holding stored names
+REFERENCE_SOURCES = [
+    "ac_back.pdf_metadata.stored_references",
+    "ac_back.bundles.stored_references",
+]
+# Functions yielding ``(model, column)`` pairs of texts (HTML) embedding URLs
+TEXT_REFERENCE_SOURCES = [
+    "ac_back.rich_text.stored_references",
+]
+# Path-like tokens (URLs, names) of a text
+PATH_TOKEN_RE = re.compile(r"""[^\s"'<>()\\,]*/[^\s"'<>()\\,]*""")
+# Above this many names, scan every text instead of filtering in the database
+TEXT_FILTER_LIMIT = 20
+
+_stored = {}
+_loaded = False
+
+
+# Sizes of the known BMP DIB headers
+BMP_DIB_SIZES = {12, 40, 52, 56, 64, 108, 124}
+# MPEG-1 Layer III: kbit/s by bitrate index, Hz by sampling rate index
+MP3_BITRATES = [None, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+MP3_SAMPLE_RATES = [44100, 48000, 32000]
+
+
+def _is_bmp(head):
+    # "BM" alone starts plenty of text files: check the reserved bytes and
+    # the DIB header size as well
+    return (
+        len(head) >= 18
+        and head[:2] == b"BM"
+        and head[6:10] == b"\x00\x00\x00\x00"
+        and int.from_bytes(head[14:18], "little") in BMP_DIB_SIZES
+    )
+
+
+def _mp3_frame_length(head, offset):
+    """Length of the MPEG-1 Layer III frame at ``offset``, ``None`` if none"""
+    header = head[offset : offset + 4]
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xFE != 0xFA:
+        return None
+    bitrate_index, rate_index = header[2] >> 4, (header[2] >> 2) & 3
+    if not 0 < bitrate_index < 15 or rate_index == 3:
+        return None
+    padding = (header[2] >> 1) & 1
+    bitrate = MP3_BITRATES[bitrate_index] * 1000
+    return 144 * bitrate // MP3_SAMPLE_RATES[rate_index] + padding
+
+
+def _is_mp3(head):
+    if head[:3] == b"ID3":
+        # ID3v2: major version 2-4 and a "syncsafe" size (7 bits per byte)
+        return (
+            len(head) >= 10
+            and head[3] in (2, 3, 4)
+            and head[4] != 0xFF
+            and all(byte < 0x80 for byte in head[6:10])
+        )
+    # No tag: a frame header, confirmed by the next one (ambiguous -> raw)
+    length = _mp3_frame_length(head, 0)
+    return bool(length) and _mp3_frame_length(head, length) is not None
+
+
+# (check, resource type, MIME type) for formats with short signatures
+CHECKS = [
+    (_is_bmp, IMAGE, "image/bmp"),
+    (_is_mp3, VIDEO, "audio/mpeg"),
+]
+
+
+def sniff(head):
+    """``(resource type, MIME type)`` from the first bytes of a file"""
+    for offset, signature, resource_type, content_type in SIGNATURES:
+        if head[offset : offset + len(signature)] == signature:
+            return resource_type, content_type
+    for check, resource_type, content_type in CHECKS:
+        if check(head):
+            return resource_type, content_type
+    text = head.lstrip()[:SNIFF_SIZE].lower()
+    if text.startswith(b"<svg") or (text.startswith(b"<?xml") and b"<svg" in text):
+        return IMAGE, "image/svg+xml"
+    return RAW, "application/octet-stream"
+
+
+def read_head(content):
+    if hasattr(content, "seek"):
+        content.seek(0)
+    head = content.read(SNIFF_SIZE)
+    if hasattr(content, "seek"):
+        content.seek(0)
+    return head or b""
+
+
+def content_hash(content):
+    """Streaming SHA-256 of a file"""
+    digest = hashlib.sha256()
+    for chunk in content.chunks(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def stored_file(name):
+    """``(public_id, resource_type, format)`` of ``name``, ``None`` for old files"""
+    global _loaded
+    from .models import StoredFile
 
-from cloudinary_storage.storage import RawMediaCloudinaryStorage as BaseRawMediaCloudinaryStorage
+    if name in _stored:
+        return _stored[name]
+    try:
+        if not _loaded:
+            # One query for everything uploaded so far, then one per unknown name
+            rows = StoredFile.objects.values_list(
+                "name", "public_id", "resource_type", "format"
+            )
+            for row in rows:
+                _stored[row[0]] = row[1:]
+            _loaded = True
+        if name not in _stored:
+            _stored[name] = (
+                StoredFile.objects.filter(name=name)
+                .values_list("public_id", "resource_type", "format")
+                .first()
+            )
+    except DatabaseError:
+        # Table not created yet (before migrate)
+        return None
+    return _stored[name]
 
 
-class RawMediaCloudinaryStorage(BaseRawMediaCloudinaryStorage):
+def forget_stored_file(name):
+    _stored.pop(name, None)
+
+
+def file_fields():
+    """``(model, field name)`` of every file field kept in this storage"""
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, FileField) and isinstance(
+                field.storage, MediaRouterStorage
+            ):
+                yield model, field.attname
+
+
+def _sources(paths):
+    for path in paths:
+        yield from import_string(path)()
+
+
+def reference_counts(names=None):
+    """Rows referencing each stored name (all names, or only ``names``)"""
+    counts = Counter()
+    columns = list(file_fields()) + list(_sources(REFERENCE_SOURCES))
+    for model, attname in columns:
+        queryset = model._default_manager.exclude(**{attname: ""})
+        if names is not None:
+            queryset = queryset.filter(**{f"{attname}__in": names})
+        for value in queryset.values_list(attname, flat=True).iterator():
+            if value:
+                counts[value] += 1
+    return counts
+
+
+def text_paths(needles=None):
     """
-    Cloudinary raw storage with chunked upload fallback for files > 10 MB.
+    Path-like tokens (URLs, names) of the texts of ``TEXT_REFERENCE_SOURCES``,
+    joined by newlines; only rows mentioning one of ``needles`` when given.
     """
+    if needles is not None:
+        needles = [needle for needle in needles if needle]
+        if not needles:
+            return ""
+        if len(needles) > TEXT_FILTER_LIMIT:
+            needles = None
+    tokens = set()
+    for model, attname in _sources(TEXT_REFERENCE_SOURCES):
+        queryset = model._default_manager.exclude(**{attname: ""})
+        if needles is not None:
+            condition = Q()
+            for needle in needles:
+                condition |= Q(**{f"{attname}__contains": needle})
+            queryset = queryset.filter(condition)
+        for value in queryset.values_list(attname, flat=True).iterator():
+            if value:
+                tokens.update(PATH_TOKEN_RE.findall(value))
+    return "\n".join(unquote(token) for token in tokens)
+
+
+def is_mentioned(name, public_id, paths):
+    """Whether a stored file appears in ``text_paths()``"""
+    return name in paths or bool(public_id and public_id in paths)
+
+
+def orphaned_files(grace=GARBAGE_GRACE):
+    """``StoredFile`` rows unused for ``grace`` that nothing references"""
+    from .models import StoredFile
+
+    referenced = reference_counts()
+    candidates = StoredFile.objects.filter(last_used_at__lt=timezone.now() - grace)
+    candidates = [stored for stored in candidates if not referenced[stored.name]]
+    if not candidates:
+        return []
+    paths = text_paths()
+    return [
+        stored
+        for stored in candidates
+        if not is_mentioned(stored.name, stored.public_id, paths)
+    ]
+
+
+class MediaRouterStorage(MediaCloudinaryStorage):
+    """Default storage: resource type by content, metadata in ``StoredFile``"""
+
+    # Files pre-dating the router were all uploaded as raw
+    RESOURCE_TYPE = RAW
+    # Force every upload to this resource type (e.g. documents only)
+    forced_resource_type = None
 
     MAX_SINGLE_UPLOAD_SIZE = int(
         os.getenv("CLOUDINARY_MAX_SINGLE_UPLOAD_SIZE", str(10 * 1024 * 1024))
@@ -16,26 +297,109 @@ class RawMediaCloudinaryStorage(BaseRawMediaCloudinaryStorage):
     )
 
     def _get_resource_type(self, name):
-        normalized_name = str(name).lower()
-        if normalized_name.endswith(".pdf"):
-            return "raw"
-        return super()._get_resource_type(name)
-
-    def _upload(self, name, content):
-        import cloudinary.uploader
+        stored = stored_file(name)
+        return stored[1] if stored else self.RESOURCE_TYPE
 
+    def _upload(self, name, content, resource_type):
         options = {
             "use_filename": True,
-            "resource_type": self._get_resource_type(name),
+            "resource_type": resource_type,
             "tags": self.TAG,
         }
         folder = os.path.dirname(name)
         if folder:
             options["folder"] = folder
+        content.seek(0)
+        if content.size and content.size > self.MAX_SINGLE_UPLOAD_SIZE:
+            options["chunk_size"] = self.LARGE_UPLOAD_CHUNK_SIZE
+            return cloudinary.uploader.upload_large(content, **options)
+        return cloudinary.uploader.upload(content, **options)
+
+    def _save(self, name, content):
+        from .models import StoredFile
+
+        name = self._prepend_prefix(self._normalise_name(name))
+        content = UploadedFile(content, name, size=getattr(content, "size", None))
+        sniffed_type, content_type = sniff(read_head(content))
+        resource_type = self.forced_resource_type or sniffed_type
+        sha256 = content_hash(content)
+
+        existing = (
+            StoredFile.objects.filter(sha256=sha256, resource_type=resource_type)
+            .values_list("pk", "name")
+            .first()
+        )
+        # Touching the row restarts the grace period; when collect_media_garbage
+        # has just claimed it (0 rows updated) the file is uploaded again
+        if existing and StoredFile.objects.filter(pk=existing[0]).update(
+            last_used_at=timezone.now()
+        ):
+            return existing[1]
+
+        response = self._upload(name, content, resource_type)
+        public_id = response["public_id"]
+        file_format = response.get("format") or ""
+        stored_name = public_id
+        if resource_type != RAW and file_format:
+            # Image/video public ids have no extension; keep one in the name
+            stored_name = f"{public_id}.{file_format}"
+
+        StoredFile.objects.update_or_create(
+            name=stored_name,
+            defaults=dict(
+                public_id=public_id,
+                resource_type=resource_type,
+                format=file_format,
+                content_type=content_type,
+                size=response.get("bytes") or content.size or 0,
+                sha256=sha256,
+                width=response.get("width"),
+                height=response.get("height"),
+                last_used_at=timezone.now(),
+            ),
+        )
+        _stored[stored_name] = (public_id, resource_type, file_format)
+        return stored_name
+
+    def size(self, name):
+        from .models import StoredFile
+
+        size = StoredFile.objects.filter(name=name).values_list("size", flat=True)
+        size = size.first()
+        # Unknown size: ask Cloudinary (a HEAD request)
+        return size if size else super().size(name)
+
+    def _get_url(self, name):
+        stored = stored_file(name)
+        if stored is None:
+            return super()._get_url(name)
+        public_id, resource_type, file_format = stored
+        if resource_type == RAW:
+            file_format = None
+        resource = cloudinary.CloudinaryResource(
+            public_id, format=file_format or None, default_resource_type=resource_type
+        )
+        return resource.url
+
+    def delete(self, name):
+        from .models import StoredFile
+
+        stored = stored_file(name)
+        public_id = stored[0] if stored else name
+        if reference_counts([name])[name] > 1 or is_mentioned(
+            name, public_id, text_paths([name, public_id])
+        ):
+            # Shared with another row; collect_media_garbage removes it later
+            return False
+        response = cloudinary.uploader.destroy(
+            public_id, invalidate=True, resource_type=self._get_resource_type(name)
+        )
+        StoredFile.objects.filter(name=name).delete()
+        forget_stored_file(name)
+        return response["result"] == "ok"
+
 
-        if hasattr(content, "seek"):
-            content.seek(0)
+class RawMediaCloudinaryStorage(MediaRouterStorage):
+    """Documents (PDF, DOCX...) that must stay downloadable as raw files"""
 
-        # Always use chunked upload for raw files to avoid 10 MB single-request limits.
-        options["chunk_size"] = self.LARGE_UPLOAD_CHUNK_SIZE
-        return cloudinary.uploader.upload_large(content, **options)
+    forced_resource_type = RAW
@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase
+from django.utils import timezone
+
+from sport_achievements.models import SportAchievement
+
+from .data_version import get_data_version
+from .models import PdfDocument, RichTextHtml, StoredFile
+from .singleton import cached_first, clear_local_cache
+from .storage import RawMediaCloudinaryStorage, content_hash, orphaned_files
+
+
+class OrphanedFilesTests(TestCase):
+    """Files saved outside model file fields must never be collected"""
+
+    def stored(self, name):
+        stored = StoredFile.objects.create(
+            name=name,
+            public_id=name.rsplit(".", 1)[0],
+            resource_type=StoredFile.IMAGE,
+            format=name.rsplit(".", 1)[-1],
+        )
+        # Unused for longer than the grace period
+        StoredFile.objects.filter(pk=stored.pk).update(
+            created_at=timezone.now() - timedelta(days=30),
+            last_used_at=timezone.now() - timedelta(days=30),
+        )
+        return name
+
+    def test_references_outside_file_fields_are_kept(self):
+        thumbnail = self.stored("pdf_previews/0a1b.jpg")
+        optimized = self.stored("pdf_optimized/0a1b.pdf")
+        PdfDocument.objects.create(
+            name="documents/report.pdf",
+            status=PdfDocument.DONE,
+            thumbnail=thumbnail,
+            optimized=optimized,
+        )
+
+        extracted = self.stored("rich_text/2c3d.png")
+        variant = self.stored("rich_text/2c3d_480.png")
+        RichTextHtml.objects.create(
+            model="sport_achievements.sportachievement",
+            object_id="1",
+            field="description_ru",
+            html=(
+                f'<p><img src="{default_storage.url(extracted)}" '
+                f'srcset="{default_storage.url(variant)} 480w"></p>'
+            ),
+        )
+
+        upload = self.stored("uploads/2024/05/01/ck.jpg")
+        SportAchievement.objects.create(
+            full_name_ru="Иванов",
+            description_ru=f'<p><img src="{default_storage.url(upload)}"></p>',
+        )
+
+        orphan = self.stored("uploads/2024/05/01/deleted.jpg")
+
+        orphans = {stored.name for stored in orphaned_files()}
+        self.assertEqual(orphans, {orphan})
+
+    def test_reused_upload_restarts_grace_period(self):
+        content = ContentFile(b"same content", name="again.txt")
+        name = self.stored("uploads/2024/05/01/old.txt")
+        StoredFile.objects.filter(name=name).update(
+            resource_type=StoredFile.RAW, sha256=content_hash(content)
+        )
+        # Deduplicated: no upload, the orphan is reused
+        saved = RawMediaCloudinaryStorage().save("uploads/again.txt", content)
+        self.assertEqual(saved, name)
+        self.assertEqual(orphaned_files(), [])
+
+
+class DataVersionTests(TestCase):
+    def test_save_bumps_version_without_prior_read(self):
+        before = get_data_version(PdfDocument)
+        PdfDocument.objects.create(name="documents/new.pdf")
+        self.assertNotEqual(get_data_version(PdfDocument), before)
+
+    def test_process_cache_reloads_after_save(self):
+        clear_local_cache()
+        queryset = PdfDocument.objects.order_by("pk")
+        self.assertIsNone(cached_first(queryset, "test-first"))
+        document = PdfDocument.objects.create(name="documents/first.pdf")
+        self.assertEqual(cached_first(queryset, "test-first"), document)
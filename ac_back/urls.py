@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -7,19 +7,32 @@ from django.conf.urls.static import static
 
 # drf-spectacular imports
 from drf_spectacular.views import (
-    SpectacularAPIView,
     SpectacularSwaggerView,
     SpectacularRedocView,
 
 )
 
-
-# Создание schema_view
-schema_view = SpectacularAPIView.as_view()
+from . import bundles, direct_upload, export
+from .views import OpenAPISchemaView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("ckeditor/", include("ckeditor_uploader.urls")),
+    # Direct uploads to Cloudinary from admin file widgets
+    path(
+        "admin-upload/sign/", direct_upload.sign_view, name="direct-upload-sign"
+    ),
+    path(
+        "admin-upload/confirm/",
+        direct_upload.confirm_view,
+        name="direct-upload-confirm",
+    ),
+    # Offline bundles: the manifest; chunks are served by the storage
+    path(
+        "bundles/<str:language>/manifest.json",
+        bundles.manifest_view,
+        name="bundle-manifest",
+    ),
     # API endpoints
     path("api/students/", include("students.urls")),
     path("api/leadership-structure/", include("leadership_structure.urls")),
@@ -49,7 +62,8 @@ urlpatterns = [
     path("api/education/", include("education.urls")),
 
     
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    # Prebuilt schema, see ac_back/openapi.py
+    path("api/schema/", OpenAPISchemaView.as_view(), name="schema"),
     # Swagger / Redoc UI
     path(
         "swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"
@@ -60,4 +74,20 @@ urlpatterns = [
     path("api/sport-achievements/", include("sport_achievements.urls")),
     path("api/administrative-structure/", include("administrative_structure.urls")), 
     path("api/journal/", include("journal.urls")),  # URL для приложения журнала
+    path("api/changes/", include("changes.urls")),  # Лента изменений для синхронизации
+    # Потоковая выгрузка CSV/XLSX (ac_back/export.py)
+    re_path(
+        r"^api/export/(?P<label>\w+\.\w+)\.(?P<file_format>csv|xlsx)$",
+        export.export_view,
+        name="export",
+    ),
 ]
+
+if settings.DIRECT_UPLOAD_FAKE:
+    urlpatterns.append(
+        path(
+            "admin-upload/fake/<str:resource_type>/upload",
+            direct_upload.fake_upload_view,
+            name="direct-upload-fake",
+        )
+    )
@@ -0,0 +1,57 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views import View
+
+from .compression import precompress
+from .openapi import code_hash, get_schema
+
+SCHEMA_FORMATS = {
+    "yaml": "application/vnd.oai.openapi",
+    "json": "application/vnd.oai.openapi+json",
+}
+
+_rendered_schemas = {}
+
+
+def _render_schema(schema_format):
+    """``(body, compressed variants, etag)``, rendered once per code version"""
+    key = (code_hash(), schema_format)
+    if key not in _rendered_schemas:
+        from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+
+        if schema_format == "json":
+            renderer = OpenApiJsonRenderer()
+        else:
+            renderer = OpenApiYamlRenderer()
+        body = renderer.render(get_schema(), renderer_context={})
+        _rendered_schemas[key] = (body, precompress(body), '"{}-{}"'.format(*key))
+    return _rendered_schemas[key]
+
+
+class OpenAPISchemaView(View):
+    """
+    Prebuilt OpenAPI document (see ``ac_back.openapi``): YAML by default, JSON
+    with ``?format=json`` or ``Accept: application/json``, like
+    ``SpectacularAPIView``.
+    """
+
+    def get(self, request):
+        schema_format = request.GET.get("format")
+        if schema_format not in SCHEMA_FORMATS:
+            accept = request.META.get("HTTP_ACCEPT", "")
+            schema_format = "json" if "json" in accept else "yaml"
+
+        body, variants, etag = _render_schema(schema_format)
+
+        # Compression weakens the ETag; both forms identify this document
+        if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        if etag in {tag.removeprefix("W/") for tag in if_none_match}:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type=SCHEMA_FORMATS[schema_format])
+            response.compressed_variants = variants
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, max-age=300"
+        patch_vary_headers(response, ("Accept",))
+        return response
@@ -2,6 +2,7 @@ from typing import Optional
 
 from rest_framework import serializers
 from .models import AdministrativeStructure
+from ac_back.localization import request_language
 
 
 class AdministrativeStructureSerializer(serializers.ModelSerializer):
@@ -14,7 +15,7 @@ class AdministrativeStructureSerializer(serializers.ModelSerializer):
 
     def get_title(self, obj):
         request = self.context.get("request")
-        lang = request.query_params.get("lang", "ru") if request else "ru"
+        lang = request_language(request) if request else "ru"
         if lang == "en":
             return obj.title_en
         elif lang == "kg":
@@ -23,7 +24,7 @@ class AdministrativeStructureSerializer(serializers.ModelSerializer):
 
     def get_pdf_file(self, obj) -> Optional[str]:
         request = self.context.get("request")
-        lang = request.query_params.get("lang", "ru") if request else "ru"
+        lang = request_language(request) if request else "ru"
         if lang == "en":
             file_field = obj.file_en
         elif lang == "kg":
@@ -1,24 +1,25 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from ac_back.singleton import cached_first
 from .models import AdministrativeStructure
 from .serializers import AdministrativeStructureSerializer
-
-ALLOWED_LANGS = ["ru", "en", "kg"]
+from ac_back.localization import invalid_language_param
 
 
 class AdministrativeStructureView(APIView):
 
     def get(self, request):
-        lang = request.query_params.get("lang", "ru")
-
-        if lang not in ALLOWED_LANGS:
+        if invalid_language_param(request):
             return Response(
                 {"detail": "Invalid language parameter. Use: ru, en or kg"},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        instance = AdministrativeStructure.objects.filter(is_active=True).first()
+        instance = cached_first(
+            AdministrativeStructure.objects.filter(is_active=True),
+            "administrative-structure:active",
+        )
 
         if not instance:
             return Response(
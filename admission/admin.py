@@ -1,4 +1,6 @@
 from django.contrib import admin
+
+from ac_back.export import ExportAdmin, ExportAdminMixin
 from .models import (
     BachelorProgram,
     BachelorFaculties,
@@ -25,7 +27,7 @@ class BachelorFacultiesInline(admin.TabularInline):
     model = BachelorFaculties
 
 @admin.register(BachelorProgram)
-class BachelorProgramAdmin(admin.ModelAdmin):
+class BachelorProgramAdmin(ExportAdminMixin, admin.ModelAdmin):
     inlines = [BachelorFacultiesInline]
 
 class QuotaRequirementInline(admin.TabularInline):
@@ -51,7 +53,7 @@ class QuotaBenefitInline(admin.TabularInline):
 
 
 @admin.register(QuotaType)
-class QuotaTypeAdmin(admin.ModelAdmin):
+class QuotaTypeAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для типов квот"""
 
     list_display = [
@@ -93,7 +95,7 @@ class QuotaTypeAdmin(admin.ModelAdmin):
 
 
 @admin.register(QuotaRequirement)
-class QuotaRequirementAdmin(admin.ModelAdmin):
+class QuotaRequirementAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для требований к квотам"""
 
     list_display = ["quota_type", "requirement_ru_short", "order", "is_active"]
@@ -121,7 +123,7 @@ class QuotaRequirementAdmin(admin.ModelAdmin):
 
 
 @admin.register(QuotaBenefit)
-class QuotaBenefitAdmin(admin.ModelAdmin):
+class QuotaBenefitAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для преимуществ квот"""
 
     list_display = ["quota_type", "benefit_ru_short", "order", "is_active"]
@@ -147,7 +149,7 @@ class QuotaBenefitAdmin(admin.ModelAdmin):
 
 
 @admin.register(QuotaStats)
-class QuotaStatsAdmin(admin.ModelAdmin):
+class QuotaStatsAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для статистики квот"""
 
     list_display = ["stat_type", "number", "label_ru", "order", "is_active"]
@@ -169,7 +171,7 @@ class QuotaStatsAdmin(admin.ModelAdmin):
 
 
 @admin.register(AdditionalSupport)
-class AdditionalSupportAdmin(admin.ModelAdmin):
+class AdditionalSupportAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для дополнительной поддержки"""
 
     list_display = ["support_ru_short", "order", "is_active"]
@@ -192,7 +194,7 @@ class AdditionalSupportAdmin(admin.ModelAdmin):
 
 
 @admin.register(ProcessStep)
-class ProcessStepAdmin(admin.ModelAdmin):
+class ProcessStepAdmin(ExportAdminMixin, admin.ModelAdmin):
     """Админка для шагов процесса"""
 
     list_display = ["step_number", "title_ru", "color_scheme", "is_active"]
@@ -214,14 +216,14 @@ class ProcessStepAdmin(admin.ModelAdmin):
     )
 
 
-admin.site.register(AspirantRequirements)
-admin.site.register(AspirantMainDate)
-admin.site.register(AspirantDocuments)
-admin.site.register(AspirantPrograms)
-admin.site.register(Master)
-admin.site.register(Doctorate)
-admin.site.register(CollegeSoonEvents)
-admin.site.register(CollegeAdmissionSteps)
-admin.site.register(CollegeAdmissionRequirements)
-admin.site.register(CollegeStatistics)
-admin.site.register(CollegePrograms)
+admin.site.register(AspirantRequirements, ExportAdmin)
+admin.site.register(AspirantMainDate, ExportAdmin)
+admin.site.register(AspirantDocuments, ExportAdmin)
+admin.site.register(AspirantPrograms, ExportAdmin)
+admin.site.register(Master, ExportAdmin)
+admin.site.register(Doctorate, ExportAdmin)
+admin.site.register(CollegeSoonEvents, ExportAdmin)
+admin.site.register(CollegeAdmissionSteps, ExportAdmin)
+admin.site.register(CollegeAdmissionRequirements, ExportAdmin)
+admin.site.register(CollegeStatistics, ExportAdmin)
+admin.site.register(CollegePrograms, ExportAdmin)
@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+
+from ac_back.pdf_metadata import PdfInfoField
+from ac_back.pdf_optimization import optimized_url
+
 from .models import (
     CollegeAdmissionRequirements,
     CollegeAdmissionSteps,
@@ -287,10 +291,12 @@ class AspirantDocumentsSerializer(serializers.ModelSerializer):
     """Сериализатор для документов аспирантуры"""
 
     document_name = serializers.SerializerMethodField()
+    file = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("file")
 
     class Meta:
         model = AspirantDocuments
-        fields = ["id", "document_name", "order", "file"]
+        fields = ["id", "document_name", "order", "file", "pdf_info"]
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_document_name(self, obj) -> str:
@@ -298,6 +304,15 @@ class AspirantDocumentsSerializer(serializers.ModelSerializer):
         language = self.context.get("language", "ru")
         return obj.get_document_name(language)
 
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_file(self, obj):
+        """Ссылка на оптимизированную копию, если она есть"""
+        if not obj.file:
+            return None
+        url = optimized_url(obj.file, self.context)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
 
 class CollegeSoonEventsSerializer(serializers.Serializer):
     """Сериализатор для предстоящих событий колледжа"""
@@ -2,8 +2,6 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import generics
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from .models import (
     CollegeAdmissionSteps,
     CollegePrograms,
@@ -44,8 +42,18 @@ from .serializers import (
     AspirantRequirementsSerializer,
     BachelorProgramsSerializer,
 )
+from ac_back.coalesce import get_or_compute
+from ac_back.localization import request_language
 
-
+# Models the bachelor quotas page is built from
+BACHELOR_QUOTAS_MODELS = [
+    QuotaType,
+    QuotaRequirement,
+    QuotaBenefit,
+    QuotaStats,
+    AdditionalSupport,
+    ProcessStep,
+]
 
 
 class QuotaTypeViewSet(viewsets.ReadOnlyModelViewSet):
@@ -65,7 +73,7 @@ class QuotaTypeViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -82,7 +90,7 @@ class QuotaStatsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -94,7 +102,7 @@ class AdditionalSupportViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -111,7 +119,7 @@ class ProcessStepViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -123,7 +131,6 @@ class BachelorQuotasViewSet(viewsets.GenericViewSet):
     )
     queryset = QuotaType.objects.none()  # Empty queryset for schema generation
 
-    @method_decorator(cache_page(60 * 15))  # Кэшируем на 15 минут
     def list(self, request):
         """
         Получить все данные для страницы бакалаврских квот (по умолчанию)
@@ -139,17 +146,10 @@ class BachelorQuotasViewSet(viewsets.GenericViewSet):
             "process_steps": [...]
         }
         """
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
-        # Валидируем язык
-        if language not in ["ru", "kg", "en"]:
-            language = "ru"
-
-        serializer = BachelorQuotasDataSerializer({}, context={"language": language})
-
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self.get_page_data(language), status=status.HTTP_200_OK)
 
-    @method_decorator(cache_page(60 * 15))  # Кэшируем на 15 минут
     @action(detail=False, methods=["get"], url_path="data")
     def get_bachelor_quotas_data(self, request):
         """
@@ -166,20 +166,28 @@ class BachelorQuotasViewSet(viewsets.GenericViewSet):
             "process_steps": [...]
         }
         """
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
+        return Response(self.get_page_data(language), status=status.HTTP_200_OK)
+
+    def get_page_data(self, language):
+        """Данные страницы; пересчитывает один воркер, остальные получают кэш"""
         # Валидируем язык
         if language not in ["ru", "kg", "en"]:
             language = "ru"
 
-        serializer = BachelorQuotasDataSerializer({}, context={"language": language})
-
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return get_or_compute(
+            f"admission:bachelor-quotas:{language}",
+            BACHELOR_QUOTAS_MODELS,
+            lambda: BachelorQuotasDataSerializer(
+                {}, context={"language": language}
+            ).data,
+        )
 
     @action(detail=False, methods=["get"], url_path="quotas-only")
     def get_quotas_only(self, request):
         """Получить только данные о квотах"""
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         if language not in ["ru", "kg", "en"]:
             language = "ru"
@@ -199,7 +207,7 @@ class BachelorQuotasViewSet(viewsets.GenericViewSet):
     @action(detail=False, methods=["get"], url_path="stats-only")
     def get_stats_only(self, request):
         """Получить только статистические данные"""
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         if language not in ["ru", "kg", "en"]:
             language = "ru"
@@ -220,7 +228,7 @@ class MasterListAPIView(generics.ListAPIView):
     def get_serializer_context(self):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -232,7 +240,7 @@ class DoctorateListAPIView(generics.ListAPIView):
     def get_serializer_context(self):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -254,7 +262,7 @@ class AspirantDocumentsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -275,7 +283,7 @@ class AspirantProgramsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -296,7 +304,7 @@ class AspirantMainDateViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -317,7 +325,7 @@ class AspirantRequirementsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -338,7 +346,7 @@ class CollegeSoonEventsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -358,7 +366,7 @@ class CollegeProgramsViewSet(viewsets.ViewSet):
 
     def list(self, request):
         program_id = request.query_params.get("id")
-        language = request.query_params.get("lang", "ru")  # default 'ru'
+        language = request_language(request)  # default 'ru'
 
         if program_id:
             # Получаем конкретную программу по id
@@ -396,7 +404,7 @@ class CollegeAdmissionStepsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -417,7 +425,7 @@ class CollegeAdmissionRequirementsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -438,7 +446,7 @@ class CollegeStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
 
@@ -453,6 +461,6 @@ class BachelorProgramViewSet(viewsets.ReadOnlyModelViewSet):
         """Передаём язык в контекст сериализатора"""
         context = super().get_serializer_context()
         # язык берём из query-параметра, например ?lang=en
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context["language"] = language
         return context
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0005_alter_announcement_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', '-created_at'], name='announcement_active_order_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+def fill_excerpts(apps, schema_editor):
+    from ac_back.excerpts import target_fields, update_excerpts
+
+    AnnouncementTranslation = apps.get_model("announcements", "AnnouncementTranslation")
+    rows = list(AnnouncementTranslation.objects.all())
+    for row in rows:
+        update_excerpts(row)
+    AnnouncementTranslation.objects.bulk_update(rows, target_fields(AnnouncementTranslation), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('announcements', '0006_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='announcementtranslation',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Анонс'),
+        ),
+        migrations.AddField(
+            model_name='announcementtranslation',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Время чтения, мин'),
+        ),
+        migrations.AddField(
+            model_name='announcementtranslation',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Слов'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
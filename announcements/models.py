@@ -31,6 +31,13 @@ class Announcement(models.Model):
         verbose_name = _("Объявление")
         verbose_name_plural = _("Объявления")
         ordering = ["order", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["order", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="announcement_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Announcement {self.id}"
@@ -81,6 +88,13 @@ class AnnouncementTranslation(models.Model):
     department = models.CharField(max_length=150, verbose_name=_("Отдел/Факультет"))
     content = models.TextField(blank=True, verbose_name=_("Полное содержание"))
 
+    # Заполняются при сохранении (ac_back/excerpts.py)
+    excerpt = models.CharField(_("Анонс"), max_length=500, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(_("Слов"), default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(
+        _("Время чтения, мин"), default=0, db_index=True, editable=False
+    )
+
     class Meta:
         verbose_name = _("Перевод объявления")
         verbose_name_plural = _("Переводы объявлений")
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 from .models import Announcement, AnnouncementTranslation, AnnouncementImage
+from ac_back.localization import request_language
 
 
 class AnnouncementTranslationSerializer(serializers.ModelSerializer):
@@ -14,6 +15,26 @@ class AnnouncementTranslationSerializer(serializers.ModelSerializer):
             "category",
             "department",
             "content",
+            "excerpt",
+            "word_count",
+            "reading_time",
+        ]
+
+
+class AnnouncementTranslationSummarySerializer(serializers.ModelSerializer):
+    """Перевод без полного текста (для списков)"""
+
+    class Meta:
+        model = AnnouncementTranslation
+        fields = [
+            "language",
+            "title",
+            "description",
+            "category",
+            "department",
+            "excerpt",
+            "word_count",
+            "reading_time",
         ]
 
 
@@ -39,6 +60,9 @@ class AnnouncementSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
     gallery_images = AnnouncementImageSerializer(many=True, read_only=True)
 
+    # Полный текст перевода в ответе (списки отдают только анонс)
+    include_content = True
+
     class Meta:
         model = Announcement
         fields = [
@@ -61,40 +85,48 @@ class AnnouncementSerializer(serializers.ModelSerializer):
         except Exception:
             return str(obj.image)
 
+    @staticmethod
+    def get_translation(instance, language):
+        """
+        Перевод на запрошенном языке, иначе русский, иначе первый доступный.
+        Выбирается из prefetch_related("translations") без новых запросов.
+        """
+        translations = list(instance.translations.all())
+        by_language = {item.language: item for item in translations}
+        if language in by_language:
+            return by_language[language]
+        if "ru" in by_language:
+            return by_language["ru"]
+        return min(translations, key=lambda item: item.pk, default=None)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get("request")
-        language = request.query_params.get("lang", "ru") if request else "ru"
-
-        # Находим перевод для запрошенного языка
-        translation = instance.translations.filter(language=language).first()
+        language = request_language(request) if request else "ru"
 
+        translation = self.get_translation(instance, language)
         if translation:
             data["title"] = translation.title
             data["description"] = translation.description
             data["category"] = translation.category
             data["department"] = translation.department
-            data["content"] = translation.content
-        else:
-            # Fallback на русский язык
-            ru_translation = instance.translations.filter(language="ru").first()
-            if ru_translation:
-                data["title"] = ru_translation.title
-                data["description"] = ru_translation.description
-                data["category"] = ru_translation.category
-                data["department"] = ru_translation.department
-                data["content"] = ru_translation.content
-            else:
-                # Если нет даже русского перевода, берем первый доступный
-                first_translation = instance.translations.first()
-                if first_translation:
-                    data["title"] = first_translation.title
-                    data["description"] = first_translation.description
-                    data["category"] = first_translation.category
-                    data["department"] = first_translation.department
-                    data["content"] = first_translation.content
+            if self.include_content:
+                data["content"] = translation.content
+            data["excerpt"] = translation.excerpt
+            data["word_count"] = translation.word_count
+            data["reading_time"] = translation.reading_time
 
         # Форматируем дату
         data["date"] = instance.created_at.strftime("%d.%m.%Y")
 
         return data
+
+
+class AnnouncementListSerializer(AnnouncementSerializer):
+    """
+    Объявление для списка: анонс и время чтения вместо полного текста, поэтому
+    список может не загружать content из базы.
+    """
+
+    translations = AnnouncementTranslationSummarySerializer(many=True, read_only=True)
+    include_content = False
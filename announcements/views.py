@@ -1,22 +1,27 @@
+from django.db.models import Prefetch
 from rest_framework import generics
 from rest_framework.response import Response
-from .models import Announcement
-from .serializers import AnnouncementSerializer
+from .models import Announcement, AnnouncementTranslation
+from .serializers import AnnouncementListSerializer, AnnouncementSerializer
 
 
 class AnnouncementListAPIView(generics.ListAPIView):
     """
     API для получения списка всех активных объявлений.
     Поддерживает фильтрацию по языку через параметр ?lang=ru/en/kg
-    Возвращает объявления с переводами и галереей изображений.
+    Возвращает объявления с переводами и галереей изображений; вместо полного
+    текста — анонс, число слов и время чтения.
     """
 
-    serializer_class = AnnouncementSerializer
+    serializer_class = AnnouncementListSerializer
 
     def get_queryset(self):
+        translations = AnnouncementTranslation.objects.defer("content")
         return (
             Announcement.objects.filter(is_active=True)
-            .prefetch_related("translations", "gallery_images")
+            .prefetch_related(
+                Prefetch("translations", queryset=translations), "gallery_images"
+            )
             .order_by("order", "-created_at")
         )
 
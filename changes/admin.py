@@ -0,0 +1,35 @@
+from django.contrib import admin
+
+from .models import Change, ChangeCompaction, ChangeCursor
+
+
+@admin.register(Change)
+class ChangeAdmin(admin.ModelAdmin):
+    list_display = ("seq", "op", "model", "object_id", "created_at")
+    list_filter = ("op", "model")
+    search_fields = ("model", "object_id")
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ChangeCursor)
+class ChangeCursorAdmin(admin.ModelAdmin):
+    list_display = ("client", "seq", "seen_at")
+    search_fields = ("client",)
+
+
+@admin.register(ChangeCompaction)
+class ChangeCompactionAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "compacted_through",
+        "superseded_removed",
+        "tombstones_removed",
+    )
+
+    def has_add_permission(self, request):
+        return False
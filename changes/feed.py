@@ -0,0 +1,299 @@
+"""
+Журнал изменений контента для синхронизации клиентов.
+
+Every save/delete of a content model appends a ``Change`` row (model label,
+object id, upsert/delete) with a monotonically increasing ``seq``. Clients
+keep a local mirror and poll ``/api/changes/?since=<seq>&lang=``: upserts are
+returned with the current, localized row; deleted or deactivated rows as
+tombstones.
+
+The log is compacted by ``manage.py compact_changes``: entries superseded by
+a newer entry of the same object are always safe to drop; tombstones are
+dropped once every client that reports its cursor (``?client=``) has passed
+them and they are older than the retention period. A client whose cursor is
+behind dropped tombstones gets ``"reset": true`` and resynchronizes from 0.
+
+Bulk operations (``update()``, ``bulk_create``) bypass the signals; run
+``manage.py seed_changes`` after them to publish the rows again.
+"""
+
+import re
+from datetime import timedelta
+from itertools import islice
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, Max, Min, OuterRef
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils import timezone
+
+from ac_back.localization import LANGUAGES, get_localized, normalize_language
+
+from .models import Change, ChangeCompaction, ChangeCursor
+
+PAGE_SIZE = 500
+MAX_PAGE_SIZE = 2000
+RETENTION = timedelta(days=30)
+# Entries younger than this are not served yet: a transaction that got a
+# lower seq may still be committing
+SETTLE = timedelta(seconds=1)
+
+EXCLUDED_APPS = {"ac_back", "changes"}
+# Derived tables, recomputed from other models
+EXCLUDED_MODELS = {"science.publicationsummary"}
+
+LANGUAGE_FIELDS = ("language", "lang")
+LOCALIZED_RE = re.compile(r"^(.+)_(%s)$" % "|".join(LANGUAGES))
+
+_layouts = {}
+
+
+def tracked_models():
+    """Concrete models of the project's own apps that feed the log"""
+    base = Path(settings.BASE_DIR).resolve()
+    for config in apps.get_app_configs():
+        if config.label in EXCLUDED_APPS:
+            continue
+        if base not in Path(config.path).resolve().parents:
+            continue
+        for model in config.get_models():
+            if model._meta.proxy or model._meta.label_lower in EXCLUDED_MODELS:
+                continue
+            yield model
+
+
+def _record(model, pk, op):
+    label = model._meta.label_lower
+    # After commit: a rolled back save must not reach the clients
+    transaction.on_commit(
+        lambda: Change.objects.create(model=label, object_id=str(pk), op=op)
+    )
+
+
+def _on_save(sender, instance, **kwargs):
+    _record(sender, instance.pk, Change.UPSERT)
+
+
+def _on_delete(sender, instance, **kwargs):
+    _record(sender, instance.pk, Change.DELETE)
+
+
+def _on_m2m_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        _record(type(instance), instance.pk, Change.UPSERT)
+    elif model._meta.label_lower not in EXCLUDED_MODELS:
+        for pk in pk_set or ():
+            _record(model, pk, Change.UPSERT)
+
+
+def connect_signals():
+    for model in tracked_models():
+        label = model._meta.label_lower
+        post_save.connect(_on_save, sender=model, dispatch_uid=f"changes-save-{label}")
+        post_delete.connect(
+            _on_delete, sender=model, dispatch_uid=f"changes-delete-{label}"
+        )
+        for field in model._meta.local_many_to_many:
+            through = field.remote_field.through
+            m2m_changed.connect(
+                _on_m2m_changed,
+                sender=through,
+                dispatch_uid=f"changes-m2m-{through._meta.label_lower}",
+            )
+
+
+# ---------------------------------------------------------------- payloads
+
+
+def _layout(model):
+    """Field groups of ``model``: plain, localized, files, m2m, language field"""
+    label = model._meta.label_lower
+    if label not in _layouts:
+        names = {field.attname for field in model._meta.concrete_fields}
+        localized = set()
+        for name in names:
+            match = LOCALIZED_RE.match(name)
+            if match and all(f"{match.group(1)}_{code}" in names for code in LANGUAGES):
+                localized.add(match.group(1))
+        translated = {f"{base}_{code}" for base in localized for code in LANGUAGES}
+        files = {
+            field.attname
+            for field in model._meta.concrete_fields
+            if hasattr(field, "attr_class") or type(field).__name__ == "CloudinaryField"
+        }
+        plain = [
+            field.attname
+            for field in model._meta.concrete_fields
+            if field.attname not in translated and field.attname not in files
+        ]
+        language_field = next((name for name in LANGUAGE_FIELDS if name in names), None)
+        m2m = [field.name for field in model._meta.many_to_many]
+        localized = [(base, f"{base}_ru" in files) for base in sorted(localized)]
+        files = sorted(files - translated)
+        _layouts[label] = (plain, localized, files, m2m, language_field)
+    return _layouts[label]
+
+
+def _file_url(value):
+    if not value:
+        return None
+    try:
+        return value.url
+    except (AttributeError, ValueError):
+        return str(value)
+
+
+def row_payload(instance, language):
+    """
+    Compact localized representation of ``instance``; ``None`` when the row is
+    not public (inactive) or belongs to another language.
+    """
+    plain, localized, files, m2m, language_field = _layout(type(instance))
+    if getattr(instance, "is_active", True) is False:
+        return None
+    if language_field:
+        if normalize_language(getattr(instance, language_field)) != language:
+            return None
+
+    data = {name: getattr(instance, name) for name in plain}
+    for base, is_file in localized:
+        value = get_localized(instance, base, language)
+        data[base] = _file_url(value) if is_file else value
+    for name in files:
+        data[name] = _file_url(getattr(instance, name))
+    for name in m2m:
+        data[name] = [related.pk for related in getattr(instance, name).all()]
+    return data
+
+
+def _load(label, ids):
+    try:
+        model = apps.get_model(label)
+    except LookupError:
+        return {}
+    m2m = _layout(model)[3]
+    queryset = model._default_manager.filter(pk__in=ids).prefetch_related(*m2m)
+    return {str(obj.pk): obj for obj in queryset}
+
+
+# ------------------------------------------------------------------- feed
+
+
+def compacted_through():
+    """Highest seq of a dropped tombstone; clients behind it must resync"""
+    latest = ChangeCompaction.objects.order_by("-created_at", "-pk").first()
+    return latest.compacted_through if latest else 0
+
+
+def read_changes(since, language, limit=PAGE_SIZE):
+    """
+    One page of the feed after ``since``::
+
+        {"changes": [...], "next": <seq>, "has_more": bool, "reset": bool}
+    """
+    language = normalize_language(language)
+    reset = 0 < since < compacted_through()
+    if reset:
+        since = 0
+
+    settled = timezone.now() - SETTLE
+    entries = list(
+        Change.objects.filter(seq__gt=since, created_at__lte=settled)
+        .order_by("seq")
+        .values_list("seq", "model", "object_id", "op")[: limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # Only the last entry of an object in the page matters
+    latest = {}
+    for seq, model, object_id, op in entries:
+        latest[(model, object_id)] = (seq, op)
+
+    ids = {}
+    for (model, object_id), (_seq, op) in latest.items():
+        if op == Change.UPSERT:
+            ids.setdefault(model, []).append(object_id)
+    rows = {model: _load(model, model_ids) for model, model_ids in ids.items()}
+
+    changes = []
+    ordered = sorted(latest.items(), key=lambda item: item[1][0])
+    for (model, object_id), (seq, op) in ordered:
+        data = None
+        if op == Change.UPSERT:
+            instance = rows[model].get(object_id)
+            data = row_payload(instance, language) if instance is not None else None
+        change = {"seq": seq, "model": model, "id": object_id}
+        if data is None:
+            change["op"] = Change.DELETE
+        else:
+            change["op"] = Change.UPSERT
+            change["data"] = data
+        changes.append(change)
+
+    return {
+        "changes": changes,
+        "next": entries[-1][0] if entries else since,
+        "has_more": has_more,
+        "reset": reset,
+    }
+
+
+def remember_cursor(client, seq):
+    ChangeCursor.objects.update_or_create(client=client[:64], defaults={"seq": seq})
+
+
+# ------------------------------------------------------------- maintenance
+
+
+def compact(retention=RETENTION):
+    """Drop superseded entries and the tombstones every client has passed"""
+    newer = Change.objects.filter(
+        model=OuterRef("model"),
+        object_id=OuterRef("object_id"),
+        seq__gt=OuterRef("seq"),
+    )
+    superseded, _ = Change.objects.filter(Exists(newer)).delete()
+
+    cutoff = timezone.now() - retention
+    ChangeCursor.objects.filter(seen_at__lt=cutoff).delete()
+    old = Change.objects.filter(created_at__lt=cutoff)
+    horizon = old.aggregate(seq=Max("seq"))["seq"] or 0
+    slowest = ChangeCursor.objects.aggregate(seq=Min("seq"))["seq"]
+    if slowest is not None:
+        horizon = min(horizon, slowest)
+
+    tombstones = Change.objects.filter(op=Change.DELETE, seq__lte=horizon)
+    through = tombstones.aggregate(seq=Max("seq"))["seq"] or 0
+    removed, _ = tombstones.delete()
+    return ChangeCompaction.objects.create(
+        compacted_through=max(through, compacted_through()),
+        superseded_removed=superseded,
+        tombstones_removed=removed,
+    )
+
+
+def seed(batch_size=1000):
+    """Append an upsert for every existing row (initial fill, after bulk edits)"""
+    created = 0
+    for model in tracked_models():
+        label = model._meta.label_lower
+        pks = (
+            model._default_manager.order_by("pk")
+            .values_list("pk", flat=True)
+            .iterator()
+        )
+        while True:
+            batch = [
+                Change(model=label, object_id=str(pk), op=Change.UPSERT)
+                for pk in islice(pks, batch_size)
+            ]
+            if not batch:
+                break
+            Change.objects.bulk_create(batch)
+            created += len(batch)
+    return created
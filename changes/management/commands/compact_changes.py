@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from changes.feed import RETENTION, compact
+
+
+class Command(BaseCommand):
+    help = (
+        "Compact the change log: drop entries superseded by newer ones and "
+        "tombstones every client has passed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=RETENTION.days,
+            help="Keep tombstones at least this long",
+        )
+
+    def handle(self, *args, **options):
+        result = compact(timedelta(days=options["retention_days"]))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Removed {result.superseded_removed} superseded entries and "
+                f"{result.tombstones_removed} tombstones; clients behind "
+                f"seq {result.compacted_through} will resync"
+            )
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from changes.feed import seed
+
+
+class Command(BaseCommand):
+    help = (
+        "Append an upsert for every content row, so clients syncing from 0 "
+        "get everything (run once after install and after bulk updates)"
+    )
+
+    def handle(self, *args, **options):
+        created = seed()
+        self.stdout.write(self.style.SUCCESS(f"Appended {created} entries"))
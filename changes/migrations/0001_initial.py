@@ -0,0 +1,58 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeCompaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('compacted_through', models.BigIntegerField(default=0, verbose_name='Сжато до')),
+                ('superseded_removed', models.PositiveIntegerField(default=0, verbose_name='Удалено устаревших')),
+                ('tombstones_removed', models.PositiveIntegerField(default=0, verbose_name='Удалено удалений')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Время')),
+            ],
+            options={
+                'verbose_name': 'Сжатие журнала',
+                'verbose_name_plural': 'Сжатия журнала',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ChangeCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('client', models.CharField(max_length=64, unique=True, verbose_name='Клиент')),
+                ('seq', models.BigIntegerField(default=0, verbose_name='Позиция')),
+                ('seen_at', models.DateTimeField(auto_now=True, verbose_name='Последний запрос')),
+            ],
+            options={
+                'verbose_name': 'Позиция клиента',
+                'verbose_name_plural': 'Позиции клиентов',
+            },
+        ),
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('model', models.CharField(max_length=100, verbose_name='Модель')),
+                ('object_id', models.CharField(max_length=64, verbose_name='ID объекта')),
+                ('op', models.CharField(choices=[('upsert', 'Создание/изменение'), ('delete', 'Удаление')], max_length=6, verbose_name='Операция')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Время')),
+            ],
+            options={
+                'verbose_name': 'Изменение',
+                'verbose_name_plural': 'Журнал изменений',
+                'ordering': ['seq'],
+                'indexes': [models.Index(fields=['model', 'object_id', 'seq'], name='change_object_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class Change(models.Model):
+    """Запись журнала изменений контента (только добавление)"""
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+    OP_CHOICES = [
+        (UPSERT, _("Создание/изменение")),
+        (DELETE, _("Удаление")),
+    ]
+
+    # Monotonically increasing sequence number, the client's cursor
+    seq = models.BigAutoField(primary_key=True)
+    model = models.CharField(_("Модель"), max_length=100)
+    object_id = models.CharField(_("ID объекта"), max_length=64)
+    op = models.CharField(_("Операция"), max_length=6, choices=OP_CHOICES)
+    created_at = models.DateTimeField(_("Время"), auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = _("Изменение")
+        verbose_name_plural = _("Журнал изменений")
+        ordering = ["seq"]
+        indexes = [
+            models.Index(
+                fields=["model", "object_id", "seq"], name="change_object_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"#{self.seq} {self.op} {self.model}:{self.object_id}"
+
+
+class ChangeCursor(models.Model):
+    """Последняя позиция клиента, передающего ?client="""
+
+    client = models.CharField(_("Клиент"), max_length=64, unique=True)
+    seq = models.BigIntegerField(_("Позиция"), default=0)
+    seen_at = models.DateTimeField(_("Последний запрос"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("Позиция клиента")
+        verbose_name_plural = _("Позиции клиентов")
+
+    def __str__(self):
+        return f"{self.client}: {self.seq}"
+
+
+class ChangeCompaction(models.Model):
+    """Запуск сжатия журнала; удалённые записи до compacted_through включительно"""
+
+    compacted_through = models.BigIntegerField(_("Сжато до"), default=0)
+    superseded_removed = models.PositiveIntegerField(_("Удалено устаревших"), default=0)
+    tombstones_removed = models.PositiveIntegerField(_("Удалено удалений"), default=0)
+    created_at = models.DateTimeField(_("Время"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Сжатие журнала")
+        verbose_name_plural = _("Сжатия журнала")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M}: {self.compacted_through}"
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import ChangeFeedView
+
+app_name = "changes"
+
+urlpatterns = [
+    path("", ChangeFeedView.as_view(), name="change-feed"),
+]
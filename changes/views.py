@@ -0,0 +1,70 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ac_back.localization import request_language
+
+from .feed import MAX_PAGE_SIZE, PAGE_SIZE, read_changes, remember_cursor
+
+
+class ChangeFeedView(APIView):
+    """Изменения контента после позиции since (upsert и удаления)"""
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="since",
+                description="Last seq the client has applied, 0 for a full sync",
+                required=False,
+                type=int,
+                default=0,
+            ),
+            OpenApiParameter(
+                name="lang",
+                description="Language code (ru, en, kg)",
+                required=False,
+                type=str,
+                default="ru",
+            ),
+            OpenApiParameter(
+                name="limit",
+                description=f"Log entries per page (max {MAX_PAGE_SIZE})",
+                required=False,
+                type=int,
+                default=PAGE_SIZE,
+            ),
+            OpenApiParameter(
+                name="client",
+                description=(
+                    "Stable client id; the log keeps tombstones until this "
+                    "client has read them"
+                ),
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request):
+        try:
+            since = int(request.query_params.get("since", 0))
+            limit = int(request.query_params.get("limit", PAGE_SIZE))
+        except ValueError:
+            return Response(
+                {"error": "since and limit must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if since < 0 or limit < 1:
+            return Response(
+                {"error": "since must be >= 0 and limit >= 1"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        client = request.query_params.get("client")
+        if client:
+            remember_cursor(client, since)
+
+        page = read_changes(since, request_language(request), min(limit, MAX_PAGE_SIZE))
+        return Response(page)
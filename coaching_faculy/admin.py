@@ -1,4 +1,7 @@
 from django.contrib import admin
+
+from ac_back.direct_upload import DirectUploadAdminMixin
+
 from .models import (
     TabCategory,
     Card,
@@ -102,7 +105,7 @@ class AboutFacultyAdmin(admin.ModelAdmin):
 
 
 @admin.register(Management)
-class ManagementAdmin(admin.ModelAdmin):
+class ManagementAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("name_ru", "role_ru", "phone", "email", "order", "is_active")
     list_filter = ("tab", "is_active", "created_at")
     search_fields = (
@@ -150,7 +153,7 @@ class SpecializationAdmin(admin.ModelAdmin):
     )
 
 
-class DepartmentStaffInline(admin.TabularInline):
+class DepartmentStaffInline(DirectUploadAdminMixin, admin.TabularInline):
     model = DepartmentStaff
     extra = 1
     fields = (
@@ -192,7 +195,7 @@ class DepartmentAdmin(admin.ModelAdmin):
 
 
 @admin.register(DepartmentStaff)
-class DepartmentStaffAdmin(admin.ModelAdmin):
+class DepartmentStaffAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("name_ru", "position_ru", "department", "order", "is_active")
     list_filter = ("department", "is_active", "created_at")
     search_fields = (
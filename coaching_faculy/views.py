@@ -24,6 +24,7 @@ from .serializers import (
     DepartmentSerializer,
     GalleryCardSerializer,
 )
+from ac_back.localization import request_language
 
 class GalleryCardListAPIView(generics.ListAPIView):
     """
@@ -44,7 +45,7 @@ class GalleryCardListAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context.update({"language": language})
         return context
 
@@ -99,7 +100,7 @@ class CoachingFacultyTabsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         tabs = TabCategory.objects.filter(is_active=True).order_by("order")
         serializer = TabCategorySerializer(
@@ -125,7 +126,7 @@ class CoachingFacultyCardsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
         tab_key = request.query_params.get("tab")
 
         if not tab_key:
@@ -165,7 +166,7 @@ class CoachingFacultyHistoryAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем таб с ключом history
         try:
@@ -192,7 +193,7 @@ class CoachingFacultyAboutAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             about_tab = TabCategory.objects.get(key="about_faculty", is_active=True)
@@ -217,7 +218,7 @@ class CoachingFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             management_tab = TabCategory.objects.get(key="management", is_active=True)
@@ -242,7 +243,7 @@ class CoachingFacultySpecializationsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             spec_tab = TabCategory.objects.get(key="specializations", is_active=True)
@@ -267,7 +268,7 @@ class CoachingFacultyDepartmentsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             dept_tab = TabCategory.objects.get(key="departments", is_active=True)
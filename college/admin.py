@@ -1,4 +1,7 @@
 from django.contrib import admin
+
+from ac_back.direct_upload import DirectUploadAdminMixin
+
 from .models import (
     TabCategory,
     Card,
@@ -104,7 +107,7 @@ class AboutCollegeAdmin(admin.ModelAdmin):
 
 
 @admin.register(Management)
-class ManagementAdmin(admin.ModelAdmin):
+class ManagementAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("name_ru", "role_ru", "phone", "email", "order", "is_active")
     list_filter = ("tab", "is_active", "created_at")
     search_fields = (
@@ -129,7 +132,7 @@ class ManagementAdmin(admin.ModelAdmin):
 
 
 @admin.register(Teacher)
-class TeacherAdmin(admin.ModelAdmin):
+class TeacherAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("name_ru", "subject_ru", "phone", "email", "order", "is_active")
     list_filter = ("is_active", "created_at")
     search_fields = (
@@ -177,7 +180,7 @@ class SpecializationAdmin(admin.ModelAdmin):
     )
 
 
-class DepartmentStaffInline(admin.TabularInline):
+class DepartmentStaffInline(DirectUploadAdminMixin, admin.TabularInline):
     model = DepartmentStaff
     extra = 1
     fields = (
@@ -219,7 +222,7 @@ class DepartmentAdmin(admin.ModelAdmin):
 
 
 @admin.register(DepartmentStaff)
-class DepartmentStaffAdmin(admin.ModelAdmin):
+class DepartmentStaffAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("name_ru", "position_ru", "department", "order", "is_active")
     list_filter = ("department", "is_active", "created_at")
     search_fields = (
@@ -241,7 +244,7 @@ class DepartmentStaffAdmin(admin.ModelAdmin):
 
 
 @admin.register(MissionStrategy)
-class MissionStrategyAdmin(admin.ModelAdmin):
+class MissionStrategyAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display = ("title_ru", "order", "is_active", "created_at")
     list_filter = ("is_active", "created_at")
     search_fields = ("title_ru", "title_kg", "title_en")
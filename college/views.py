@@ -10,6 +10,9 @@ import cloudinary
 import cloudinary.uploader
 import cloudinary.api
 import requests
+
+from ac_back.file_serving import pdf_filename, serve_file
+from ac_back.singleton import cached_rows
 from .models import (
     TabCategory,
     Card,
@@ -35,6 +38,7 @@ from .serializers import (
     GalleryCardSerializer,
     MissionStrategySerializer,
 )
+from ac_back.localization import request_language
 
 
 class GalleryCardListAPIView(generics.ListAPIView):
@@ -56,7 +60,7 @@ class GalleryCardListAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context.update({"language": language})
         return context
 
@@ -118,7 +122,7 @@ class CollegeTabsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         tabs = TabCategory.objects.filter(is_active=True).order_by("order")
         serializer = TabCategorySerializer(
@@ -144,7 +148,7 @@ class CollegeCardsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
         tab_key = request.query_params.get("tab")
 
         if not tab_key:
@@ -184,7 +188,7 @@ class CollegeHistoryAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем таб с ключом history
         try:
@@ -207,15 +211,16 @@ class CollegeAboutAPIView(APIView):
     """API для получения текста 'О колледже' (about_college)"""
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
-
-        try:
-            about_tab = TabCategory.objects.get(key="about_college", is_active=True)
-            items = AboutCollege.objects.filter(tab=about_tab, is_active=True).order_by(
-                "order"
-            )
-        except TabCategory.DoesNotExist:
-            items = AboutCollege.objects.none()
+        language = request_language(request)
+
+        # Empty when the about_college tab is missing or inactive
+        items = cached_rows(
+            AboutCollege.objects.filter(
+                tab__key="about_college", tab__is_active=True, is_active=True
+            ).order_by("order"),
+            "college:about",
+            related=[TabCategory],
+        )
 
         serializer = AboutCollegeSerializer(
             items, many=True, context={"request": request, "language": language}
@@ -232,7 +237,7 @@ class CollegeManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             management_tab = TabCategory.objects.get(key="management", is_active=True)
@@ -257,7 +262,7 @@ class CollegeTeachersAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         items = Teacher.objects.filter(is_active=True).order_by("order")
         serializer = TeacherSerializer(
@@ -275,7 +280,7 @@ class CollegeSpecializationsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             spec_tab = TabCategory.objects.get(key="specializations", is_active=True)
@@ -300,7 +305,7 @@ class CollegeDepartmentsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             dept_tab = TabCategory.objects.get(key="departments", is_active=True)
@@ -372,15 +377,16 @@ class DownloadResumeView(APIView):
                     response.raise_for_status()
                     file_content = response.content
             else:
-                # Для не-Cloudinary файлов читаем напрямую
-                file = obj.resume.open('rb')
-                file_content = file.read()
-                file.close()
+                # Локальные файлы отдаются без чтения в память
+                return serve_file(
+                    request,
+                    obj.resume,
+                    pdf_filename(obj.resume),
+                    content_type="application/pdf",
+                )
             
             # Получаем имя файла
-            filename = obj.resume.name.split('/')[-1]
-            if not filename.endswith('.pdf'):
-                filename += '.pdf'
+            filename = pdf_filename(obj.resume)
             
             # Создаем ответ с файлом
             response = HttpResponse(file_content, content_type='application/pdf')
@@ -403,7 +409,7 @@ class CollegeMissionStrategyAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         items = MissionStrategy.objects.filter(is_active=True).order_by("order")
         serializer = MissionStrategySerializer(
@@ -462,15 +468,16 @@ class DownloadMissionStrategyPDFView(APIView):
                     response.raise_for_status()
                     file_content = response.content
             else:
-                # Для не-Cloudinary файлов читаем напрямую
-                file = pdf_field.open('rb')
-                file_content = file.read()
-                file.close()
+                # Локальные файлы отдаются без чтения в память
+                return serve_file(
+                    request,
+                    pdf_field,
+                    pdf_filename(pdf_field),
+                    content_type="application/pdf",
+                )
             
             # Получаем имя файла
-            filename = pdf_field.name.split('/')[-1]
-            if not filename.endswith('.pdf'):
-                filename += '.pdf'
+            filename = pdf_filename(pdf_field)
             
             # Создаем ответ с файлом
             response = HttpResponse(file_content, content_type='application/pdf')
@@ -18,6 +18,7 @@ from .serializers import (
     ManagementSerializer,
     SpecializationSerializer,
 )
+from ac_back.localization import request_language
 
 
 class CorrespondenceFacultyAPIRootView(APIView):
@@ -68,7 +69,7 @@ class CorrespondenceFacultyTabsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         tabs = TabCategory.objects.filter(is_active=True).order_by("order")
         serializer = TabCategorySerializer(
@@ -94,7 +95,7 @@ class CorrespondenceFacultyCardsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
         tab_key = request.query_params.get("tab")
 
         if not tab_key:
@@ -134,7 +135,7 @@ class CorrespondenceFacultyHistoryAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем таб с ключом history
         try:
@@ -157,7 +158,7 @@ class CorrespondenceFacultyAboutAPIView(APIView):
     """API для получения текста 'О факультете' (about_faculty)"""
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             about_tab = TabCategory.objects.get(key="about_faculty", is_active=True)
@@ -182,7 +183,7 @@ class CorrespondenceFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             management_tab = TabCategory.objects.get(key="management", is_active=True)
@@ -207,7 +208,7 @@ class CorrespondenceFacultySpecializationsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             spec_tab = TabCategory.objects.get(key="specializations", is_active=True)
@@ -3,6 +3,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from cloudinary.models import CloudinaryField
 from ckeditor_uploader.fields import RichTextUploadingField
+from ac_back.localization import LocalizedQuerySet, get_localized
 
 
 class Master(models.Model):
@@ -13,11 +14,11 @@ class Master(models.Model):
     study_plan = models.URLField(blank=True, null=True, verbose_name="план обучения")
     disciplines = models.URLField(blank=True, null=True, verbose_name="дисциплины")
 
+    objects = LocalizedQuerySet.as_manager()
 
     def get_info(self, language="ru"):
         """Получить название на указанном языке"""
-        value = getattr(self, f"info_{language}", None)
-        return value if value else self.info_ru
+        return get_localized(self, "info", language)
     
 
     class Meta:
@@ -55,11 +56,11 @@ class Phd(models.Model):
     study_plan = models.URLField(blank=True, null=True, verbose_name="план обучения")
     disciplines = models.URLField(blank=True, null=True, verbose_name="дисциплины")
 
+    objects = LocalizedQuerySet.as_manager()
 
     def get_info(self, language="ru"):
         """Получить название на указанном языке"""
-        value = getattr(self, f"info_{language}", None)
-        return value if value else self.info_ru
+        return get_localized(self, "info", language)
     
 
     class Meta:
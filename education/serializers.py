@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+
+from ac_back.rich_text import RichHtmlListSerializer, localized_rich_html
+
 from .models import  Master,CollegeDepartmentInfo, CollegeManagement, CollegeTabCategory, MasterStuff, Phd, PhdStuff
 
 
@@ -163,9 +166,10 @@ class MasterSerializer(serializers.ModelSerializer, MultilingualSerializerMixin)
     class Meta:
         model = Master
         fields = ('id', 'info', 'study_plan', 'disciplines', 'stuff')
+        list_serializer_class = RichHtmlListSerializer
 
     def get_info(self, obj):
-        return obj.get_info(self.context.get('language', 'ru'))
+        return localized_rich_html(obj, 'info', self.context.get('language', 'ru'))
     
     @extend_schema_field(MasterStuffSerializer(many=True))
     def get_stuff(self, obj):
@@ -197,9 +201,10 @@ class PhdSerializer(serializers.ModelSerializer, MultilingualSerializerMixin):
     class Meta:
         model = Phd
         fields = ('id', 'info', 'study_plan', 'disciplines', 'stuff')
+        list_serializer_class = RichHtmlListSerializer
 
     def get_info(self, obj):
-        return obj.get_info(self.context.get('language', 'ru'))
+        return localized_rich_html(obj, 'info', self.context.get('language', 'ru'))
     
     @extend_schema_field(PhdStuffSerializer(many=True))
     def get_stuff(self, obj):
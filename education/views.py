@@ -12,6 +12,7 @@ from .serializers import (
     CollegeDepartmentCategoryDetailSerializer,
     CollegeManagementSerializer,
 )
+from ac_back.localization import request_language
 
 
 class CollegeFacultyManagementAPIView(APIView):
@@ -22,7 +23,7 @@ class CollegeFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем все активные записи руководства
         items = CollegeManagement.objects.filter(is_active=True).order_by("order")
@@ -42,7 +43,7 @@ class CollegeDepartmentCategoriesAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
     
@@ -51,7 +52,7 @@ class CollegeDepartmentCategoryDetailAPIView(APIView):
     """API для получения детальной информации о категории кафедры"""
 
     def get(self, request, id):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             category = (
@@ -75,19 +76,19 @@ class CollegeDepartmentCategoryDetailAPIView(APIView):
 
 
 class MasterListAPIView(generics.ListAPIView):
-    queryset = Master.objects.all()
+    queryset = Master.objects.prefetch_related("masterstuff_set")
     serializer_class = MasterSerializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 class PhdListAPIView(generics.ListAPIView):
-    queryset = Phd.objects.all()
+    queryset = Phd.objects.prefetch_related("phdstuff_set")
     serializer_class = PhdSerializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+def fill_excerpts(apps, schema_editor):
+    from ac_back.excerpts import target_fields, update_excerpts
+
+    Event = apps.get_model("events", "Event")
+    rows = list(Event.objects.all())
+    for row in rows:
+        update_excerpts(row)
+    Event.objects.bulk_update(rows, target_fields(Event), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_en',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Анонс (английский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_kg',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Анонс (кыргызский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Анонс (русский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='reading_time_en',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Время чтения, мин (английский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='reading_time_kg',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Время чтения, мин (кыргызский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='reading_time_ru',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Время чтения, мин (русский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='word_count_en',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Слов (английский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='word_count_kg',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Слов (кыргызский)'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='word_count_ru',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Слов (русский)'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
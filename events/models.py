@@ -42,6 +42,17 @@ class Event(models.Model):
     full_description_en = models.TextField(_('Полное описание (английский)'), blank=True, default='')
     full_description_kg = models.TextField(_('Полное описание (кыргызский)'), blank=True, default='')
 
+    # Анонс, число слов и время чтения (заполняются при сохранении, ac_back/excerpts.py)
+    excerpt_ru = models.CharField(_('Анонс (русский)'), max_length=500, blank=True, editable=False)
+    excerpt_en = models.CharField(_('Анонс (английский)'), max_length=500, blank=True, editable=False)
+    excerpt_kg = models.CharField(_('Анонс (кыргызский)'), max_length=500, blank=True, editable=False)
+    word_count_ru = models.PositiveIntegerField(_('Слов (русский)'), default=0, editable=False)
+    word_count_en = models.PositiveIntegerField(_('Слов (английский)'), default=0, editable=False)
+    word_count_kg = models.PositiveIntegerField(_('Слов (кыргызский)'), default=0, editable=False)
+    reading_time_ru = models.PositiveSmallIntegerField(_('Время чтения, мин (русский)'), default=0, db_index=True, editable=False)
+    reading_time_en = models.PositiveSmallIntegerField(_('Время чтения, мин (английский)'), default=0, db_index=True, editable=False)
+    reading_time_kg = models.PositiveSmallIntegerField(_('Время чтения, мин (кыргызский)'), default=0, db_index=True, editable=False)
+
     # Общие поля
     category = models.CharField(
         _('Категория'),
@@ -112,6 +123,19 @@ class Event(models.Model):
         verbose_name = _('Мероприятие')
         verbose_name_plural = _('Мероприятия')
         ordering = ['order', '-created_at']
+        indexes = [
+            models.Index(
+                fields=['order', '-created_at'],
+                condition=models.Q(is_active=True),
+                name='event_active_order_idx',
+            ),
+            # ?timeframe=upcoming|past
+            models.Index(
+                fields=['date'],
+                condition=models.Q(is_active=True),
+                name='event_active_date_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title_ru} ({self.date})"
@@ -103,6 +103,9 @@ class EventListSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
     location = serializers.SerializerMethodField()
+    excerpt = serializers.SerializerMethodField()
+    word_count = serializers.SerializerMethodField()
+    reading_time = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
@@ -117,7 +120,10 @@ class EventListSerializer(serializers.ModelSerializer):
             'time',
             'location',
             'is_featured',
-            'order'
+            'order',
+            'excerpt',
+            'word_count',
+            'reading_time'
         ]
 
     def get_title(self, obj):
@@ -140,3 +146,25 @@ class EventListSerializer(serializers.ModelSerializer):
             'en': obj.location_en,
             'kg': obj.location_kg
         }
+
+    # Анонс полного описания (без загрузки full_description_*)
+    def get_excerpt(self, obj):
+        return {
+            'ru': obj.excerpt_ru,
+            'en': obj.excerpt_en,
+            'kg': obj.excerpt_kg
+        }
+
+    def get_word_count(self, obj):
+        return {
+            'ru': obj.word_count_ru,
+            'en': obj.word_count_en,
+            'kg': obj.word_count_kg
+        }
+
+    def get_reading_time(self, obj):
+        return {
+            'ru': obj.reading_time_ru,
+            'en': obj.reading_time_en,
+            'kg': obj.reading_time_kg
+        }
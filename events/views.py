@@ -7,8 +7,11 @@ from django.utils.translation import gettext_lazy as _
 from .models import Event
 from .serializers import EventSerializer, EventListSerializer
 
+# Полные описания не нужны спискам: там только анонс (excerpt_*)
+FULL_DESCRIPTION_FIELDS = ('full_description_ru', 'full_description_en', 'full_description_kg')
+
 class EventListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Event.objects.filter(is_active=True).order_by('order', '-created_at')
+    queryset = Event.objects.filter(is_active=True).defer(*FULL_DESCRIPTION_FIELDS).order_by('order', '-created_at')
     serializer_class = EventListSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'department', 'is_featured']
@@ -33,7 +36,7 @@ class FeaturedEventListAPIView(generics.ListAPIView):
     serializer_class = EventListSerializer
     
     def get_queryset(self):
-        return Event.objects.filter(is_active=True, is_featured=True).order_by('order', '-created_at')
+        return Event.objects.filter(is_active=True, is_featured=True).defer(*FULL_DESCRIPTION_FIELDS).order_by('order', '-created_at')
 
 class EventCategoryListAPIView(generics.ListAPIView):
     def get(self, request, *args, **kwargs):
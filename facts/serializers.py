@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Fact, FactTranslation
+from ac_back.localization import request_language
 
 class FactTranslationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -19,7 +20,7 @@ class FactSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get('request')
-        language = request.query_params.get('lang', 'ru') if request else 'ru'
+        language = request_language(request) if request else 'ru'
         
         # Находим перевод для запрошенного языка
         translation = instance.translations.filter(language=language).first()
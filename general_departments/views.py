@@ -10,6 +10,7 @@ from .serializers import (
     DepartmentCategoryDetailSerializer,
     ManagementSerializer,
 )
+from ac_back.localization import request_language
 
 
 
@@ -22,7 +23,7 @@ class GeneralFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем все активные записи руководства
         items = Management.objects.filter(is_active=True).order_by("order")
@@ -62,7 +63,7 @@ class DepartmentCategoriesAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
     
@@ -71,7 +72,7 @@ class DepartmentCategoryDetailAPIView(APIView):
     """API для получения детальной информации о категории кафедры"""
 
     def get(self, request, id):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             category = (
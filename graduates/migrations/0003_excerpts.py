@@ -0,0 +1,69 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+def fill_excerpts(apps, schema_editor):
+    from ac_back.excerpts import target_fields, update_excerpts
+
+    Graduate = apps.get_model("graduates", "Graduate")
+    rows = list(Graduate.objects.all())
+    for row in rows:
+        update_excerpts(row)
+    Graduate.objects.bulk_update(rows, target_fields(Graduate), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('graduates', '0002_remove_graduate_photo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='graduate',
+            name='excerpt_en',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Excerpt (en)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='excerpt_kg',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Аннотация (кырг)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='Анонс (рус)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='reading_time_en',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Reading time, min (en)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='reading_time_kg',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Окуу убактысы, мүн (кырг)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='reading_time_ru',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='Время чтения, мин (рус)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='word_count_en',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Words (en)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='word_count_kg',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Сөз (кырг)'),
+        ),
+        migrations.AddField(
+            model_name='graduate',
+            name='word_count_ru',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Слов (рус)'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -13,6 +13,17 @@ class Graduate(models.Model):
     description_en = RichTextField(verbose_name="Description (en)", blank=True)
     description_kg = RichTextField(verbose_name="Сүрөттөмө (кырг)", blank=True)
 
+    # Анонс, число слов и время чтения (заполняются при сохранении)
+    excerpt_ru = models.CharField(max_length=500, verbose_name="Анонс (рус)", blank=True, editable=False)
+    excerpt_en = models.CharField(max_length=500, verbose_name="Excerpt (en)", blank=True, editable=False)
+    excerpt_kg = models.CharField(max_length=500, verbose_name="Аннотация (кырг)", blank=True, editable=False)
+    word_count_ru = models.PositiveIntegerField(default=0, verbose_name="Слов (рус)", editable=False)
+    word_count_en = models.PositiveIntegerField(default=0, verbose_name="Words (en)", editable=False)
+    word_count_kg = models.PositiveIntegerField(default=0, verbose_name="Сөз (кырг)", editable=False)
+    reading_time_ru = models.PositiveSmallIntegerField(default=0, db_index=True, verbose_name="Время чтения, мин (рус)", editable=False)
+    reading_time_en = models.PositiveSmallIntegerField(default=0, db_index=True, verbose_name="Reading time, min (en)", editable=False)
+    reading_time_kg = models.PositiveSmallIntegerField(default=0, db_index=True, verbose_name="Окуу убактысы, мүн (кырг)", editable=False)
+
     # Активен ли выпускник
     is_active = models.BooleanField(default=True, verbose_name="Активен")
 
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from .models import Graduate
+from ac_back.localization import request_language
+from ac_back.rich_text import RichHtmlListSerializer, rich_html
 
 
 class GraduateSerializer(serializers.ModelSerializer):
@@ -10,12 +12,13 @@ class GraduateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Graduate
         fields = ["id", "full_name", "description", "is_active"]
+        list_serializer_class = RichHtmlListSerializer
 
     def _get_lang(self):
         """Получаем язык из query-параметра. По умолчанию — ru."""
         request = self.context.get("request")
         if request:
-            lang = request.query_params.get("lang", "ru")
+            lang = request_language(request)
             # Если lang не ru/en/kg — возвращаем ru
             if lang not in ["ru", "en", "kg"]:
                 lang = "ru"
@@ -30,8 +33,44 @@ class GraduateSerializer(serializers.ModelSerializer):
 
     def get_description(self, instance):
         lang = self._get_lang()
-        value = getattr(instance, f"description_{lang}", "") or instance.description_ru
-        return value
+        name = f"description_{lang}"
+        if not getattr(instance, name, ""):
+            name = "description_ru"
+        return rich_html(instance, name)
+
+
+class GraduateListSerializer(GraduateSerializer):
+    """Для списка: анонс описания вместо полного HTML."""
+
+    excerpt = serializers.SerializerMethodField()
+    word_count = serializers.SerializerMethodField()
+    reading_time = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Graduate
+        fields = [
+            "id",
+            "full_name",
+            "excerpt",
+            "word_count",
+            "reading_time",
+            "is_active",
+        ]
+
+    def _get_localized(self, instance, name):
+        lang = self._get_lang()
+        if getattr(instance, f"excerpt_{lang}", ""):
+            return getattr(instance, f"{name}_{lang}")
+        return getattr(instance, f"{name}_ru")
+
+    def get_excerpt(self, instance):
+        return self._get_localized(instance, "excerpt")
+
+    def get_word_count(self, instance):
+        return self._get_localized(instance, "word_count")
+
+    def get_reading_time(self, instance):
+        return self._get_localized(instance, "reading_time")
 
 
 class GraduateAdminSerializer(serializers.ModelSerializer):
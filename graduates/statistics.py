@@ -0,0 +1,12 @@
+from django.db.models import Count, Q
+
+from ac_back.statistics import register_metric
+
+from .models import Graduate
+
+register_metric(
+    "graduates.graduates",
+    Graduate,
+    Count("id", filter=Q(is_active=True)),
+    label="Выпускники",
+)
@@ -3,7 +3,11 @@ from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import Graduate
-from .serializers import GraduateSerializer, GraduateAdminSerializer
+from .serializers import (
+    GraduateAdminSerializer,
+    GraduateListSerializer,
+    GraduateSerializer,
+)
 
 
 class GraduateViewSet(viewsets.ModelViewSet):
@@ -34,9 +38,20 @@ class GraduateViewSet(viewsets.ModelViewSet):
         # При создании/редактировании — принимаем все языки
         if self.request.method in ["POST", "PUT", "PATCH"]:
             return GraduateAdminSerializer
+        # Список — только анонс, без полного описания
+        if self.action == "list":
+            return GraduateListSerializer
         # При чтении — возвращаем только нужный язык
         return GraduateSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.defer(
+                "description_ru", "description_en", "description_kg"
+            )
+        return queryset
+
     def get_serializer_context(self):
         """Передаём request в сериализатор, чтобы достать lang из query params."""
         context = super().get_serializer_context()
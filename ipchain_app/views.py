@@ -1,5 +1,6 @@
 from rest_framework import viewsets
 from rest_framework.response import Response
+from ac_back.singleton import cached_rows
 from .models import (
     IPChainInfo,
     IPChainStatistic,
@@ -7,6 +8,7 @@ from .models import (
     BlockchainFeature,
     IPChainBenefit,
     BlockchainData,
+    BlockchainDataTranslation,
 )
 from .serializers import (
     IPChainInfoSerializer,
@@ -16,6 +18,7 @@ from .serializers import (
     IPChainBenefitSerializer,
     BlockchainDataSerializer,
 )
+from ac_back.localization import request_language
 
 
 class IPChainInfoViewSet(viewsets.ReadOnlyModelViewSet):
@@ -31,7 +34,7 @@ class IPChainInfoViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = IPChainInfoSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
+        language = request_language(request)
         queryset = self.get_queryset()
         serializer = self.get_serializer(
             queryset, many=True, context={"language": language}
@@ -52,7 +55,7 @@ class IPChainStatisticViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = IPChainStatisticSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
+        language = request_language(request)
         queryset = self.get_queryset()
         serializer = self.get_serializer(
             queryset, many=True, context={"language": language}
@@ -71,7 +74,7 @@ class PatentViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = PatentSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
+        language = request_language(request)
         queryset = self.get_queryset()
         serializer = self.get_serializer(
             queryset, many=True, context={"language": language}
@@ -92,7 +95,7 @@ class BlockchainFeatureViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = BlockchainFeatureSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
+        language = request_language(request)
         queryset = self.get_queryset()
         serializer = self.get_serializer(
             queryset, many=True, context={"language": language}
@@ -113,7 +116,7 @@ class IPChainBenefitViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = IPChainBenefitSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
+        language = request_language(request)
         queryset = self.get_queryset()
         serializer = self.get_serializer(
             queryset, many=True, context={"language": language}
@@ -140,9 +143,14 @@ class BlockchainDataViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = BlockchainDataSerializer
 
     def list(self, request, *args, **kwargs):
-        language = request.GET.get("lang", "ru")
-        queryset = self.get_queryset()
+        language = request_language(request)
+        # Live block counters are edited rarely and read on every page view
+        rows = cached_rows(
+            self.get_queryset(),
+            "ipchain:blockchain-data",
+            related=[BlockchainDataTranslation],
+        )
         serializer = self.get_serializer(
-            queryset, many=True, context={"language": language}
+            rows, many=True, context={"language": language}
         )
         return Response({"results": serializer.data})
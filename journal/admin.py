@@ -1,4 +1,7 @@
 from django.contrib import admin
+
+from ac_back.direct_upload import DirectUploadAdminMixin
+
 from .models import (
     JournalSection,
     EditorialBoard,
@@ -11,7 +14,7 @@ from .models import (
 
 
 @admin.register(JournalSection)
-class JournalSectionAdmin(admin.ModelAdmin):
+class JournalSectionAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display  = ("section", "is_active", "updated_at")
     list_filter   = ("is_active",)
     list_editable = ("is_active",)
@@ -55,12 +58,12 @@ class EditorialOfficeMemberAdmin(admin.ModelAdmin):
 
 
 @admin.register(EditorialBoard)
-class EditorialBoardAdmin(admin.ModelAdmin):
+class EditorialBoardAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display  = ("title_ru", "is_active", "updated_at")
     list_editable = ("is_active",)
 
 
-class ArchiveDocumentInline(admin.TabularInline):
+class ArchiveDocumentInline(DirectUploadAdminMixin, admin.TabularInline):
     model  = ArchiveItem
     extra  = 1
     fields = ("title_ru", "title_en", "title_kg", "file_ru", "file_en", "file_kg", "sort_order", "is_active")
@@ -73,21 +76,21 @@ class ArchiveYearAdmin(admin.ModelAdmin):
 
 
 @admin.register(LatestIssue)
-class LatestIssueAdmin(admin.ModelAdmin):
+class LatestIssueAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display  = ("title_ru", "year", "is_active")
     list_editable = ("is_active",)
     ordering      = ("-year",)
 
 
 @admin.register(ThemeRegistry)
-class ThemeRegistryAdmin(admin.ModelAdmin):
+class ThemeRegistryAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display  = ("title_ru", "is_active", "sort_order", "updated_at")
     list_editable = ("is_active", "sort_order")
     list_filter   = ("is_active",)
     search_fields = ("title_ru", "title_en", "title_kg")
 
 @admin.register(Regulation)
-class RegulationAdmin(admin.ModelAdmin):
+class RegulationAdmin(DirectUploadAdminMixin, admin.ModelAdmin):
     list_display  = ("title_ru", "is_active", "sort_order", "updated_at")
     list_editable = ("is_active", "sort_order")
     list_filter   = ("is_active",)
@@ -1,4 +1,8 @@
 from rest_framework import serializers
+
+from ac_back.pdf_metadata import PdfInfoField
+from ac_back.pdf_optimization import optimized_url
+
 from .models import (
     JournalSection,
     EditorialBoard,
@@ -14,10 +18,11 @@ from .models import (
 class JournalSectionSerializer(serializers.ModelSerializer):
     content = serializers.SerializerMethodField()
     pdf     = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model  = JournalSection
-        fields = ("section", "content", "pdf")
+        fields = ("section", "content", "pdf", "pdf_info")
 
     def get_content(self, obj):
         lang = self.context.get("language", "ru")
@@ -28,7 +33,7 @@ class JournalSectionSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         file    = getattr(obj, f"pdf_{lang}", None)
         if file and file.name and request:
-            return request.build_absolute_uri(file.url)
+            return request.build_absolute_uri(optimized_url(file, self.context))
         return None
     
 
@@ -86,10 +91,11 @@ class EditorialBoardSerializer(serializers.ModelSerializer):
 class ArchiveItemSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     pdf   = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("file")
 
     class Meta:
         model  = ArchiveItem
-        fields = ["id", "title", "pdf"]
+        fields = ["id", "title", "pdf", "pdf_info"]
 
     def get_title(self, obj):
         lang = self.context.get("lang", "ru")
@@ -100,7 +106,7 @@ class ArchiveItemSerializer(serializers.ModelSerializer):
         lang    = self.context.get("lang", "ru")
         file    = getattr(obj, f"file_{lang}", None)
         if file and file.name and request:
-            return request.build_absolute_uri(file.url)
+            return request.build_absolute_uri(optimized_url(file, self.context))
         return None
 
 
@@ -119,10 +125,11 @@ class ArchiveYearSerializer(serializers.ModelSerializer):
 class LatestIssueSerializer(serializers.ModelSerializer):
     title    = serializers.SerializerMethodField()
     pdf_file = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model  = LatestIssue
-        fields = ("year", "title", "pdf_file")
+        fields = ("year", "title", "pdf_file", "pdf_info")
 
     def get_lang(self):
         return self.context.get("language", "ru")
@@ -134,7 +141,8 @@ class LatestIssueSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         pdf = obj.get_pdf(self.get_lang())
         if pdf and hasattr(pdf, 'url'):
-            return request.build_absolute_uri(pdf.url) if request else pdf.url
+            url = optimized_url(pdf, self.context)
+            return request.build_absolute_uri(url) if request else url
         return None
     
 from .models import ThemeRegistry, Regulation
@@ -142,10 +150,11 @@ from .models import ThemeRegistry, Regulation
 class ThemeRegistrySerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     pdf   = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model  = ThemeRegistry
-        fields = ["id", "title", "pdf"]
+        fields = ["id", "title", "pdf", "pdf_info"]
 
     def get_title(self, obj):
         lang = self.context.get("lang", "ru")
@@ -156,17 +165,18 @@ class ThemeRegistrySerializer(serializers.ModelSerializer):
         lang    = self.context.get("lang", "ru")
         file    = getattr(obj, f"pdf_{lang}", None)
         if file and file.name and request:
-            return request.build_absolute_uri(file.url)
+            return request.build_absolute_uri(optimized_url(file, self.context))
         return None
 
 
 class RegulationSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     pdf   = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model  = Regulation
-        fields = ["id", "title", "pdf"]
+        fields = ["id", "title", "pdf", "pdf_info"]
 
     def get_title(self, obj):
         lang = self.context.get("lang", "ru")
@@ -177,5 +187,5 @@ class RegulationSerializer(serializers.ModelSerializer):
         lang    = self.context.get("lang", "ru")
         file    = getattr(obj, f"pdf_{lang}", None)
         if file and file.name and request:
-            return request.build_absolute_uri(file.url)
+            return request.build_absolute_uri(optimized_url(file, self.context))
         return None
\ No newline at end of file
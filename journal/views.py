@@ -20,13 +20,11 @@ from .serializers import (
     ThemeRegistrySerializer,
     RegulationSerializer
 )
-
-VALID_LANGS = {"ru", "en", "kg"}
+from ac_back.localization import invalid_language_param, request_language
 
 
 def get_lang(request):
-    lang = request.query_params.get("lang", "ru")
-    return lang if lang in VALID_LANGS else "ru"
+    return request_language(request)
 
 
 class JournalSectionView(generics.ListAPIView):
@@ -35,14 +33,14 @@ class JournalSectionView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
     
 class EditorialOfficeListView(APIView):
     """GET /api/journal/editorial-office/?lang=ru"""
     def get(self, request):
-        lang = request.query_params.get("lang", "ru")
-        if lang not in VALID_LANGS:
+        lang = request_language(request)
+        if invalid_language_param(request):
             return Response(
                 {"error": "Invalid lang parameter. Use: ru, en, kg"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -57,8 +55,8 @@ class EditorialOfficeListView(APIView):
 
 class EditorialOfficeDetailView(APIView):
     def get(self, request, pk):
-        lang = request.query_params.get("lang", "ru")
-        if lang not in VALID_LANGS:
+        lang = request_language(request)
+        if invalid_language_param(request):
             return Response(
                 {"error": "Invalid lang parameter. Use: ru, en, kg"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -145,8 +143,8 @@ from .serializers import ThemeRegistrySerializer, RegulationSerializer
 class ThemeRegistryListView(APIView):
     """GET /api/journal/theme-registry/?lang=ru"""
     def get(self, request):
-        lang = request.query_params.get("lang", "ru")
-        if lang not in VALID_LANGS:
+        lang = request_language(request)
+        if invalid_language_param(request):
             return Response(
                 {"error": "Invalid lang parameter. Use: ru, en, kg"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -162,8 +160,8 @@ class ThemeRegistryListView(APIView):
 class RegulationListView(APIView):
     """GET /api/journal/regulations/?lang=ru"""
     def get(self, request):
-        lang = request.query_params.get("lang", "ru")
-        if lang not in VALID_LANGS:
+        lang = request_language(request)
+        if invalid_language_param(request):
             return Response(
                 {"error": "Invalid lang parameter. Use: ru, en, kg"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leadership_structure', '0010_alter_academiccouncil_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationstructure',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['parent', 'order', 'name'], name='orgstructure_active_parent_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.core.validators import MinValueValidator, EmailValidator
 from django.utils.translation import gettext_lazy as _
 from cloudinary.models import CloudinaryField
 from ckeditor_uploader.fields import RichTextUploadingField
+from ac_back.localization import LocalizedQuerySet, get_localized
 
 
 class BoardOfTrustees(models.Model):
@@ -309,6 +310,14 @@ class OrganizationStructure(models.Model):
         verbose_name = "Организационная структура"
         verbose_name_plural = "Организационная структура"
         ordering = ['order', 'name']
+        indexes = [
+            # active children of a node (parent IS NULL for the root level)
+            models.Index(
+                fields=['parent', 'order', 'name'],
+                condition=models.Q(is_active=True),
+                name='orgstructure_active_parent_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_structure_type_display()})"
@@ -324,6 +333,8 @@ class Document(models.Model):
     pdf_kg = models.FileField(upload_to='documents/', verbose_name="PDF файл (KG)", blank=True, null=True)
     pdf_en = models.FileField(upload_to='documents/', verbose_name="PDF файл (EN)", blank=True, null=True)
 
+    objects = LocalizedQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Документ"
         verbose_name_plural = "Документы"
@@ -332,4 +343,4 @@ class Document(models.Model):
         return self.name_ru
     
     def get_name(self, language="ru"):
-        return getattr(self, f"name_{language}", self.name_ru)
+        return get_localized(self, "name", language)
@@ -15,6 +15,9 @@ from .models import (
 
 )
 from typing import Optional
+from ac_back.localization import request_language
+from ac_back.pdf_metadata import PdfInfoField
+from ac_back.pdf_optimization import optimized_url
 
 
 
@@ -56,13 +59,9 @@ class MultiLanguageSerializerMixin:
         """Get language from request context"""
         request = self.context.get("request")
         if request:
-            # Only use explicit lang parameter, default to Russian
-            language = request.GET.get("lang", "ru")
-            # Normalize legacy code 'ky' to 'kg' for backward compatibility
-            if language == "ky":
-                language = "kg"
-            return language
-        return "ru"
+            # Negotiated once per request by LanguageMiddleware (ky -> kg included)
+            return request_language(request)
+        return self.context.get("language", "ru")
 
     def get_translated_field(self, obj, field_name):
         """Get field value in the requested language"""
@@ -380,6 +379,7 @@ class DocumentSerializer(MultiLanguageSerializerMixin, serializers.ModelSerializ
 
     name = serializers.SerializerMethodField()
     pdf = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model = Document
@@ -387,6 +387,7 @@ class DocumentSerializer(MultiLanguageSerializerMixin, serializers.ModelSerializ
             "id",
             "name",
             "pdf",
+            "pdf_info",
         ]
 
     def get_name(self, obj):
@@ -399,7 +400,7 @@ class DocumentSerializer(MultiLanguageSerializerMixin, serializers.ModelSerializ
         if not pdf:
             return None
         try:
-            return pdf.url
+            return optimized_url(pdf, self.context)
         except Exception:
             return str(pdf)
         
\ No newline at end of file
@@ -28,6 +28,7 @@ from .serializers import (
     LeadershipSerializer,
     DocumentSerializer,
 )
+from ac_back.localization import request_language
 
 
 class CommissionViewSet(viewsets.ReadOnlyModelViewSet):
@@ -36,7 +37,7 @@ class CommissionViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 class BoardOfTrusteesViewSet(viewsets.ReadOnlyModelViewSet):
@@ -46,7 +47,7 @@ class BoardOfTrusteesViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
    
@@ -56,7 +57,7 @@ class AuditCommissionViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 class ProfsoyuzViewSet(viewsets.ReadOnlyModelViewSet):
@@ -65,7 +66,7 @@ class ProfsoyuzViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 class AcademicCouncilViewSet(viewsets.ReadOnlyModelViewSet):
@@ -74,7 +75,7 @@ class AcademicCouncilViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -131,7 +132,7 @@ class AdministrativeUnitViewSet(viewsets.ReadOnlyModelViewSet):
     
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 # ========== NEW VIEWSETS FOR MISSING APIs ==========
@@ -143,7 +144,7 @@ class LeadershipViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -210,7 +211,7 @@ class OrganizationStructureViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
     @action(detail=False, methods=["get"])
@@ -228,9 +229,15 @@ class DocumentViewSet(viewsets.ReadOnlyModelViewSet):
     """
     queryset = Document.objects.all()
     serializer_class = DocumentSerializer
-   
- 
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .localized(request_language(self.request), "name")
+        )
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
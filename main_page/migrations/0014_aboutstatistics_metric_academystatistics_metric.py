@@ -0,0 +1,24 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:01
+
+import ac_back.statistics
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_page', '0013_remove_accreditation_accreditation_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aboutstatistics',
+            name='metric',
+            field=models.CharField(blank=True, choices=ac_back.statistics.metric_choices, help_text='Если выбран, цифра считается из данных сайта вместо ручного ввода', max_length=100, verbose_name='вычисляемый показатель'),
+        ),
+        migrations.AddField(
+            model_name='academystatistics',
+            name='metric',
+            field=models.CharField(blank=True, choices=ac_back.statistics.metric_choices, help_text='Если выбран, цифра считается из данных сайта вместо ручного ввода', max_length=100, verbose_name='вычисляемый показатель'),
+        ),
+    ]
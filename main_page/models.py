@@ -1,6 +1,7 @@
 from django.db import models
 from cloudinary.models import CloudinaryField
 from ckeditor_uploader.fields import RichTextUploadingField
+from ac_back.statistics import metric_choices
 
 
 # Create your models here.
@@ -16,6 +17,13 @@ class aboutStatistics(models.Model):
         max_length=500, verbose_name="Описание на кыргызском"
     )
     emoji = models.CharField(max_length=50, verbose_name="эмодзи")
+    metric = models.CharField(
+        max_length=100,
+        choices=metric_choices,
+        blank=True,
+        verbose_name="вычисляемый показатель",
+        help_text="Если выбран, цифра считается из данных сайта вместо ручного ввода",
+    )
 
     class Meta:
         verbose_name = "Статистика на главной"
@@ -164,6 +172,13 @@ class AcademyStatistics(models.Model):
         max_length=50,
         verbose_name="эмодзи",
     )
+    metric = models.CharField(
+        max_length=100,
+        choices=metric_choices,
+        blank=True,
+        verbose_name="вычисляемый показатель",
+        help_text="Если выбран, цифра считается из данных сайта вместо ручного ввода",
+    )
 
     class Meta:
         verbose_name = "Статистика академии"
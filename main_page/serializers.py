@@ -3,6 +3,7 @@ from typing import Optional
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+from ac_back.statistics import metric_values
 from .models import (
     AcademyInfrastructure,
     AcademyStatistics,
@@ -37,6 +38,7 @@ class HistorySerializer(serializers.ModelSerializer):
 
 class AboutStatisticsSerializer(serializers.ModelSerializer):
     description = serializers.SerializerMethodField()
+    titleInt = serializers.SerializerMethodField()
 
     class Meta:
         model = aboutStatistics
@@ -45,6 +47,11 @@ class AboutStatisticsSerializer(serializers.ModelSerializer):
     def get_description(self, obj):
         return obj.get_description(self.context.get("language", "ru"))
 
+    def get_titleInt(self, obj) -> str:
+        if obj.metric and obj.metric in metric_values(self.context):
+            return str(metric_values(self.context)[obj.metric])
+        return obj.titleInt
+
 
 class AboutPhotosSerializer(serializers.ModelSerializer):
     description = serializers.SerializerMethodField()
@@ -124,11 +131,17 @@ class AccreditationSerializer(serializers.ModelSerializer):
 class AcademyStatisticsSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
+    titleInt = serializers.SerializerMethodField()
 
     class Meta:
         model = AcademyStatistics
         fields = ["id", "title", "description", "titleInt"]
 
+    def get_titleInt(self, obj) -> str:
+        if obj.metric and obj.metric in metric_values(self.context):
+            return str(metric_values(self.context)[obj.metric])
+        return obj.titleInt
+
     def get_title(self, obj):
         lang = self.context.get("language", "ru")
         return obj.get_title(lang)
@@ -1,5 +1,6 @@
 from django.shortcuts import render
 from rest_framework import viewsets
+from ac_back.singleton import CachedListMixin
 from .models import (
     AcademyInfrastructure,
     History,
@@ -23,16 +24,17 @@ from .serializers import (
     AcademyInfrastructureSerializer,
     HistorySerializer,
 )
+from ac_back.localization import request_language
 
 # Create your views here.
 
-class HistoryViewSet(viewsets.ReadOnlyModelViewSet):
+class HistoryViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = History.objects.all()
     serializer_class = HistorySerializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 class AboutStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
@@ -41,7 +43,7 @@ class AboutStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -51,19 +53,19 @@ class AboutPhotosViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
 
 
-class MissionViewSet(viewsets.ReadOnlyModelViewSet):
+class MissionViewSet(CachedListMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Mission.objects.all()
     serializer_class = MissionSerializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -73,7 +75,7 @@ class AccreditationViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -83,7 +85,7 @@ class AcademyStatisticsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -93,7 +95,7 @@ class AcademyAchievementsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -103,5 +105,5 @@ class AcademyInfrastructureViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
@@ -23,6 +23,7 @@ from .serializers import (
     SpecializationSerializer,
     GalleryCardSerializer,
 )
+from ac_back.localization import request_language
 
 
 class GalleryCardListAPIView(generics.ListAPIView):
@@ -44,7 +45,7 @@ class GalleryCardListAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context.update({"language": language})
         return context
 
@@ -56,7 +57,7 @@ class MilitaryFacultyDepartmentsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             dept_tab = TabCategory.objects.get(key="departments", is_active=True)
@@ -121,7 +122,7 @@ class MilitaryFacultyTabsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         tabs = TabCategory.objects.filter(is_active=True).order_by("order")
         serializer = TabCategorySerializer(
@@ -147,7 +148,7 @@ class MilitaryFacultyCardsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
         tab_key = request.query_params.get("tab")
 
         if not tab_key:
@@ -187,7 +188,7 @@ class MilitaryFacultyHistoryAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем таб с ключом history
         try:
@@ -210,7 +211,7 @@ class MilitaryFacultyAboutAPIView(APIView):
     """API для получения текста 'О факультете' (about_faculty)"""
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             about_tab = TabCategory.objects.get(key="about_faculty", is_active=True)
@@ -235,7 +236,7 @@ class MilitaryFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             management_tab = TabCategory.objects.get(key="management", is_active=True)
@@ -260,7 +261,7 @@ class MilitaryFacultySpecializationsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             spec_tab = TabCategory.objects.get(key="specializations", is_active=True)
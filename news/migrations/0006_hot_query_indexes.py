@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_alter_news_image_alter_newsimage_image'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['order', '-created_at'], name='news_active_order_idx'),
+        ),
+    ]
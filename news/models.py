@@ -17,6 +17,13 @@ class News(models.Model):
         verbose_name = _("Новость")
         verbose_name_plural = _("Новости")
         ordering = ["order", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["order", "-created_at"],
+                condition=models.Q(is_active=True),
+                name="news_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"News {self.id}"
@@ -64,6 +71,13 @@ class NewsTranslation(models.Model):
     category = models.CharField(max_length=100, verbose_name=_("Категория"))
     content = models.TextField(blank=True, verbose_name=_("Полное содержание"))
 
+    # Заполняются при сохранении (ac_back/excerpts.py)
+    excerpt = models.CharField(_("Анонс"), max_length=500, blank=True, editable=False)
+    word_count = models.PositiveIntegerField(_("Слов"), default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(
+        _("Время чтения, мин"), default=0, db_index=True, editable=False
+    )
+
     class Meta:
         verbose_name = _("Перевод новости")
         verbose_name_plural = _("Переводы новостей")
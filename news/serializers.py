@@ -2,12 +2,46 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 from .models import News, NewsTranslation, NewsImage
+from ac_back.localization import request_language
+from ac_back.rich_text import RichHtmlListSerializer, rich_html
 
 
 class NewsTranslationSerializer(serializers.ModelSerializer):
+    content = serializers.SerializerMethodField()
+
+    class Meta:
+        model = NewsTranslation
+        fields = [
+            "language",
+            "title",
+            "description",
+            "category",
+            "content",
+            "excerpt",
+            "word_count",
+            "reading_time",
+        ]
+        list_serializer_class = RichHtmlListSerializer
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_content(self, obj):
+        return rich_html(obj, "content")
+
+
+class NewsTranslationSummarySerializer(serializers.ModelSerializer):
+    """Перевод без полного текста (для списков)"""
+
     class Meta:
         model = NewsTranslation
-        fields = ["language", "title", "description", "category", "content"]
+        fields = [
+            "language",
+            "title",
+            "description",
+            "category",
+            "excerpt",
+            "word_count",
+            "reading_time",
+        ]
 
 
 class NewsImageSerializer(serializers.ModelSerializer):
@@ -32,6 +66,9 @@ class NewsSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
     gallery_images = NewsImageSerializer(many=True, read_only=True)
 
+    # Полный текст перевода в ответе (списки отдают только анонс)
+    include_content = True
+
     class Meta:
         model = News
         fields = [
@@ -53,34 +90,44 @@ class NewsSerializer(serializers.ModelSerializer):
         except Exception:
             return str(obj.image)
 
+    @staticmethod
+    def get_translation(instance, language):
+        """
+        Перевод на запрошенном языке, иначе русский, иначе первый доступный.
+        Выбирается из prefetch_related("translations") без новых запросов.
+        """
+        translations = list(instance.translations.all())
+        by_language = {item.language: item for item in translations}
+        if language in by_language:
+            return by_language[language]
+        if "ru" in by_language:
+            return by_language["ru"]
+        return min(translations, key=lambda item: item.pk, default=None)
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get("request")
-        language = request.query_params.get("lang", "ru") if request else "ru"
-
-        # Находим перевод для запрошенного языка
-        translation = instance.translations.filter(language=language).first()
+        language = request_language(request) if request else "ru"
 
+        translation = self.get_translation(instance, language)
         if translation:
             data["title"] = translation.title
             data["description"] = translation.description
             data["category"] = translation.category
-            data["content"] = translation.content
-        else:
-            # Fallback на русский язык
-            ru_translation = instance.translations.filter(language="ru").first()
-            if ru_translation:
-                data["title"] = ru_translation.title
-                data["description"] = ru_translation.description
-                data["category"] = ru_translation.category
-                data["content"] = ru_translation.content
-            else:
-                # Если нет даже русского перевода, берем первый доступный
-                first_translation = instance.translations.first()
-                if first_translation:
-                    data["title"] = first_translation.title
-                    data["description"] = first_translation.description
-                    data["category"] = first_translation.category
-                    data["content"] = first_translation.content
+            if self.include_content:
+                data["content"] = rich_html(translation, "content")
+            data["excerpt"] = translation.excerpt
+            data["word_count"] = translation.word_count
+            data["reading_time"] = translation.reading_time
 
         return data
+
+
+class NewsListSerializer(NewsSerializer):
+    """
+    Новость для списка: анонс и время чтения вместо полного текста, поэтому
+    список может не загружать content из базы.
+    """
+
+    translations = NewsTranslationSummarySerializer(many=True, read_only=True)
+    include_content = False
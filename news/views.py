@@ -1,22 +1,27 @@
+from django.db.models import Prefetch
 from rest_framework import generics
 from rest_framework.response import Response
-from .models import News
-from .serializers import NewsSerializer
+from .models import News, NewsTranslation
+from .serializers import NewsListSerializer, NewsSerializer
 
 
 class NewsListAPIView(generics.ListAPIView):
     """
     API для получения списка всех активных новостей.
     Поддерживает фильтрацию по языку через параметр ?lang=ru/en/kg
-    Возвращает новости с переводами и галереей изображений.
+    Возвращает новости с переводами и галереей изображений; вместо полного
+    текста — анонс, число слов и время чтения.
     """
 
-    serializer_class = NewsSerializer
+    serializer_class = NewsListSerializer
 
     def get_queryset(self):
+        translations = NewsTranslation.objects.defer("content")
         return (
             News.objects.filter(is_active=True)
-            .prefetch_related("translations", "gallery_images")
+            .prefetch_related(
+                Prefetch("translations", queryset=translations), "gallery_images"
+            )
             .order_by("order", "-created_at")
         )
 
@@ -31,6 +31,8 @@ from .serializers import (
     DepartmentSerializer,
     GalleryCardSerializer,
 )
+from ac_back.file_serving import pdf_filename, serve_file
+from ac_back.localization import request_language
 
 
 class GalleryCardListAPIView(generics.ListAPIView):
@@ -52,7 +54,7 @@ class GalleryCardListAPIView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        language = self.request.query_params.get("lang", "ru")
+        language = request_language(self.request)
         context.update({"language": language})
         return context
 
@@ -108,7 +110,7 @@ class PedagogicalFacultyTabsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         tabs = TabCategory.objects.filter(is_active=True).order_by("order")
         serializer = TabCategorySerializer(
@@ -134,7 +136,7 @@ class PedagogicalFacultyCardsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
         tab_key = request.query_params.get("tab")
 
         if not tab_key:
@@ -174,7 +176,7 @@ class PedagogicalFacultyHistoryAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         # Получаем таб с ключом history
         try:
@@ -197,7 +199,7 @@ class PedagogicalFacultyAboutAPIView(APIView):
     """API для получения текста 'О факультете' (about_faculty)"""
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             about_tab = TabCategory.objects.get(key="about_faculty", is_active=True)
@@ -222,7 +224,7 @@ class PedagogicalFacultyManagementAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             management_tab = TabCategory.objects.get(key="management", is_active=True)
@@ -247,7 +249,7 @@ class PedagogicalFacultySpecializationsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             spec_tab = TabCategory.objects.get(key="specializations", is_active=True)
@@ -272,7 +274,7 @@ class PedagogicalFacultyDepartmentsAPIView(APIView):
     """
 
     def get(self, request):
-        language = request.query_params.get("lang", "ru")
+        language = request_language(request)
 
         try:
             dept_tab = TabCategory.objects.get(key="departments", is_active=True)
@@ -342,15 +344,16 @@ class DownloadResumeView(APIView):
                     response.raise_for_status()
                     file_content = response.content
             else:
-                # Для не-Cloudinary файлов читаем напрямую
-                file = obj.resume.open('rb')
-                file_content = file.read()
-                file.close()
+                # Локальные файлы отдаются без чтения в память
+                return serve_file(
+                    request,
+                    obj.resume,
+                    pdf_filename(obj.resume),
+                    content_type="application/pdf",
+                )
             
             # Получаем имя файла
-            filename = obj.resume.name.split('/')[-1]
-            if not filename.endswith('.pdf'):
-                filename += '.pdf'
+            filename = pdf_filename(obj.resume)
             
             # Создаем ответ с файлом
             response = HttpResponse(file_content, content_type='application/pdf')
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 from .models import Quote, QuoteTranslation
+from ac_back.localization import request_language
 
 class QuoteTranslationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -28,7 +29,7 @@ class QuoteSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get('request')
-        language = request.query_params.get('lang', 'ru') if request else 'ru'
+        language = request_language(request) if request else 'ru'
         
         # Находим перевод для запрошенного языка
         translation = instance.translations.filter(language=language).first()
@@ -1,4 +1,6 @@
 from django.contrib import admin
+
+from ac_back.export import ExportAdmin
 from .models import (
     NTSCommitteeRole,
     NTSResearchDirection,
@@ -50,11 +52,11 @@ admin.site.register(NTSCommitteeRole)
 admin.site.register(NTSResearchDirection)
 admin.site.register(NTSCommitteeMember)
 admin.site.register(NTSCommitteeSection)
-admin.site.register(Publication)
+admin.site.register(Publication, ExportAdmin)
 admin.site.register(PublicationStats)
 admin.site.register(ScopusMetrics)
 admin.site.register(ScopusDocumentType)
-admin.site.register(ScopusPublication)
+admin.site.register(ScopusPublication, ExportAdmin)
 admin.site.register(ScopusStats)
 admin.site.register(ScopusJournal)
 admin.site.register(ScopusPublisher)
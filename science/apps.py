@@ -5,3 +5,8 @@ class ScienceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "science"
     verbose_name = "Наука"
+
+    def ready(self):
+        from .summary import connect_signals
+
+        connect_signals()
@@ -0,0 +1,94 @@
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from science.models import Publication
+from science.search import build_search_text, search_publications
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure publication search latency on synthetic data of growing size. "
+        "Everything runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1000,10000,100000",
+            help="Comma separated table sizes to measure",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Searches per term and size"
+        )
+        parser.add_argument(
+            "--terms",
+            default="физическ,olympic,спорттук,olympik",
+            help="Comma separated search terms (the last one is a typo)",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(","))
+        terms = [term for term in options["terms"].split(",") if term]
+        self.stdout.write(f"Database: {connection.vendor}")
+
+        with transaction.atomic():
+            created = 0
+            for size in sizes:
+                self._create_publications(size - created)
+                created = size
+                if connection.vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute("ANALYZE science_publication")
+
+                for term in terms:
+                    timings = []
+                    for _ in range(options["repeat"]):
+                        started = time.perf_counter()
+                        results = list(
+                            search_publications(Publication.objects.all(), term)[:20]
+                        )
+                        timings.append(time.perf_counter() - started)
+                    timings.sort()
+                    median = timings[len(timings) // 2] * 1000
+                    self.stdout.write(
+                        f"{size:>8} rows  {term!r:<18} median {median:8.2f} ms  "
+                        f"({len(results)} results)"
+                    )
+
+            transaction.set_rollback(True)
+
+    def _create_publications(self, count):
+        words = [
+            "физическая культура",
+            "спорт",
+            "olympic training",
+            "спорттук машыгуу",
+            "педагогика",
+            "biomechanics",
+            "тренер",
+            "health",
+        ]
+        batch = []
+        for index in range(count):
+            noise = "".join(random.choices(string.ascii_lowercase, k=8))
+            publication = Publication(
+                title_ru=f"{random.choice(words)} {noise} {index}",
+                title_en=f"{random.choice(words)} {noise}",
+                title_kg=f"{random.choice(words)} {noise}",
+                author_ru=f"Автор {noise}",
+                journal="Benchmark",
+                year=random.randint(1995, 2025),
+                abstract_ru="-",
+            )
+            # bulk_create bypasses save()
+            publication.search_text = build_search_text(publication)
+            batch.append(publication)
+            if len(batch) == 5000:
+                Publication.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            Publication.objects.bulk_create(batch)
@@ -26,24 +26,28 @@ class Command(BaseCommand):
     def create_roles(self):
         roles = [
             {
+                "key": NTSCommitteeRole.CHAIRMAN,
                 "name_ru": "Председатель",
                 "name_en": "Chairman",
                 "description_ru": "Руководит работой научно-технического совета, председательствует на заседаниях",
                 "description_en": "Leads the work of the scientific and technical council, chairs meetings",
             },
             {
+                "key": NTSCommitteeRole.VICE_CHAIRMAN,
                 "name_ru": "Заместитель председателя",
                 "name_en": "Vice Chairman",
                 "description_ru": "Помогает председателю в руководстве советом, замещает председателя в его отсутствие",
                 "description_en": "Assists the chairman in leading the council, substitutes for the chairman in their absence",
             },
             {
+                "key": NTSCommitteeRole.SECRETARY,
                 "name_ru": "Ученый секретарь",
                 "name_en": "Scientific Secretary",
                 "description_ru": "Ведет документацию совета, организует заседания, информирует членов совета",
                 "description_en": "Maintains council documentation, organizes meetings, informs council members",
             },
             {
+                "key": NTSCommitteeRole.MEMBER,
                 "name_ru": "Член совета",
                 "name_en": "Council Member",
                 "description_ru": "Участвует в работе совета, вносит предложения, участвует в голосованиях",
@@ -111,14 +115,18 @@ class Command(BaseCommand):
 
     def create_committee_members(self):
         # Get roles and research directions
-        chairman_role = NTSCommitteeRole.objects.filter(name_ru="Председатель").first()
+        chairman_role = NTSCommitteeRole.objects.filter(
+            key=NTSCommitteeRole.CHAIRMAN
+        ).first()
         vice_role = NTSCommitteeRole.objects.filter(
-            name_ru="Заместитель председателя"
+            key=NTSCommitteeRole.VICE_CHAIRMAN
         ).first()
         secretary_role = NTSCommitteeRole.objects.filter(
-            name_ru="Ученый секретарь"
+            key=NTSCommitteeRole.SECRETARY
+        ).first()
+        member_role = NTSCommitteeRole.objects.filter(
+            key=NTSCommitteeRole.MEMBER
         ).first()
-        member_role = NTSCommitteeRole.objects.filter(name_ru="Член совета").first()
 
         # Get research directions
         directions = list(NTSResearchDirection.objects.all())
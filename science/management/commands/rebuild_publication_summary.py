@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from science.summary import rebuild_summary
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the publication/citation summary from scratch. Needed only "
+        "after bulk operations that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_summary()
+        self.stdout.write(self.style.SUCCESS(f"Publication summary rebuilt: {rows} rows"))
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.2 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('science', '0016_scientificpublication'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['is_featured', 'order', '-year'], name='publication_featured_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['publication_type', '-year'], name='publication_type_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofscienceadditionalmetric',
+            index=models.Index(fields=['time_range', 'order'], name='wos_addmetric_range_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencecategory',
+            index=models.Index(fields=['time_range', 'order'], name='wos_category_range_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencecategory',
+            index=models.Index(fields=['time_range', '-count'], name='wos_category_range_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencecollaboration',
+            index=models.Index(fields=['time_range', 'order'], name='wos_collab_range_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencecollaboration',
+            index=models.Index(fields=['time_range', '-publications'], name='wos_collab_range_pubs_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencejournalquartile',
+            index=models.Index(fields=['time_range', 'order'], name='wos_quartile_range_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webofsciencemetric',
+            index=models.Index(fields=['time_range', 'order'], name='wos_metric_range_order_idx'),
+        ),
+    ]
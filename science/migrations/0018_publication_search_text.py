@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-19 15:59
+
+from django.db import migrations, models
+
+SEARCH_FIELDS = (
+    "title_ru",
+    "title_en",
+    "title_kg",
+    "author_ru",
+    "author_en",
+    "author_kg",
+)
+
+
+def fill_search_text(apps, schema_editor):
+    Publication = apps.get_model("science", "Publication")
+    publications = list(Publication.objects.only("pk", *SEARCH_FIELDS))
+    for publication in publications:
+        values = (getattr(publication, field) for field in SEARCH_FIELDS)
+        publication.search_text = " ".join(
+            value.strip() for value in values if value
+        ).lower()
+    Publication.objects.bulk_update(publications, ["search_text"], batch_size=500)
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm only exists on PostgreSQL; SQLite keeps the icontains search
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS publication_search_trgm_idx "
+        "ON science_publication USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS publication_search_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('science', '0017_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publication',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Search Text'),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
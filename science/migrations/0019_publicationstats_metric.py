@@ -0,0 +1,19 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:01
+
+import ac_back.statistics
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('science', '0018_publication_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publicationstats',
+            name='metric',
+            field=models.CharField(blank=True, choices=ac_back.statistics.metric_choices, help_text='When set, the value is computed from the data instead of entered by hand', max_length=100, verbose_name='Computed Metric'),
+        ),
+    ]
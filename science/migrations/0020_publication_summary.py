@@ -0,0 +1,48 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:04
+
+import ac_back.statistics
+from django.db import migrations, models
+
+
+def fill_summary(apps, schema_editor):
+    from science.summary import build_summary
+
+    build_summary(
+        apps.get_model("science", "PublicationSummary"),
+        apps.get_model("science", "Publication"),
+        apps.get_model("science", "ScopusMetrics"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('science', '0019_publicationstats_metric'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scopusstats',
+            name='metric',
+            field=models.CharField(blank=True, choices=ac_back.statistics.metric_choices, help_text='When set, the value is computed from the data instead of entered by hand', max_length=100, verbose_name='Computed Metric'),
+        ),
+        migrations.CreateModel(
+            name='PublicationSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=20, verbose_name='Source')),
+                ('dimension', models.CharField(max_length=20, verbose_name='Dimension')),
+                ('key', models.CharField(blank=True, max_length=50, verbose_name='Key')),
+                ('count', models.IntegerField(default=0, verbose_name='Count')),
+                ('citations', models.BigIntegerField(default=0, verbose_name='Citations')),
+                ('impact_factor_sum', models.FloatField(default=0, verbose_name='Impact Factor Sum')),
+                ('impact_factor_count', models.IntegerField(default=0, verbose_name='Impact Factor Count')),
+            ],
+            options={
+                'verbose_name': 'Publication Summary',
+                'verbose_name_plural': 'Publication Summary',
+                'constraints': [models.UniqueConstraint(fields=('source', 'dimension', 'key'), name='publication_summary_unique')],
+            },
+        ),
+        migrations.RunPython(fill_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+# Checked in this order: "Заместитель председателя" also contains "председатель"
+ROLE_KEYS = (
+    ("заместитель", "vice_chairman"),
+    ("секретарь", "secretary"),
+    ("председатель", "chairman"),
+)
+
+
+def fill_role_keys(apps, schema_editor):
+    NTSCommitteeRole = apps.get_model("science", "NTSCommitteeRole")
+    for role in NTSCommitteeRole.objects.all():
+        name = role.name_ru.lower()
+        for fragment, key in ROLE_KEYS:
+            if fragment in name:
+                role.key = key
+                role.save(update_fields=["key"])
+                break
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('science', '0020_publication_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ntscommitteerole',
+            name='key',
+            field=models.CharField(choices=[('chairman', 'Председатель'), ('vice_chairman', 'Заместитель председателя'), ('secretary', 'Секретарь'), ('member', 'Член совета')], default='member', help_text='Stable key used to place members on the committee page', max_length=20, verbose_name='Role Key'),
+        ),
+        migrations.RunPython(fill_role_keys, migrations.RunPython.noop),
+    ]
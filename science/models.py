@@ -4,6 +4,9 @@ from ckeditor_uploader.fields import RichTextUploadingField
 import os
 from django.core.exceptions import ValidationError
 from .validators import validate_pdf
+from .search import SEARCH_FIELDS, build_search_text
+from ac_back.statistics import metric_choices
+from ac_back.localization import LocalizedQuerySet, get_localized
 
 # Scientific Direction model
 class ScientificDirection(models.Model):
@@ -339,28 +342,50 @@ class Publication(models.Model):
     is_active = models.BooleanField(_("Active"), default=True)
     order = models.IntegerField(_("Order"), default=0)
 
+    # Titles and authors in all languages, lower-cased; see science.search
+    search_text = models.TextField(_("Search Text"), blank=True, default="", editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LocalizedQuerySet.as_manager()
+
     class Meta:
         ordering = ["-year", "-order", "title_ru"]
         verbose_name = _("Publication")
         verbose_name_plural = _("Publications")
+        indexes = [
+            # featured / regular split on the publications page
+            models.Index(
+                fields=["is_featured", "order", "-year"],
+                name="publication_featured_order_idx",
+            ),
+            models.Index(
+                fields=["publication_type", "-year"],
+                name="publication_type_year_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title_ru} ({self.year})"
 
+    def save(self, *args, **kwargs):
+        # Skip the rebuild when the translated columns were deferred (localized())
+        if not set(SEARCH_FIELDS) & self.get_deferred_fields():
+            self.search_text = build_search_text(self)
+        super().save(*args, **kwargs)
+
     def get_title(self, language="ru"):
         """Получить заголовок на нужном языке"""
-        return getattr(self, f"title_{language}", self.title_ru)
+        return get_localized(self, "title", language)
 
     def get_abstract(self, language="ru"):
         """Получить аннотацию на нужном языке"""
-        return getattr(self, f"abstract_{language}", self.abstract_ru)
+        return get_localized(self, "abstract", language)
 
     def get_authors(self, language="ru"):
         """Получить авторов на нужном языке"""
-        return getattr(self, f"author_{language}", self.author_ru)
+        return get_localized(self, "author", language)
 
     def get_journal(self, language="ru"):
         """Получить название журнала (без переводов)"""
@@ -393,6 +418,13 @@ class PublicationStats(models.Model):
     label_kg = models.CharField(_("Label (Kyrgyz)"), max_length=255, blank=True)
 
     value = models.IntegerField(_("Value"))
+    metric = models.CharField(
+        _("Computed Metric"),
+        max_length=100,
+        choices=metric_choices,
+        blank=True,
+        help_text=_("When set, the value is computed from the data instead of entered by hand"),
+    )
     icon = models.CharField(_("Icon Class"), max_length=50, blank=True)
     order = models.IntegerField(_("Order"), default=0)
 
@@ -406,6 +438,37 @@ class PublicationStats(models.Model):
 
 
 
+class PublicationSummary(models.Model):
+    """
+    Сводные показатели публикаций, поддерживаемые инкрементально (science.summary).
+
+    One row per (source, dimension, key), e.g. ("publications", "year", "2024")
+    or ("scopus", "citations", "12") — the latter is a histogram of citation
+    counts, enough to derive the h-index and i10 without reading every paper.
+    """
+
+    source = models.CharField(_("Source"), max_length=20)
+    dimension = models.CharField(_("Dimension"), max_length=20)
+    key = models.CharField(_("Key"), max_length=50, blank=True)
+    count = models.IntegerField(_("Count"), default=0)
+    citations = models.BigIntegerField(_("Citations"), default=0)
+    impact_factor_sum = models.FloatField(_("Impact Factor Sum"), default=0)
+    impact_factor_count = models.IntegerField(_("Impact Factor Count"), default=0)
+
+    class Meta:
+        verbose_name = _("Publication Summary")
+        verbose_name_plural = _("Publication Summary")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "dimension", "key"],
+                name="publication_summary_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.source}/{self.dimension}/{self.key}: {self.count}"
+
+
 class DissertationDefense(models.Model):
     """Model for dissertation defense information"""
 
@@ -514,9 +577,27 @@ class ConferenceNotice(models.Model):
 
 # --- NTS committee models (previously in nts_committee.py) ---
 class NTSCommitteeRole(models.Model):
+    CHAIRMAN = "chairman"
+    VICE_CHAIRMAN = "vice_chairman"
+    SECRETARY = "secretary"
+    MEMBER = "member"
+    KEY_CHOICES = [
+        (CHAIRMAN, "Председатель"),
+        (VICE_CHAIRMAN, "Заместитель председателя"),
+        (SECRETARY, "Секретарь"),
+        (MEMBER, "Член совета"),
+    ]
+
     name_ru = models.CharField("Name (Russian)", max_length=255)
     name_en = models.CharField("Name (English)", max_length=255, blank=True)
     name_kg = models.CharField("Name (Kyrgyz)", max_length=255, blank=True)
+    key = models.CharField(
+        "Role Key",
+        max_length=20,
+        choices=KEY_CHOICES,
+        default=MEMBER,
+        help_text="Stable key used to place members on the committee page",
+    )
     order = models.IntegerField(default=0)
 
     class Meta:
@@ -823,6 +904,13 @@ class ScopusStats(models.Model):
     label_en = models.CharField("Label (English)", max_length=255, blank=True)
     label_kg = models.CharField("Label (Kyrgyz)", max_length=255, blank=True)
     value = models.IntegerField()
+    metric = models.CharField(
+        "Computed Metric",
+        max_length=100,
+        choices=metric_choices,
+        blank=True,
+        help_text="When set, the value is computed from the data instead of entered by hand",
+    )
     order = models.IntegerField(default=0)
 
     class Meta:
@@ -849,6 +937,8 @@ class ScopusSection(models.Model):
     description_kg = models.TextField("Description (Kyrgyz)", blank=True)
     order = models.IntegerField(default=0)
 
+    objects = LocalizedQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Scopus Section"
         verbose_name_plural = "Scopus Sections"
@@ -857,11 +947,11 @@ class ScopusSection(models.Model):
     def __str__(self):
         return self.title_ru
 
-    def get_title(self):
-        return self.title_ru or self.title_en or self.title_kg or ""
+    def get_title(self, language="ru"):
+        return get_localized(self, "title", language)
 
-    def get_description(self):
-        return self.description_ru or self.description_en or self.description_kg or ""
+    def get_description(self, language="ru"):
+        return get_localized(self, "description", language)
 
 
 # --- Web of Science models (merged from models/webofscience.py) ---
@@ -930,6 +1020,9 @@ class WebOfScienceMetric(models.Model):
         verbose_name_plural = _("Web of Science Metrics")
         ordering = ["time_range", "order"]
         unique_together = ["time_range", "key"]
+        indexes = [
+            models.Index(fields=["time_range", "order"], name="wos_metric_range_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.label_ru}: {self.value} ({self.time_range})"
@@ -971,6 +1064,10 @@ class WebOfScienceCategory(models.Model):
         verbose_name = _("Web of Science Category")
         verbose_name_plural = _("Web of Science Categories")
         ordering = ["time_range", "order"]
+        indexes = [
+            models.Index(fields=["time_range", "order"], name="wos_category_range_order_idx"),
+            models.Index(fields=["time_range", "-count"], name="wos_category_range_count_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name_ru}: {self.count} ({self.time_range})"
@@ -1004,6 +1101,10 @@ class WebOfScienceCollaboration(models.Model):
         verbose_name = _("Web of Science Collaboration")
         verbose_name_plural = _("Web of Science Collaborations")
         ordering = ["time_range", "order"]
+        indexes = [
+            models.Index(fields=["time_range", "order"], name="wos_collab_range_order_idx"),
+            models.Index(fields=["time_range", "-publications"], name="wos_collab_range_pubs_idx"),
+        ]
 
     def __str__(self):
         return (
@@ -1037,6 +1138,9 @@ class WebOfScienceJournalQuartile(models.Model):
         verbose_name = _("Web of Science Journal Quartile")
         verbose_name_plural = _("Web of Science Journal Quartiles")
         ordering = ["time_range", "order"]
+        indexes = [
+            models.Index(fields=["time_range", "order"], name="wos_quartile_range_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.quartile}: {self.count} ({self.time_range})"
@@ -1076,6 +1180,9 @@ class WebOfScienceAdditionalMetric(models.Model):
         verbose_name_plural = _("Web of Science Additional Metrics")
         ordering = ["time_range", "order"]
         unique_together = ["time_range", "key"]
+        indexes = [
+            models.Index(fields=["time_range", "order"], name="wos_addmetric_range_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title_ru}: {self.value} ({self.time_range})"
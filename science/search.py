@@ -0,0 +1,55 @@
+"""
+Поиск по научным публикациям.
+
+On PostgreSQL the search runs against ``Publication.search_text`` (titles and
+authors in every language, lower-cased), which carries a ``pg_trgm`` GIN
+index: substring matches use ``LIKE`` and typos are tolerated through the
+word-similarity operator, both served by the same index, and results are
+ranked by similarity. Other databases (local SQLite) keep the plain
+``icontains`` search over the individual columns.
+"""
+
+from django.db import connection
+from django.db.models import F, Q, Value
+
+SEARCH_FIELDS = (
+    "title_ru",
+    "title_en",
+    "title_kg",
+    "author_ru",
+    "author_en",
+    "author_kg",
+)
+
+
+def build_search_text(publication):
+    """Denormalized text stored in ``Publication.search_text``"""
+    values = (getattr(publication, field, "") for field in SEARCH_FIELDS)
+    return " ".join(value.strip() for value in values if value).lower()
+
+
+def search_publications(queryset, term):
+    """Filter ``queryset`` by ``term``; ranked by relevance on PostgreSQL"""
+    term = (term or "").strip()
+    if not term:
+        return queryset
+
+    if connection.vendor != "postgresql":
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f"{field}__icontains": term})
+        return queryset.filter(condition)
+
+    from django.contrib.postgres.lookups import TrigramWordSimilar
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    normalized = term.lower()
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    return (
+        queryset.filter(
+            Q(search_text__contains=normalized)
+            | Q(TrigramWordSimilar(F("search_text"), Value(normalized)))
+        )
+        .annotate(search_rank=TrigramWordSimilarity(Value(normalized), "search_text"))
+        .order_by("-search_rank", *ordering)
+    )
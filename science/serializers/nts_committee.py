@@ -14,7 +14,7 @@ class NTSCommitteeRoleSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = NTSCommitteeRole
-        fields = ["id", "name"]
+        fields = ["id", "key", "name"]
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_name(self, obj):
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+from ac_back.statistics import metric_values
 from ..models import (
     ScopusMetrics,
     ScopusDocumentType,
@@ -42,6 +43,7 @@ class ScopusDocumentTypeSerializer(serializers.ModelSerializer):
 
 class ScopusStatsSerializer(serializers.ModelSerializer):
     label = serializers.SerializerMethodField()
+    value = serializers.SerializerMethodField()
 
     class Meta:
         model = ScopusStats
@@ -53,6 +55,12 @@ class ScopusStatsSerializer(serializers.ModelSerializer):
         language = self.context.get("language", "ru")
         return getattr(obj, f"label_{language}", obj.label_ru) or obj.label_ru
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_value(self, obj) -> int:
+        if obj.metric:
+            return metric_values(self.context).get(obj.metric, obj.value)
+        return obj.value
+
 
 class ScopusSectionSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
@@ -64,13 +72,8 @@ class ScopusSectionSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_title(self, obj) -> str:
-        language = self.context.get("language", "ru")
-        return getattr(obj, f"title_{language}", obj.title_ru) or obj.title_ru
+        return obj.get_title(self.context.get("language", "ru"))
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_description(self, obj) -> str:
-        language = self.context.get("language", "ru")
-        return (
-            getattr(obj, f"description_{language}", obj.description_ru)
-            or obj.description_ru
-        )
+        return obj.get_description(self.context.get("language", "ru"))
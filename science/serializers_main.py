@@ -27,6 +27,9 @@ from .serializers.scopus import (
 
 
 from .models import ScientificPublication
+from ac_back.pdf_metadata import PdfInfoField
+from ac_back.pdf_optimization import optimized_url
+from ac_back.statistics import metric_values
 
 # ==================== PUBLICATION SERIALIZERS ====================
 
@@ -37,6 +40,7 @@ class VestnikReleaseSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
     pdf = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model = VestnikRelease
@@ -45,6 +49,7 @@ class VestnikReleaseSerializer(serializers.ModelSerializer):
             "title",
             "description",
             "pdf",
+            "pdf_info",
         ]
 
     @extend_schema_field(OpenApiTypes.STR)
@@ -64,7 +69,7 @@ class VestnikReleaseSerializer(serializers.ModelSerializer):
         if not pdf:
             return None
         try:
-            return pdf.url
+            return optimized_url(pdf, self.context)
         except Exception:
             return str(pdf)
         
@@ -161,6 +166,7 @@ class PublicationStatsSerializer(serializers.ModelSerializer):
     """Сериализатор для статистики публикаций"""
 
     label = serializers.SerializerMethodField()
+    value = serializers.SerializerMethodField()
 
     class Meta:
         model = PublicationStats
@@ -171,11 +177,40 @@ class PublicationStatsSerializer(serializers.ModelSerializer):
         language = self.context.get("language", "ru")
         return getattr(obj, f"label_{language}", obj.label_ru)
 
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_value(self, obj):
+        if obj.metric:
+            return metric_values(self.context).get(obj.metric, obj.value)
+        return obj.value
+
+
+class PublicationYearCountSerializer(serializers.Serializer):
+    year = serializers.IntegerField()
+    count = serializers.IntegerField()
+
+
+class PublicationTypeCountSerializer(serializers.Serializer):
+    type = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class PublicationSummarySerializer(serializers.Serializer):
+    """Сводная статистика (science.summary.publication_summary)"""
+
+    total = serializers.IntegerField()
+    citations = serializers.IntegerField()
+    h_index = serializers.IntegerField()
+    i10_index = serializers.IntegerField()
+    avg_impact_factor = serializers.FloatField(allow_null=True)
+    by_year = PublicationYearCountSerializer(many=True)
+    by_type = PublicationTypeCountSerializer(many=True)
+
 
 class PublicationsPageSerializer(serializers.Serializer):
     """Сериализатор для полной страницы публикаций со статистикой"""
 
     stats = PublicationStatsSerializer(many=True)
+    summary = PublicationSummarySerializer()
     featured = serializers.SerializerMethodField()
     publications = serializers.SerializerMethodField()
 
@@ -202,6 +237,7 @@ class ScientificPublicationSerializer(serializers.ModelSerializer):
     title = serializers.SerializerMethodField()
     authors = serializers.SerializerMethodField()
     file = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("file")
 
     class Meta:
         model = ScientificPublication
@@ -210,6 +246,7 @@ class ScientificPublicationSerializer(serializers.ModelSerializer):
             "title",
             "authors",
             "file",
+            "pdf_info",
         ]
 
     @extend_schema_field(OpenApiTypes.STR)
@@ -233,7 +270,7 @@ class ScientificPublicationSerializer(serializers.ModelSerializer):
         try:
             request = self.context.get("request")
             if request:
-                return request.build_absolute_uri(file_field.url)
-            return file_field.url
+                return request.build_absolute_uri(optimized_url(file_field, self.context))
+            return optimized_url(file_field, self.context)
         except Exception:
             return None
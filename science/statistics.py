@@ -0,0 +1,41 @@
+from ac_back.statistics import register_computed_metric
+
+from .models import PublicationSummary
+from .summary import PUBLICATIONS, SCOPUS, publication_summary
+
+
+def _summary_value(source, name):
+    return lambda: publication_summary(source)[name]
+
+
+def _type_count(publication_type):
+    def compute():
+        for item in publication_summary(PUBLICATIONS)["by_type"]:
+            if item["type"] == publication_type:
+                return item["count"]
+        return 0
+
+    return compute
+
+
+# All science metrics read the incrementally maintained PublicationSummary
+for key, source, name, label in [
+    ("science.publications", PUBLICATIONS, "total", "Публикации"),
+    ("science.citations", PUBLICATIONS, "citations", "Цитирования"),
+    ("science.h_index", PUBLICATIONS, "h_index", "Индекс Хирша"),
+    ("science.i10_index", PUBLICATIONS, "i10_index", "Индекс i10"),
+    ("scopus.publications", SCOPUS, "total", "Публикации Scopus"),
+    ("scopus.citations", SCOPUS, "citations", "Цитирования Scopus"),
+    ("scopus.h_index", SCOPUS, "h_index", "Индекс Хирша Scopus"),
+    ("scopus.i10_index", SCOPUS, "i10_index", "Индекс i10 Scopus"),
+]:
+    register_computed_metric(
+        key, PublicationSummary, _summary_value(source, name), label=label
+    )
+
+register_computed_metric(
+    "science.articles",
+    PublicationSummary,
+    _type_count("article"),
+    label="Журнальные статьи",
+)
@@ -0,0 +1,260 @@
+"""
+Сводная статистика публикаций и цитирований.
+
+``PublicationSummary`` holds counts, citation sums and impact factor sums per
+(source, dimension, key) and is kept up to date from save/delete signals: each
+save subtracts the row's previous contribution and adds the new one with
+``F()`` updates, so pages never aggregate over the publication tables.
+
+Sources:
+
+* ``publications`` — active ``Publication`` rows by ``total``, ``year``,
+  ``type`` and ``citations`` (histogram of citation counts);
+* ``scopus`` — ``ScopusMetrics`` rows by ``total`` and ``citations``.
+
+Bulk operations bypass signals: run ``manage.py rebuild_publication_summary``
+after ``bulk_create``/``update()`` on these models.
+"""
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from ac_back.data_version import bump_data_version, cached_by_version
+
+PUBLICATIONS = "publications"
+SCOPUS = "scopus"
+
+# source -> (model label, fields read from the row, {dimension: field})
+SOURCES = {
+    PUBLICATIONS: (
+        "science.Publication",
+        ("is_active", "year", "publication_type", "citation_count", "impact_factor"),
+        {"year": "year", "type": "publication_type", "citations": "citation_count"},
+    ),
+    SCOPUS: (
+        "science.ScopusMetrics",
+        ("citation_count",),
+        {"citations": "citation_count"},
+    ),
+}
+
+ZERO = (0, 0, 0.0, 0)
+
+
+def _contribution(source, values):
+    """``{(dimension, key): (count, citations, if_sum, if_count)}`` of one row"""
+    if values is None or not values.get("is_active", True):
+        return {}
+    citations = values["citation_count"] or 0
+    impact_factor = values.get("impact_factor")
+    amounts = (
+        1,
+        citations,
+        impact_factor or 0.0,
+        0 if impact_factor is None else 1,
+    )
+    dimensions = SOURCES[source][2]
+    keys = [("total", "")]
+    keys += [(dimension, str(values[field])) for dimension, field in dimensions.items()]
+    return {key: amounts for key in keys}
+
+
+def _apply(source, old, new):
+    from .models import PublicationSummary
+
+    touched = []
+    for dimension, key in set(old) | set(new):
+        before = old.get((dimension, key), ZERO)
+        after = new.get((dimension, key), ZERO)
+        delta = [a - b for a, b in zip(after, before)]
+        if not any(delta):
+            continue
+        touched.append(key if dimension != "total" else None)
+        rows = PublicationSummary.objects.filter(
+            source=source, dimension=dimension, key=key
+        )
+        changes = dict(
+            count=F("count") + delta[0],
+            citations=F("citations") + delta[1],
+            impact_factor_sum=F("impact_factor_sum") + delta[2],
+            impact_factor_count=F("impact_factor_count") + delta[3],
+        )
+        if rows.update(**changes):
+            continue
+        try:
+            with transaction.atomic():
+                PublicationSummary.objects.create(
+                    source=source,
+                    dimension=dimension,
+                    key=key,
+                    count=delta[0],
+                    citations=delta[1],
+                    impact_factor_sum=delta[2],
+                    impact_factor_count=delta[3],
+                )
+        except IntegrityError:
+            # Created concurrently by another save
+            rows.update(**changes)
+
+    if not touched:
+        return
+    # Drop emptied buckets (a year or citation count nobody has any more)
+    PublicationSummary.objects.filter(
+        source=source, count__lte=0, key__in=[key for key in touched if key]
+    ).exclude(dimension="total").delete()
+    bump_data_version(PublicationSummary)
+
+
+def _row_values(source, instance):
+    fields = SOURCES[source][1]
+    return {field: getattr(instance, field) for field in fields}
+
+
+def _remember_previous(sender, instance, raw=False, update_fields=None, **kwargs):
+    source = sender._publication_summary_source
+    previous = None
+    if instance.pk is not None:
+        previous = (
+            sender._default_manager.filter(pk=instance.pk)
+            .values(*SOURCES[source][1])
+            .first()
+        )
+    instance._publication_summary_previous = previous
+
+
+def _on_save(sender, instance, update_fields=None, **kwargs):
+    source = sender._publication_summary_source
+    previous = getattr(instance, "_publication_summary_previous", None)
+    current = _row_values(source, instance)
+    if previous is not None and update_fields is not None:
+        # Only the saved fields reached the database
+        current = {
+            field: current[field] if field in update_fields else previous[field]
+            for field in current
+        }
+    _apply(source, _contribution(source, previous), _contribution(source, current))
+    instance._publication_summary_previous = current
+
+
+def _on_delete(sender, instance, **kwargs):
+    source = sender._publication_summary_source
+    _apply(source, _contribution(source, _row_values(source, instance)), {})
+
+
+def connect_signals():
+    from django.apps import apps
+
+    for source, (label, _fields, _dimensions) in SOURCES.items():
+        model = apps.get_model(label)
+        model._publication_summary_source = source
+        uid = f"publication-summary-{source}"
+        pre_save.connect(_remember_previous, sender=model, dispatch_uid=f"{uid}-pre")
+        post_save.connect(_on_save, sender=model, dispatch_uid=f"{uid}-save")
+        post_delete.connect(_on_delete, sender=model, dispatch_uid=f"{uid}-delete")
+
+
+def build_summary(PublicationSummary, Publication, ScopusMetrics):
+    """
+    Recompute the whole table from scratch with GROUP BY queries.
+
+    Takes the models as arguments so migrations can pass historical ones.
+    """
+    querysets = {
+        PUBLICATIONS: Publication.objects.filter(is_active=True),
+        SCOPUS: ScopusMetrics.objects.all(),
+    }
+    rows = []
+    for source, queryset in querysets.items():
+        has_impact_factor = source == PUBLICATIONS
+        aggregates = dict(
+            row_count=Count("pk"),
+            citation_sum=Sum("citation_count"),
+        )
+        if has_impact_factor:
+            aggregates.update(
+                if_sum=Sum("impact_factor"), if_count=Count("impact_factor")
+            )
+        groups = [("total", None)] + list(SOURCES[source][2].items())
+        for dimension, field in groups:
+            if field is None:
+                results = [queryset.order_by().aggregate(**aggregates)]
+            else:
+                results = queryset.values(field).annotate(**aggregates).order_by()
+            for result in results:
+                if not result["row_count"]:
+                    continue
+                rows.append(
+                    PublicationSummary(
+                        source=source,
+                        dimension=dimension,
+                        key="" if field is None else str(result[field]),
+                        count=result["row_count"],
+                        citations=result["citation_sum"] or 0,
+                        impact_factor_sum=result.get("if_sum") or 0.0,
+                        impact_factor_count=result.get("if_count") or 0,
+                    )
+                )
+
+    with transaction.atomic():
+        PublicationSummary.objects.all().delete()
+        PublicationSummary.objects.bulk_create(rows)
+    return len(rows)
+
+
+def rebuild_summary():
+    from .models import Publication, PublicationSummary, ScopusMetrics
+
+    count = build_summary(PublicationSummary, Publication, ScopusMetrics)
+    bump_data_version(PublicationSummary)
+    return count
+
+
+def h_index(histogram):
+    """h-index from ``{citation count: number of papers}``"""
+    h = papers = 0
+    for citations in sorted(histogram, reverse=True):
+        papers += histogram[citations]
+        h = max(h, min(citations, papers))
+    return h
+
+
+def _summarize(source):
+    from .models import PublicationSummary
+
+    total = {"count": 0, "citations": 0, "impact_factor_sum": 0.0, "impact_factor_count": 0}
+    by_year, by_type, histogram = [], [], {}
+    rows = PublicationSummary.objects.filter(source=source, count__gt=0).values(
+        "dimension", "key", *total
+    )
+    for row in rows:
+        if row["dimension"] == "total":
+            total = row
+        elif row["dimension"] == "year":
+            by_year.append({"year": int(row["key"]), "count": row["count"]})
+        elif row["dimension"] == "type":
+            by_type.append({"type": row["key"], "count": row["count"]})
+        elif row["dimension"] == "citations":
+            histogram[int(row["key"])] = row["count"]
+
+    average = None
+    if total["impact_factor_count"]:
+        average = round(total["impact_factor_sum"] / total["impact_factor_count"], 3)
+    return {
+        "total": total["count"],
+        "citations": total["citations"],
+        "h_index": h_index(histogram),
+        "i10_index": sum(n for citations, n in histogram.items() if citations >= 10),
+        "avg_impact_factor": average,
+        "by_year": sorted(by_year, key=lambda item: item["year"], reverse=True),
+        "by_type": sorted(by_type, key=lambda item: -item["count"]),
+    }
+
+
+def publication_summary(source=PUBLICATIONS):
+    """Precomputed statistics of ``source``, cached until the summary changes"""
+    from .models import PublicationSummary
+
+    return cached_by_version(
+        f"publication-summary:{source}", [PublicationSummary], lambda: _summarize(source)
+    )
@@ -13,6 +13,7 @@ from ..serializers import (
     NTSResearchDirectionSerializer,
     NTSCommitteeSectionSerializer,
 )
+from ac_back.localization import request_language
 
 
 class NTSCommitteeRoleViewSet(viewsets.ReadOnlyModelViewSet):
@@ -23,7 +24,7 @@ class NTSCommitteeRoleViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -35,21 +36,23 @@ class NTSResearchDirectionViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
 class NTSCommitteeMemberViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for retrieving NTS Committee members"""
 
-    queryset = NTSCommitteeMember.objects.filter(is_active=True).order_by(
-        "order", "full_name_ru"
+    queryset = (
+        NTSCommitteeMember.objects.filter(is_active=True)
+        .select_related("role")
+        .order_by("order", "full_name_ru")
     )
     serializer_class = NTSCommitteeMemberSerializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -61,10 +64,41 @@ class NTSCommitteeSectionViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
+LEADERSHIP_KEYS = (
+    NTSCommitteeRole.CHAIRMAN,
+    NTSCommitteeRole.VICE_CHAIRMAN,
+    NTSCommitteeRole.SECRETARY,
+)
+
+
+def load_committee_roster(context):
+    """
+    Serialized committee roster from a single query: the first active member
+    of each leadership role by ``NTSCommitteeRole.key`` plus everyone else.
+    """
+    queryset = (
+        NTSCommitteeMember.objects.filter(is_active=True)
+        .select_related("role")
+        .order_by("order", "full_name_ru")
+    )
+    objects = list(queryset)
+    data = NTSCommitteeMemberSerializer(objects, many=True, context=context).data
+
+    roster = {key: None for key in LEADERSHIP_KEYS}
+    roster["members"] = []
+    for obj, item in zip(objects, data):
+        key = obj.role.key if obj.role else None
+        if key in roster and roster[key] is None:
+            roster[key] = item
+        else:
+            roster["members"].append(item)
+    return roster
+
+
 @extend_schema(
     description="Get full NTS Committee page content",
     responses={
@@ -105,56 +139,17 @@ class NTSCommitteePageView(generics.GenericAPIView):
         """Get all NTS Committee page content"""
         try:
             # Prepare context with language
-            language = request.query_params.get("lang", "ru")
+            language = request_language(request)
             context = {
                 "request": request,
                 "language": language,
             }
 
-            # Try to find the chairman, vice-chairman and secretary
-            chairman_obj = NTSCommitteeMember.objects.filter(
-                role__name_ru__icontains="председатель", is_active=True
-            ).first()
-            chairman = (
-                NTSCommitteeMemberSerializer(chairman_obj, context=context).data
-                if chairman_obj
-                else None
-            )
-
-            vice_obj = NTSCommitteeMember.objects.filter(
-                role__name_ru__icontains="заместитель", is_active=True
-            ).first()
-            vice_chairman = (
-                NTSCommitteeMemberSerializer(vice_obj, context=context).data
-                if vice_obj
-                else None
-            )
-
-            secretary_obj = NTSCommitteeMember.objects.filter(
-                role__name_ru__icontains="секретарь", is_active=True
-            ).first()
-            secretary = (
-                NTSCommitteeMemberSerializer(secretary_obj, context=context).data
-                if secretary_obj
-                else None
-            )
-
-            # Get regular members (exclude chairman, vice-chairman and secretary)
-            excluded_ids = []
-            if chairman:
-                excluded_ids.append(chairman["id"])
-            if vice_chairman:
-                excluded_ids.append(vice_chairman["id"])
-            if secretary:
-                excluded_ids.append(secretary["id"])
-
-            members = NTSCommitteeMemberSerializer(
-                NTSCommitteeMember.objects.filter(is_active=True)
-                .exclude(id__in=excluded_ids)
-                .order_by("order", "full_name_ru"),
-                many=True,
-                context=context,
-            ).data
+            roster = load_committee_roster(context)
+            chairman = roster[NTSCommitteeRole.CHAIRMAN]
+            vice_chairman = roster[NTSCommitteeRole.VICE_CHAIRMAN]
+            secretary = roster[NTSCommitteeRole.SECRETARY]
+            members = roster["members"]
 
             # Get research directions
             research_directions = NTSResearchDirectionSerializer(
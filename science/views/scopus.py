@@ -11,6 +11,7 @@ from ..models import (
     ScopusJournal,
     ScopusPublisher,
     ScopusPublicationAuthor,
+    PublicationSummary,
 )
 from ..serializers import (
     ScopusMetricsSerializer,
@@ -23,6 +24,22 @@ from ..serializers import (
     ScopusPublisherSerializer,
     ScopusPublicationAuthorSerializer,
 )
+from ..summary import SCOPUS, publication_summary
+from ac_back.coalesce import get_or_compute
+from ac_back.localization import request_language
+
+# Models the Scopus page is built from
+SCOPUS_PAGE_MODELS = [
+    ScopusMetrics,
+    ScopusDocumentType,
+    ScopusPublication,
+    ScopusStats,
+    ScopusSection,
+    ScopusAuthor,
+    ScopusJournal,
+    ScopusPublicationAuthor,
+    PublicationSummary,
+]
 
 
 class ScopusMetricsViewSet(viewsets.ReadOnlyModelViewSet):
@@ -33,7 +50,7 @@ class ScopusMetricsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -45,7 +62,7 @@ class ScopusDocumentTypeViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -59,7 +76,7 @@ class ScopusPublicationViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -71,7 +88,7 @@ class ScopusAuthorViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -83,7 +100,7 @@ class ScopusJournalViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -95,7 +112,7 @@ class ScopusPublisherViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -107,7 +124,7 @@ class ScopusPublicationAuthorViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -119,7 +136,7 @@ class ScopusStatsViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -129,9 +146,18 @@ class ScopusSectionViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = ScopusSection.objects.all().order_by("order")
     serializer_class = ScopusSectionSerializer
 
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .localized(
+                request_language(self.request), "title", "description"
+            )
+        )
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -172,8 +198,17 @@ class ScopusPageView(generics.GenericAPIView):
 
     def get(self, request):
         """Get all Scopus page content"""
+        language = request_language(request)
+        # One worker rebuilds the page, the others get the cached copy
+        data = get_or_compute(
+            f"science:scopus-page:{language}",
+            SCOPUS_PAGE_MODELS,
+            lambda: self.build_page(request, language),
+        )
+        return Response(data)
+
+    def build_page(self, request, language):
         # Prepare context with language
-        language = request.query_params.get("lang", "ru")
         context = {
             "request": request,
             "language": language,
@@ -206,7 +241,9 @@ class ScopusPageView(generics.GenericAPIView):
 
         # Get section content
         sections = {}
-        section_objects = ScopusSection.objects.all()
+        section_objects = ScopusSection.objects.localized(
+            language, "title", "description"
+        )
 
         for section in section_objects:
             sections[section.section_key] = {
@@ -241,9 +278,11 @@ class ScopusPageView(generics.GenericAPIView):
             "document_types": document_types,
             "publications": publications,
             "stats": stats,
+            # Precomputed totals, h-index and i10 over ScopusMetrics
+            "summary": publication_summary(SCOPUS),
             "footer_text": footer_section.get("description"),
             "footer_title": footer_section.get("title"),
             "sections": sections,
         }
 
-        return Response(response_data)
+        return response_data
@@ -1,6 +1,7 @@
 from rest_framework import viewsets, generics
 from rest_framework.response import Response
 
+from ac_back.singleton import cached_first
 from ..models import (
     StudentScientificSocietyInfo,
     StudentScientificSocietyStat,
@@ -24,6 +25,21 @@ from ..serializers import (
     StudentScientificSocietyContactSerializer,
     StudentScientificSocietyPageSerializer,
 )
+from ac_back.coalesce import get_or_compute
+from ac_back.localization import request_language
+
+# Models the Student Scientific Society page is built from
+SSS_PAGE_MODELS = [
+    StudentScientificSocietyInfo,
+    StudentScientificSocietyStat,
+    StudentScientificSocietyFeature,
+    StudentScientificSocietyProject,
+    StudentScientificSocietyProjectTag,
+    StudentScientificSocietyEvent,
+    StudentScientificSocietyJoinStep,
+    StudentScientificSocietyLeader,
+    StudentScientificSocietyContact,
+]
 
 
 class StudentScientificSocietyInfoViewSet(viewsets.ReadOnlyModelViewSet):
@@ -34,7 +50,7 @@ class StudentScientificSocietyInfoViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -46,7 +62,7 @@ class StudentScientificSocietyStatViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -58,7 +74,7 @@ class StudentScientificSocietyFeatureViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -70,7 +86,7 @@ class StudentScientificSocietyProjectViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -91,7 +107,7 @@ class StudentScientificSocietyEventViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -103,7 +119,7 @@ class StudentScientificSocietyJoinStepViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -115,7 +131,7 @@ class StudentScientificSocietyLeaderViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -127,7 +143,7 @@ class StudentScientificSocietyContactViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -138,12 +154,23 @@ class StudentScientificSocietyPageView(generics.RetrieveAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
+    def retrieve(self, request, *args, **kwargs):
+        # One worker rebuilds the page, the others get the cached copy
+        data = get_or_compute(
+            f"science:sss-page:{request_language(request)}",
+            SSS_PAGE_MODELS,
+            lambda: self.get_serializer(self.get_object()).data,
+        )
+        return Response(data)
+
     def get_object(self):
-        # Get or create the info object (should only be one)
-        info, _ = StudentScientificSocietyInfo.objects.get_or_create(pk=1)
+        # The single info row; an unsaved default until it is filled in the admin
+        info = cached_first(
+            StudentScientificSocietyInfo.objects.order_by("pk"), "science:sss-info"
+        ) or StudentScientificSocietyInfo()
 
         # Get stats
         stats = StudentScientificSocietyStat.objects.all().order_by("order")
@@ -22,6 +22,29 @@ from ..serializers import (
     WebOfScienceSectionSerializer,
     WebOfSciencePageSerializer,
 )
+from ac_back.coalesce import get_or_compute
+from ac_back.data_version import cached_by_version
+from ac_back.localization import request_language
+
+# Models the Web of Science page is built from
+WOS_PAGE_MODELS = [
+    WebOfScienceTimeRange,
+    WebOfScienceMetric,
+    WebOfScienceCategory,
+    WebOfScienceCollaboration,
+    WebOfScienceJournalQuartile,
+    WebOfScienceAdditionalMetric,
+    WebOfScienceSection,
+]
+
+
+def time_range_keys():
+    """Keys of the existing time ranges"""
+    return cached_by_version(
+        "science:wos-time-range-keys",
+        [WebOfScienceTimeRange],
+        lambda: set(WebOfScienceTimeRange.objects.values_list("key", flat=True)),
+    )
 
 
 class WebOfScienceTimeRangeViewSet(viewsets.ModelViewSet):
@@ -32,7 +55,7 @@ class WebOfScienceTimeRangeViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -53,7 +76,7 @@ class WebOfScienceMetricViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -74,7 +97,7 @@ class WebOfScienceCategoryViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -95,7 +118,7 @@ class WebOfScienceCollaborationViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -116,7 +139,7 @@ class WebOfScienceJournalQuartileViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -139,7 +162,7 @@ class WebOfScienceAdditionalMetricViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -151,7 +174,7 @@ class WebOfScienceSectionViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -162,182 +185,17 @@ class WebOfSciencePageView(generics.RetrieveAPIView):
         try:
             # Get the requested time range or default to 'all'
             time_range_key = self.request.query_params.get("time_range", "all")
-
-            try:
-                time_range = WebOfScienceTimeRange.objects.get(key=time_range_key)
-            except WebOfScienceTimeRange.DoesNotExist:
-                # If the requested time range doesn't exist, get the default one
-                time_range = WebOfScienceTimeRange.objects.filter(
-                    is_default=True
-                ).first()
-                if not time_range:
-                    # If no default time range exists, get the first one
-                    time_range = WebOfScienceTimeRange.objects.first()
-
-            # Get language from query parameters
-            language = self.request.query_params.get("lang", "ru")
-
-            # Get all sections for the text content
-            sections = {}
-            for section in WebOfScienceSection.objects.all():
-                sections[section.section_key] = section.get_text(language)
-
-            # Get data as querysets
-            metrics = WebOfScienceMetric.objects.filter(time_range=time_range).order_by(
-                "order"
-            )
-            subject_categories = WebOfScienceCategory.objects.filter(
-                time_range=time_range
-            ).order_by("-count")[:8]
-
-            source_categories = WebOfScienceCategory.objects.filter(
-                time_range=time_range
-            ).order_by("-count")[:6]
-
-            collaborations = WebOfScienceCollaboration.objects.filter(
-                time_range=time_range
-            ).order_by("-publications")
-
-            journal_quartiles = WebOfScienceJournalQuartile.objects.filter(
-                time_range=time_range
-            ).order_by("order")
-
-            additional_metrics = WebOfScienceAdditionalMetric.objects.filter(
-                time_range=time_range
-            ).order_by("order")
-
-            # Sample time series data
-            year_labels = ["2018", "2019", "2020", "2021", "2022", "2023"]
-            publication_data = [18, 22, 25, 31, 28, 32]
-            citation_data = [145, 203, 275, 390, 420, 439]
-
-            # Prepare chart data
-            colors = [
-                "rgba(16, 185, 129, 0.8)",
-                "rgba(59, 130, 246, 0.8)",
-                "rgba(99, 102, 241, 0.8)",
-                "rgba(139, 92, 246, 0.8)",
-                "rgba(236, 72, 153, 0.8)",
-                "rgba(244, 63, 94, 0.8)",
-                "rgba(234, 88, 12, 0.8)",
-                "rgba(22, 163, 74, 0.8)",
-                "rgba(6, 182, 212, 0.8)",
-                "rgba(168, 85, 247, 0.8)",
-            ]
-
-            # Subject categories data for chart
-            subject_categories_data = {
-                "labels": [],
-                "datasets": [{"data": [], "backgroundColor": []}],
-            }
-
-            for i, category in enumerate(subject_categories):
-                subject_categories_data["labels"].append(category.get_name(language))
-                subject_categories_data["datasets"][0]["data"].append(category.count)
-                if i < len(colors):
-                    subject_categories_data["datasets"][0]["backgroundColor"].append(
-                        colors[i]
-                    )
-
-            # Source categories data for chart
-            source_categories_data = {
-                "labels": [],
-                "datasets": [{"data": [], "backgroundColor": []}],
-            }
-
-            for i, category in enumerate(source_categories):
-                source_categories_data["labels"].append(category.get_name(language))
-                source_categories_data["datasets"][0]["data"].append(category.count)
-                if i < len(colors):
-                    source_categories_data["datasets"][0]["backgroundColor"].append(
-                        colors[i]
-                    )
-
-            # Journal quartiles data for chart
-            journal_quartiles_data = {
-                "labels": [jq.quartile for jq in journal_quartiles],
-                "datasets": [
-                    {
-                        "data": [jq.count for jq in journal_quartiles],
-                        "backgroundColor": [
-                            "rgba(16, 185, 129, 0.8)",
-                            "rgba(59, 130, 246, 0.8)",
-                            "rgba(139, 92, 246, 0.8)",
-                            "rgba(244, 63, 94, 0.8)",
-                        ][: len(journal_quartiles)],
-                        "borderColor": [
-                            "rgba(16, 185, 129, 1)",
-                            "rgba(59, 130, 246, 1)",
-                            "rgba(139, 92, 246, 1)",
-                            "rgba(244, 63, 94, 1)",
-                        ][: len(journal_quartiles)],
-                    }
-                ],
-            }
-
-            # Language context for serializers
-            context = {"language": language}
-
-            # Сериализуем данные
-            metrics_serializer = WebOfScienceMetricSerializer(
-                metrics, many=True, context=context
-            )
-            collaborations_serializer = WebOfScienceCollaborationSerializer(
-                collaborations, many=True, context=context
-            )
-            additional_metrics_serializer = WebOfScienceAdditionalMetricSerializer(
-                additional_metrics, many=True, context=context
+            if time_range_key not in time_range_keys():
+                # Unknown ranges all get the default one: one cache entry
+                time_range_key = ""
+            language = request_language(self.request)
+
+            # One worker rebuilds the page, the others get the cached copy
+            formatted_data = get_or_compute(
+                f"science:wos-page:{time_range_key}:{language}",
+                WOS_PAGE_MODELS,
+                lambda: self.build_page(time_range_key, language),
             )
-
-            # Формируем финальные данные в формате, ожидаемом фронтендом
-            formatted_data = {
-                "pageData": {
-                    "title": sections.get("title", "Web of Science Publications"),
-                    "subtitle": sections.get(
-                        "subtitle", "Publications in Web of Science indexed journals"
-                    ),
-                    "titleIcon": "📊",
-                    "categoriesIcon": "📈",
-                    "collaborationsIcon": "🌍",
-                    "topJournalsIcon": "⭐",
-                    "timeRanges": {"5years": "5 Years", "10years": "10 Years"},
-                    "collaborationsInstitutions": sections.get(
-                        "collaborationsInstitutions", "institutions"
-                    ),
-                    "collaborationsPublications": sections.get(
-                        "collaborationsPublications", "publications"
-                    ),
-                    "topJournalsTitle": sections.get(
-                        "topJournalsTitle", "Publications by Journal Quartile"
-                    ),
-                    "categoriesTitle": sections.get(
-                        "categoriesTitle", "Publications by Category"
-                    ),
-                    "collaborationsTitle": sections.get(
-                        "collaborationsTitle", "International Collaboration"
-                    ),
-                    "additionalMetrics": additional_metrics_serializer.data,
-                },
-                "metrics": {
-                    "5years": {
-                        "main": {},
-                        "categories": subject_categories_data,
-                        "collaborations": collaborations_serializer.data,
-                        "topJournals": journal_quartiles_data,
-                    }
-                },
-            }
-
-            # Заполняем основные метрики
-            for i, metric_data in enumerate(metrics_serializer.data):
-                if metric_data and metric_data.get("key"):
-                    formatted_data["metrics"]["5years"]["main"][metric_data["key"]] = {
-                        "value": metric_data.get("value", "0"),
-                        "label": metric_data.get("label", ""),
-                        "icon": metric_data.get("icon", "📊"),
-                        "description": metric_data.get("description", ""),
-                    }
-
             return Response(formatted_data)
 
         except Exception as e:
@@ -349,3 +207,179 @@ class WebOfSciencePageView(generics.RetrieveAPIView):
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    def build_page(self, time_range_key, language):
+        """Page payload for one time range and language"""
+        try:
+            time_range = WebOfScienceTimeRange.objects.get(key=time_range_key)
+        except WebOfScienceTimeRange.DoesNotExist:
+            # If the requested time range doesn't exist, get the default one
+            time_range = WebOfScienceTimeRange.objects.filter(
+                is_default=True
+            ).first()
+            if not time_range:
+                # If no default time range exists, get the first one
+                time_range = WebOfScienceTimeRange.objects.first()
+
+        # Get all sections for the text content
+        sections = {}
+        for section in WebOfScienceSection.objects.all():
+            sections[section.section_key] = section.get_text(language)
+
+        # Get data as querysets
+        metrics = WebOfScienceMetric.objects.filter(time_range=time_range).order_by(
+            "order"
+        )
+        subject_categories = WebOfScienceCategory.objects.filter(
+            time_range=time_range
+        ).order_by("-count")[:8]
+
+        source_categories = WebOfScienceCategory.objects.filter(
+            time_range=time_range
+        ).order_by("-count")[:6]
+
+        collaborations = WebOfScienceCollaboration.objects.filter(
+            time_range=time_range
+        ).order_by("-publications")
+
+        journal_quartiles = WebOfScienceJournalQuartile.objects.filter(
+            time_range=time_range
+        ).order_by("order")
+
+        additional_metrics = WebOfScienceAdditionalMetric.objects.filter(
+            time_range=time_range
+        ).order_by("order")
+
+        # Sample time series data
+        year_labels = ["2018", "2019", "2020", "2021", "2022", "2023"]
+        publication_data = [18, 22, 25, 31, 28, 32]
+        citation_data = [145, 203, 275, 390, 420, 439]
+
+        # Prepare chart data
+        colors = [
+            "rgba(16, 185, 129, 0.8)",
+            "rgba(59, 130, 246, 0.8)",
+            "rgba(99, 102, 241, 0.8)",
+            "rgba(139, 92, 246, 0.8)",
+            "rgba(236, 72, 153, 0.8)",
+            "rgba(244, 63, 94, 0.8)",
+            "rgba(234, 88, 12, 0.8)",
+            "rgba(22, 163, 74, 0.8)",
+            "rgba(6, 182, 212, 0.8)",
+            "rgba(168, 85, 247, 0.8)",
+        ]
+
+        # Subject categories data for chart
+        subject_categories_data = {
+            "labels": [],
+            "datasets": [{"data": [], "backgroundColor": []}],
+        }
+
+        for i, category in enumerate(subject_categories):
+            subject_categories_data["labels"].append(category.get_name(language))
+            subject_categories_data["datasets"][0]["data"].append(category.count)
+            if i < len(colors):
+                subject_categories_data["datasets"][0]["backgroundColor"].append(
+                    colors[i]
+                )
+
+        # Source categories data for chart
+        source_categories_data = {
+            "labels": [],
+            "datasets": [{"data": [], "backgroundColor": []}],
+        }
+
+        for i, category in enumerate(source_categories):
+            source_categories_data["labels"].append(category.get_name(language))
+            source_categories_data["datasets"][0]["data"].append(category.count)
+            if i < len(colors):
+                source_categories_data["datasets"][0]["backgroundColor"].append(
+                    colors[i]
+                )
+
+        # Journal quartiles data for chart
+        journal_quartiles_data = {
+            "labels": [jq.quartile for jq in journal_quartiles],
+            "datasets": [
+                {
+                    "data": [jq.count for jq in journal_quartiles],
+                    "backgroundColor": [
+                        "rgba(16, 185, 129, 0.8)",
+                        "rgba(59, 130, 246, 0.8)",
+                        "rgba(139, 92, 246, 0.8)",
+                        "rgba(244, 63, 94, 0.8)",
+                    ][: len(journal_quartiles)],
+                    "borderColor": [
+                        "rgba(16, 185, 129, 1)",
+                        "rgba(59, 130, 246, 1)",
+                        "rgba(139, 92, 246, 1)",
+                        "rgba(244, 63, 94, 1)",
+                    ][: len(journal_quartiles)],
+                }
+            ],
+        }
+
+        # Language context for serializers
+        context = {"language": language}
+
+        # Сериализуем данные
+        metrics_serializer = WebOfScienceMetricSerializer(
+            metrics, many=True, context=context
+        )
+        collaborations_serializer = WebOfScienceCollaborationSerializer(
+            collaborations, many=True, context=context
+        )
+        additional_metrics_serializer = WebOfScienceAdditionalMetricSerializer(
+            additional_metrics, many=True, context=context
+        )
+
+        # Формируем финальные данные в формате, ожидаемом фронтендом
+        formatted_data = {
+            "pageData": {
+                "title": sections.get("title", "Web of Science Publications"),
+                "subtitle": sections.get(
+                    "subtitle", "Publications in Web of Science indexed journals"
+                ),
+                "titleIcon": "📊",
+                "categoriesIcon": "📈",
+                "collaborationsIcon": "🌍",
+                "topJournalsIcon": "⭐",
+                "timeRanges": {"5years": "5 Years", "10years": "10 Years"},
+                "collaborationsInstitutions": sections.get(
+                    "collaborationsInstitutions", "institutions"
+                ),
+                "collaborationsPublications": sections.get(
+                    "collaborationsPublications", "publications"
+                ),
+                "topJournalsTitle": sections.get(
+                    "topJournalsTitle", "Publications by Journal Quartile"
+                ),
+                "categoriesTitle": sections.get(
+                    "categoriesTitle", "Publications by Category"
+                ),
+                "collaborationsTitle": sections.get(
+                    "collaborationsTitle", "International Collaboration"
+                ),
+                "additionalMetrics": additional_metrics_serializer.data,
+            },
+            "metrics": {
+                "5years": {
+                    "main": {},
+                    "categories": subject_categories_data,
+                    "collaborations": collaborations_serializer.data,
+                    "topJournals": journal_quartiles_data,
+                }
+            },
+        }
+
+        # Заполняем основные метрики
+        for i, metric_data in enumerate(metrics_serializer.data):
+            if metric_data and metric_data.get("key"):
+                formatted_data["metrics"]["5years"]["main"][metric_data["key"]] = {
+                    "value": metric_data.get("value", "0"),
+                    "label": metric_data.get("label", ""),
+                    "icon": metric_data.get("icon", "📊"),
+                    "description": metric_data.get("description", ""),
+                }
+
+        return formatted_data
@@ -1,15 +1,18 @@
 # This file is deprecated and kept only for backward compatibility
 # All views are now split between views_main.py and views/ package
-from rest_framework import viewsets, generics
+from rest_framework import viewsets, generics, status
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
-from django.db.models import Q
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from .models import ScientificPublication
+from .search import search_publications
+from .summary import PUBLICATIONS, publication_summary
 from .serializers_main import ScientificPublicationSerializer
 
 from .models import (
     Publication,
     PublicationStats,
+    PublicationSummary,
     VestnikYear,
     VestnikRelease
 )
@@ -42,6 +45,12 @@ from .views import (
     WebOfScienceSectionViewSet,
     WebOfSciencePageView,
 )
+from ac_back.coalesce import get_or_compute
+from ac_back.localization import request_language
+
+PUBLICATION_TYPES = [
+    value for value, _ in Publication._meta.get_field("publication_type").choices
+]
 
 __all__ = [
     "PublicationsViewSet",
@@ -79,33 +88,37 @@ class PublicationsViewSet(viewsets.ModelViewSet):
 
     queryset = Publication.objects.all().order_by("order", "-year", "-id")
     serializer_class = PublicationSerializer
+    # "title" is the localized alias annotated in get_queryset
+    ordering_fields = ["order", "year", "citation_count", "title"]
 
     def get_queryset(self):
         queryset = super().get_queryset()
 
+        # Resolve translations in the DB for read requests only: writes need
+        # the raw *_ru/*_en/*_kg columns and a fresh representation afterwards
+        if self.request.method in SAFE_METHODS:
+            queryset = queryset.localized(
+                request_language(self.request),
+                "title",
+                "abstract",
+                "author",
+            )
+
         # Filter by type if specified
         pub_type = self.request.query_params.get("type")
         if pub_type:
             queryset = queryset.filter(publication_type=pub_type)
 
-        # Filter by search term if provided
-        search = self.request.query_params.get("search")
-        if search:
-            # Search across all language versions
-            queryset = queryset.filter(
-                Q(title_ru__icontains=search)
-                | Q(title_en__icontains=search)
-                | Q(title_kg__icontains=search)
-                | Q(author_ru__icontains=search)
-                | Q(author_en__icontains=search)
-                | Q(author_kg__icontains=search)
-            )
+        # Search across all language versions (trigram index on PostgreSQL)
+        queryset = search_publications(
+            queryset, self.request.query_params.get("search")
+        )
 
         return queryset
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -117,7 +130,7 @@ class PublicationStatsViewSet(viewsets.ModelViewSet):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
@@ -148,49 +161,74 @@ class PublicationsPageView(generics.GenericAPIView):
         ]
     )
     def get(self, request):
+        language = request_language(request)
+        pub_type = request.query_params.get("type")
+        if pub_type and pub_type not in PUBLICATION_TYPES:
+            # Each value would be a separate cached page
+            return Response(
+                {
+                    "detail": "Invalid publication type. Use: "
+                    + ", ".join(PUBLICATION_TYPES)
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        search = request.query_params.get("search")
+        if search:
+            # Free-text searches are too varied to share a cached page
+            return Response(self.build_page(request, language, pub_type, search))
+
+        # One worker rebuilds the page, the others get the cached copy.
+        # File URLs are absolute, hence the host in the key.
+        data = get_or_compute(
+            f"science:publications-page:{request.get_host()}:{language}:{pub_type or ''}",
+            [PublicationStats, Publication, PublicationSummary],
+            lambda: self.build_page(request, language, pub_type),
+        )
+        return Response(data)
+
+    def build_page(self, request, language, pub_type=None, search=None):
         # Get stats
         stats = PublicationStats.objects.all().order_by("order")
 
+        localized = Publication.objects.localized(
+            language, "title", "abstract", "author"
+        )
+
         # Get featured publications
-        featured = Publication.objects.filter(is_featured=True).order_by(
+        featured = localized.filter(is_featured=True).order_by(
             "order", "-year", "-id"
         )
 
         # Get regular publications with filters
-        publications = Publication.objects.filter(is_featured=False).order_by(
+        publications = localized.filter(is_featured=False).order_by(
             "order", "-year", "-id"
         )
 
         # Apply type filter if specified
-        pub_type = request.query_params.get("type")
         if pub_type:
             publications = publications.filter(publication_type=pub_type)
 
         # Apply search filter if specified
-        search = request.query_params.get("search")
-        if search:
-            publications = publications.filter(
-                Q(title_ru__icontains=search)
-                | Q(title_en__icontains=search)
-                | Q(title_kg__icontains=search)
-                | Q(author_ru__icontains=search)
-                | Q(author_en__icontains=search)
-                | Q(author_kg__icontains=search)
-            )
+        publications = search_publications(publications, search)
 
         # Prepare context with language
         context = {
             "request": request,
-            "language": request.query_params.get("lang", "ru"),
+            "language": language,
         }
 
         # Serialize all components
         serializer = PublicationsPageSerializer(
-            {"stats": stats, "featured": featured, "publications": publications},
+            {
+                "stats": stats,
+                "summary": publication_summary(PUBLICATIONS),
+                "featured": featured,
+                "publications": publications,
+            },
             context=context,
         )
 
-        return Response(serializer.data)
+        return serializer.data
 
 
 # ==================== VESTNIK VIEWS ====================
@@ -204,7 +242,7 @@ class VestnikYearViewSet(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 # ==================== SCIENTIFIC PUBLICATION VIEWS ====================
@@ -218,7 +256,7 @@ class ScientificPublicationListView(generics.ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["language"] = self.request.query_params.get("lang", "ru")
+        context["language"] = request_language(self.request)
         return context
 
 
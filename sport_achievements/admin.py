@@ -1,9 +1,11 @@
 from django.contrib import admin
+
+from ac_back.export import ExportAdminMixin
 from .models import SportAchievement
 
 
 @admin.register(SportAchievement)
-class SportAchievementAdmin(admin.ModelAdmin):
+class SportAchievementAdmin(ExportAdminMixin, admin.ModelAdmin):
     list_display = ["id", "full_name_ru", "is_active", "created_at"]
     list_filter = ["is_active"]
     search_fields = ["full_name_ru", "full_name_en", "full_name_kg"]
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import SportAchievement
+from ac_back.localization import request_language
 
 
 class SportAchievementSerializer(serializers.ModelSerializer):
@@ -14,7 +15,7 @@ class SportAchievementSerializer(serializers.ModelSerializer):
         """Получаем язык из query-параметра. По умолчанию — ru."""
         request = self.context.get("request")
         if request:
-            lang = request.query_params.get("lang", "ru")
+            lang = request_language(request)
             if lang not in ["ru", "en", "kg"]:
                 lang = "ru"
             return lang
@@ -12,6 +12,7 @@ from .models import (
 )
 from .models import SportType
 from django.utils import translation
+from ac_back.localization import request_language
 
 # Map known seeded Russian placeholder strings to localized labels.
 # This avoids showing untranslated placeholder text coming from demo data.
@@ -65,14 +66,14 @@ class TrainingScheduleSerializer(serializers.ModelSerializer):
     def get_location(self, obj):
         request = self.context.get("request")
         language = self.context.get("language") or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         return obj.get_location(language)
 
     def get_day(self, obj):
         request = self.context.get("request")
         language = self.context.get("language") or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         prev = translation.get_language()
         try:
@@ -158,7 +159,7 @@ class SportSectionSerializer(serializers.ModelSerializer):
     def get_coach_info(self, obj):
         request = self.context.get("request")
         language = self.context.get("language") or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         return {
             "name": obj.get_coach_name(language),
@@ -172,7 +173,7 @@ class SportSectionSerializer(serializers.ModelSerializer):
     def get_coach(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         return obj.get_coach_name(language)
 
@@ -184,14 +185,14 @@ class SportSectionSerializer(serializers.ModelSerializer):
     def get_schedule(self, obj):
         request = self.context.get("request")
         language = self.context.get("language") or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         return obj.get_schedule(language)
 
     def to_representation(self, instance):
         # Получаем язык из контекста
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         self.context["language"] = language
 
         data = super().to_representation(instance)
@@ -265,7 +266,7 @@ class AchievementSerializer(serializers.ModelSerializer):
         """Return localized description (handles seeded placeholder values)."""
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_description(language)
         return _localize_placeholder(raw, language)
@@ -273,7 +274,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_name(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_name(language)
         return _localize_placeholder(raw, language)
@@ -281,7 +282,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_athlete_name(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_name(language)
         return _localize_placeholder(raw, language)
@@ -289,7 +290,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_sport_type(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         # Prefer model-level translated field if present
         # Prefer model-level translated field if present
@@ -300,7 +301,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_sport(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_sport(language) if hasattr(obj, "get_sport") else None
         return _localize_placeholder(raw, language)
@@ -308,7 +309,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_competition(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_competition(language) if hasattr(obj, "get_competition") else None
         return _localize_placeholder(raw, language)
@@ -316,7 +317,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_result(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_result(language) if hasattr(obj, "get_result") else None
         return _localize_placeholder(raw, language)
@@ -324,7 +325,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_event(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = (
             obj.get_competition(language)
@@ -336,7 +337,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_place(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_result(language) if hasattr(obj, "get_result") else obj.result
         return _localize_placeholder(raw, language)
@@ -344,7 +345,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def get_achievement(self, obj):
         request = self.context.get("request")
         language = self.context.get("language", None) or (
-            request.query_params.get("language") if request else "ru"
+            request_language(request) if request else "ru"
         )
         raw = obj.get_result(language) if hasattr(obj, "get_result") else obj.result
         return _localize_placeholder(raw, language)
@@ -367,7 +368,7 @@ class AchievementSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         # Получаем язык из контекста
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         self.context["language"] = language
 
         data = super().to_representation(instance)
@@ -462,7 +463,7 @@ class InfrastructureObjectSerializer(serializers.ModelSerializer):
         This method returns a list of strings localized for the requested language.
         """
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
 
         raw = obj.features or []
         out = []
@@ -485,7 +486,7 @@ class InfrastructureObjectSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         # Получаем язык из контекста
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         self.context["language"] = language
 
         data = super().to_representation(instance)
@@ -514,7 +515,7 @@ class InfrastructureCategorySerializer(serializers.ModelSerializer):
 
     def get_objects(self, obj):
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
 
         include_inactive = False
         if request:
@@ -540,7 +541,7 @@ class InfrastructureCategorySerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         # Получаем язык из контекста
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         self.context["language"] = language
 
         data = super().to_representation(instance)
@@ -593,7 +594,7 @@ class InfrastructureSerializer(serializers.ModelSerializer):
     def get_stats(self, obj):
         """Получаем статистику из связанной модели InfrastructureStatistic"""
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         include_inactive = False
         if request:
             q = request.query_params.get("include_inactive", "false").lower()
@@ -611,13 +612,13 @@ class InfrastructureSerializer(serializers.ModelSerializer):
 
     def get_badge_translated(self, obj):
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         return obj.get_badge(language)
 
     def get_categories(self, obj):
         """Получаем категории инфраструктуры"""
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
 
         categories = obj.categories.all().order_by("order")
         serializer = InfrastructureCategorySerializer(
@@ -628,7 +629,7 @@ class InfrastructureSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         # Получаем язык из контекста
         request = self.context.get("request")
-        language = request.query_params.get("language", "ru") if request else "ru"
+        language = request_language(request) if request else "ru"
         self.context["language"] = language
 
         data = super().to_representation(instance)
@@ -647,7 +648,7 @@ class SportTypeSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         language = None
         if request:
-            language = request.query_params.get("language") or getattr(
+            language = request_language(request) or getattr(
                 request, "LANGUAGE_CODE", None
             )
         language = language or "ru"
@@ -0,0 +1,24 @@
+from django.db.models import Count, Q
+
+from ac_back.statistics import register_metric
+
+from .models import Achievement, SportSection, SportType
+
+register_metric(
+    "sports.sections",
+    SportSection,
+    Count("id", filter=Q(is_active=True)),
+    label="Спортивные секции",
+)
+register_metric(
+    "sports.achievements",
+    Achievement,
+    Count("id", filter=Q(is_active=True)),
+    label="Спортивные достижения",
+)
+register_metric(
+    "sports.types",
+    SportType,
+    Count("id", filter=Q(is_active=True)),
+    label="Виды спорта",
+)
@@ -1,5 +1,4 @@
 from rest_framework import generics
-import django.db.models as dj_models
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
@@ -9,8 +8,11 @@ from .serializers import (
     AchievementSerializer,
     InfrastructureSerializer,
 )
-from .models import SportType
+from .models import SportType, AchievementCategory
 from .serializers import SportTypeSerializer
+from ac_back.data_version import cached_by_version
+from ac_back.statistics import group_counts
+from ac_back.localization import request_language
 
 
 class SportSectionListAPIView(generics.ListAPIView):
@@ -167,68 +169,29 @@ class SportStatisticsAPIView(APIView):
     """
 
     def get(self, request):
-        from django.db.models import Count
-
-        sections_count = SportSection.objects.filter(is_active=True).count()
-        achievements_count = Achievement.objects.filter(is_active=True).count()
-
-        # Try DB-level aggregation (fast). If it fails for any reason, fall back to Python aggregation.
-        try:
-            sections_by_type_qs = (
-                SportSection.objects.filter(is_active=True)
-                .values(sport_type=dj_models.F("sport_type__slug"))
-                .annotate(count=Count("id"))
-            )
-            achievements_by_category_qs = (
-                Achievement.objects.filter(is_active=True)
-                .values(category=dj_models.F("category__slug"))
-                .annotate(count=Count("id"))
+        return Response(
+            cached_by_version(
+                "sports-statistics",
+                [SportSection, Achievement, SportType, AchievementCategory],
+                compute_sport_statistics,
             )
+        )
 
-            sections_by_type = list(sections_by_type_qs)
-            achievements_by_category = list(achievements_by_category_qs)
-        except Exception as e:
-            # Fallback: compute counts in Python to avoid DB-level casting errors
-            sections_by_type_map = {}
-            for s in SportSection.objects.filter(is_active=True).select_related(
-                "sport_type"
-            ):
-                key = None
-                try:
-                    key = s.sport_type.slug if s.sport_type else None
-                except Exception:
-                    key = str(s.sport_type) if s.sport_type is not None else None
-                sections_by_type_map[key] = sections_by_type_map.get(key, 0) + 1
-
-            achievements_by_category_map = {}
-            for a in Achievement.objects.filter(is_active=True).select_related(
-                "category"
-            ):
-                key = None
-                try:
-                    key = a.category.slug if a.category else None
-                except Exception:
-                    key = str(a.category) if a.category is not None else None
-                achievements_by_category_map[key] = (
-                    achievements_by_category_map.get(key, 0) + 1
-                )
-
-            sections_by_type = [
-                {"sport_type": k, "count": v} for k, v in sections_by_type_map.items()
-            ]
-            achievements_by_category = [
-                {"category": k, "count": v}
-                for k, v in achievements_by_category_map.items()
-            ]
 
-        return Response(
-            {
-                "total_sections": sections_count,
-                "total_achievements": achievements_count,
-                "sections_by_type": sections_by_type,
-                "achievements_by_category": achievements_by_category,
-            }
-        )
+def compute_sport_statistics():
+    """Totals are derived from the GROUP BY rows: one query per model"""
+    sections_by_type = group_counts(
+        SportSection.objects.filter(is_active=True), "sport_type__slug", "sport_type"
+    )
+    achievements_by_category = group_counts(
+        Achievement.objects.filter(is_active=True), "category__slug", "category"
+    )
+    return {
+        "total_sections": sum(row["count"] for row in sections_by_type),
+        "total_achievements": sum(row["count"] for row in achievements_by_category),
+        "sections_by_type": sections_by_type,
+        "achievements_by_category": achievements_by_category,
+    }
 
 
 class SportTypeListAPIView(generics.ListAPIView):
@@ -266,7 +229,7 @@ class AchievementCategoryListAPIView(APIView):
         )
 
         # Build minimal payload: id, slug, name (localized), icon, order, is_active
-        language = request.query_params.get("language", "ru")
+        language = request_language(request)
         qs = AchievementCategory.objects.filter(is_active=True).order_by(
             "order", "slug"
         )
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.2 on 2026-10-19 16:43
+
+from django.db import migrations, models
+
+
+def fill_excerpts(apps, schema_editor):
+    from ac_back.excerpts import target_fields, update_excerpts
+
+    StudentExchange = apps.get_model("students", "StudentExchange")
+    rows = list(StudentExchange.objects.all())
+    for row in rows:
+        update_excerpts(row)
+    StudentExchange.objects.bulk_update(rows, target_fields(StudentExchange), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_studentinstractions_file_name_en_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentexchange',
+            name='excerpt_en',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='анонс на английском'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='excerpt_kg',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='анонс на кыргызском'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='excerpt_ru',
+            field=models.CharField(blank=True, editable=False, max_length=500, verbose_name='анонс на русском'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='reading_time_en',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='время чтения на английском, мин'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='reading_time_kg',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='время чтения на кыргызском, мин'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='reading_time_ru',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0, editable=False, verbose_name='время чтения на русском, мин'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='word_count_en',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на английском'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='word_count_kg',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на кыргызском'),
+        ),
+        migrations.AddField(
+            model_name='studentexchange',
+            name='word_count_ru',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на русском'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -38,6 +38,17 @@ class StudentExchange(models.Model):
     desc_en = RichTextUploadingField(max_length=1005, verbose_name='описание программы на английском')
     desc_kg = RichTextUploadingField(max_length=1005, verbose_name='описание программы на кыргызском')
 
+    # анонс, число слов и время чтения (заполняются при сохранении)
+    excerpt_ru = models.CharField(max_length=500, blank=True, editable=False, verbose_name='анонс на русском')
+    excerpt_en = models.CharField(max_length=500, blank=True, editable=False, verbose_name='анонс на английском')
+    excerpt_kg = models.CharField(max_length=500, blank=True, editable=False, verbose_name='анонс на кыргызском')
+    word_count_ru = models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на русском')
+    word_count_en = models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на английском')
+    word_count_kg = models.PositiveIntegerField(default=0, editable=False, verbose_name='слов на кыргызском')
+    reading_time_ru = models.PositiveSmallIntegerField(default=0, db_index=True, editable=False, verbose_name='время чтения на русском, мин')
+    reading_time_en = models.PositiveSmallIntegerField(default=0, db_index=True, editable=False, verbose_name='время чтения на английском, мин')
+    reading_time_kg = models.PositiveSmallIntegerField(default=0, db_index=True, editable=False, verbose_name='время чтения на кыргызском, мин')
+
 
     class Meta:
         verbose_name = 'студентеческий обмен'
@@ -1,6 +1,11 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+
+from ac_back.pdf_metadata import PdfInfoField
+from ac_back.pdf_optimization import optimized_url
+from ac_back.rich_text import rich_html
+
 from .models import (
     StudentSupport,
     StudentsCouncil,
@@ -20,7 +25,8 @@ class StudentSupportSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_text(self, obj):
-        text = obj.get_text(lang=self.context.get('language', 'ru'))
+        language = self.context.get('language', 'ru')
+        text = rich_html(obj, f'text_{language}')
         if text:
             return str(text)
         return None
@@ -35,7 +41,8 @@ class StudentsCounseilSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_text(self, obj):
-        text = obj.get_text(lang=self.context.get('language', 'ru'))
+        language = self.context.get('language', 'ru')
+        text = rich_html(obj, f'text_{language}')
         if text:
             return str(text)
         return None
@@ -45,10 +52,13 @@ class StudentExchangeSerializer(serializers.ModelSerializer):
     name = serializers.SerializerMethodField()
     desc = serializers.SerializerMethodField()
     photo = serializers.SerializerMethodField()
+    excerpt = serializers.SerializerMethodField()
+    word_count = serializers.SerializerMethodField()
+    reading_time = serializers.SerializerMethodField()
 
     class Meta:
         model = StudentExchange
-        fields = ['id', 'name', 'desc', 'photo']
+        fields = ['id', 'name', 'desc', 'photo', 'excerpt', 'word_count', 'reading_time']
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_name(self, obj):
@@ -58,6 +68,18 @@ class StudentExchangeSerializer(serializers.ModelSerializer):
     def get_desc(self, obj):
         return obj.get_desc(lang=self.context.get('language', 'ru'))
 
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_excerpt(self, obj):
+        return getattr(obj, f"excerpt_{self.context.get('language', 'ru')}")
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_word_count(self, obj):
+        return getattr(obj, f"word_count_{self.context.get('language', 'ru')}")
+
+    @extend_schema_field(OpenApiTypes.INT)
+    def get_reading_time(self, obj):
+        return getattr(obj, f"reading_time_{self.context.get('language', 'ru')}")
+
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_photo(self, obj):
@@ -69,16 +91,17 @@ class StudentExchangeSerializer(serializers.ModelSerializer):
 class StudentInstractionsSerializer(serializers.ModelSerializer):
     pdf = serializers.SerializerMethodField()
     file_name = serializers.SerializerMethodField()
+    pdf_info = PdfInfoField("pdf")
 
     class Meta:
         model = StudentInstractions
-        fields = ['id', 'pdf', 'file_name']
+        fields = ['id', 'pdf', 'file_name', 'pdf_info']
 
     @extend_schema_field(OpenApiTypes.STR)
     def get_pdf(self, obj):
         pdf_file = obj.get_pdf(lang=self.context.get('language', 'ru'))
         if pdf_file and hasattr(pdf_file, 'url'):
-            return pdf_file.url
+            return optimized_url(pdf_file, self.context)
         return str(pdf_file) if pdf_file else None
 
     
@@ -15,6 +15,7 @@ from .serializers import (
     ScholarshipProgramSerializer,
     ScholarshipRequiredDocumentSerializer,
 )
+from ac_back.localization import request_language
 
 
 class StudentSupportListAPIView(ListAPIView):
@@ -24,7 +25,7 @@ class StudentSupportListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
 
 
@@ -35,7 +36,7 @@ class StudentsCounseilListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
 
 
@@ -46,7 +47,7 @@ class StudentExchangeListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
 
 
@@ -57,7 +58,7 @@ class StudentInstractionsListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
 
 
@@ -68,7 +69,7 @@ class ScholarshipProgramListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context
 
 
@@ -79,5 +80,5 @@ class ScholarshipRequiredDocumentListAPIView(ListAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['language'] = self.request.query_params.get('lang', 'ru')
+        context['language'] = request_language(self.request)
         return context